@@ -2,15 +2,17 @@ import sys
 sys.path.insert(0, '.')
 
 from datetime import date, timedelta
+from itertools import islice
 from typing import Optional, List
 
 from models.food_product import FoodProduct
 from models.electronics_product import ElectronicsProduct
 from models.clothing_product import ClothingProduct
 from models.household_product import HouseholdProduct
-from services.warehouse_service import Warehouse
+from services.persistent_warehouse import PersistentWarehouse
 from services.supplier_service import Supplier
 from services.order_service import Order, OrderStatus
+from services.order_repository import OrderRepository
 from services.report_service import InventoryReport, LowStockReport, SalesReport
 from services.history_service import HistoryService, OperationType
 from services.statistics_service import StatisticsService
@@ -24,11 +26,13 @@ from utils.validators import Validators
 
 class WarehouseApp:
     VERSION = "3.0"
+    PAGE_SIZE = 20
+    SUGGESTION_LIMIT = 10
     
     def __init__(self):
-        self.warehouse = Warehouse("Головний склад", "м. Київ, вул. Складська, 15")
+        self.warehouse = PersistentWarehouse("Головний склад", "м. Київ, вул. Складська, 15")
         self.suppliers: List[Supplier] = []
-        self.orders: List[Order] = []
+        self.orders = OrderRepository(self.warehouse.get_recovered_orders())
         self.history = HistoryService()
         self.statistics = StatisticsService(self.warehouse)
         self.export_service = ExportService()
@@ -37,6 +41,7 @@ class WarehouseApp:
         self.backup_service = BackupService()
         self._init_demo_data()
         self._check_alerts()
+        self.notifications.watch_stock(self.warehouse, 10)
 
     def _init_demo_data(self):
         food1 = FoodProduct(
@@ -163,17 +168,18 @@ class WarehouseApp:
             weight=1.2
         )
 
-        self.warehouse.add_product(food1)
-        self.warehouse.add_product(food2)
-        self.warehouse.add_product(food3)
-        self.warehouse.add_product(electronics1)
-        self.warehouse.add_product(electronics2)
-        self.warehouse.add_product(electronics3)
-        self.warehouse.add_product(clothing1)
-        self.warehouse.add_product(clothing2)
-        self.warehouse.add_product(clothing3)
-        self.warehouse.add_product(household1)
-        self.warehouse.add_product(household2)
+        if not self.warehouse.get_product_count():
+            self.warehouse.add_product(food1)
+            self.warehouse.add_product(food2)
+            self.warehouse.add_product(food3)
+            self.warehouse.add_product(electronics1)
+            self.warehouse.add_product(electronics2)
+            self.warehouse.add_product(electronics3)
+            self.warehouse.add_product(clothing1)
+            self.warehouse.add_product(clothing2)
+            self.warehouse.add_product(clothing3)
+            self.warehouse.add_product(household1)
+            self.warehouse.add_product(household2)
 
         supplier1 = Supplier(
             supplier_id="SUP-001",
@@ -274,7 +280,7 @@ class WarehouseApp:
         Console.clear()
         self._print_logo()
         
-        products_count = len(self.warehouse.get_all_products())
+        products_count = self.warehouse.get_product_count()
         total_value = self.warehouse.get_total_value()
         low_stock = len(self.warehouse.get_low_stock_products(10))
         unread_alerts = self.notifications.get_unread_count()
@@ -341,8 +347,7 @@ class WarehouseApp:
         Console.clear()
         Console.print_header("📋 Всі товари на складі")
         
-        products = self.warehouse.get_all_products()
-        if not products:
+        if not self.warehouse.get_product_count():
             Console.print_warning("Склад порожній")
             Console.pause()
             return
@@ -355,26 +360,43 @@ class WarehouseApp:
         
         choice = Console.input_prompt("Категорія (Enter для всіх)")
         
+        inventory = self.warehouse.inventory_check()
+        cursor = self.warehouse.iter_products()
+        total_count = inventory["загальна_кількість_товарів"]
+        total_qty = inventory["загальна_кількість_одиниць"]
+        total_val = inventory["загальна_вартість"]
         if choice.strip():
             valid, num, _ = Validators.validate_menu_choice(choice, 0, len(categories))
             if valid and num > 0:
-                products = self.warehouse.get_products_by_category(categories[num - 1])
-
-        print()
-        widths = [12, 26, 10, 12, 20]
-        Console.print_table_header(["SKU", "Назва", "Кількість", "Ціна (грн)", "Категорія"], widths)
-        
-        for product in products:
-            qty = product.get_quantity()
-            qty_color = Colors.RED if qty <= 5 else Colors.YELLOW if qty <= 15 else Colors.WHITE
-            print(f"{Colors.WHITE}{product.get_sku():<12}{product.get_name()[:24]:<26}"
-                  f"{qty_color}{qty:<10}{Colors.GREEN}{product.get_price():<12.2f}"
-                  f"{Colors.WHITE}{product.get_category()[:18]:<20}{Colors.ENDC}")
+                category = categories[num - 1]
+                cursor = iter(self.warehouse.get_products_by_category(category))
+                totals = inventory["категорії"][category]
+                total_count = totals["кількість_товарів"]
+                total_qty = totals["кількість_одиниць"]
+                total_val = totals["вартість"]
+
+        offset = 0
+        while True:
+            products = list(islice(cursor, self.PAGE_SIZE))
+            print()
+            widths = [12, 26, 10, 12, 20]
+            Console.print_table_header(["SKU", "Назва", "Кількість", "Ціна (грн)", "Категорія"], widths)
+            
+            for product in products:
+                qty = product.get_quantity()
+                qty_color = Colors.RED if qty <= 5 else Colors.YELLOW if qty <= 15 else Colors.WHITE
+                print(f"{Colors.WHITE}{product.get_sku():<12}{product.get_name()[:24]:<26}"
+                      f"{qty_color}{qty:<10}{Colors.GREEN}{product.get_price():<12.2f}"
+                      f"{Colors.WHITE}{product.get_category()[:18]:<20}{Colors.ENDC}")
+
+            offset += len(products)
+            print()
+            Console.print_info(f"Показано товарів: {offset} з {total_count}")
+            if offset >= total_count or not products:
+                break
+            if Console.input_prompt("Enter - наступна сторінка, 0 - завершити перегляд").strip() == "0":
+                break
 
-        print()
-        total_qty = sum(p.get_quantity() for p in products)
-        total_val = sum(p.get_price() * p.get_quantity() for p in products)
-        Console.print_info(f"Показано товарів: {len(products)}")
         Console.print_info(f"Загальна кількість одиниць: {total_qty}")
         Console.print_info(f"Загальна вартість: {total_val:,.2f} грн.")
         Console.pause()
@@ -402,6 +424,12 @@ class WarehouseApp:
             
             if not results:
                 Console.print_warning(f"Товари за запитом '{keyword}' не знайдено")
+                similar = self.warehouse.fuzzy_search_products(keyword)
+                if similar:
+                    print()
+                    Console.print_info("Можливо, ви шукали:")
+                    for product in similar:
+                        Console.print_item(str(product))
             else:
                 Console.print_success(f"Знайдено товарів: {len(results)}")
                 print()
@@ -409,8 +437,7 @@ class WarehouseApp:
                     Console.print_item(str(product))
         
         elif choice == "2":
-            sku = Console.input_prompt("Введіть SKU")
-            product = self.warehouse.get_product(sku.upper())
+            product = self._pick_product("Введіть SKU або його початок")
             if product:
                 Console.print_success("Товар знайдено:")
                 print()
@@ -420,8 +447,6 @@ class WarehouseApp:
                 Console.print_item(f"Кількість: {product.get_quantity()}")
                 Console.print_item(f"Ціна: {product.get_price():.2f} грн.")
                 Console.print_item(f"Опис: {product.get_description()}")
-            else:
-                Console.print_error(f"Товар з SKU '{sku}' не знайдено")
         
         elif choice == "3":
             threshold_str = Console.input_prompt("Поріг низького запасу (за замовчуванням 10)")
@@ -443,6 +468,38 @@ class WarehouseApp:
         
         Console.pause()
 
+    def _pick_product(self, prompt: str):
+        sku = Console.input_prompt(prompt).strip().upper()
+        if not sku:
+            Console.print_error("Введіть SKU")
+            return None
+        product = self.warehouse.get_product(sku)
+        if product:
+            return product
+        
+        suggestions = self.warehouse.get_products_by_sku_prefix(sku, self.SUGGESTION_LIMIT + 1)
+        if not suggestions:
+            Console.print_error(f"Товар з SKU '{sku}' не знайдено")
+            return None
+        if len(suggestions) == 1:
+            Console.print_info(f"Знайдено за початком SKU: {suggestions[0].get_sku()}")
+            return suggestions[0]
+        
+        print(f"\n{Colors.CYAN}  Товари, SKU яких починається з '{sku}':{Colors.ENDC}")
+        for i, suggestion in enumerate(suggestions[:self.SUGGESTION_LIMIT], 1):
+            Console.print_menu_item(i, f"{suggestion.get_sku()} - {suggestion.get_name()} ({suggestion.get_quantity()} од.)")
+        if len(suggestions) > self.SUGGESTION_LIMIT:
+            Console.print_info(f"Показано перші {self.SUGGESTION_LIMIT}, уточніть SKU для інших")
+        
+        choice = Console.input_prompt("Номер товару (Enter для скасування)")
+        if not choice.strip():
+            return None
+        valid, num, error = Validators.validate_menu_choice(choice, 1, min(len(suggestions), self.SUGGESTION_LIMIT))
+        if not valid:
+            Console.print_error(error)
+            return None
+        return suggestions[num - 1]
+
     def _add_product(self):
         Console.clear()
         Console.print_header("➕ Додавання нового товару")
@@ -637,10 +694,8 @@ class WarehouseApp:
                     continue
                 break
             elif choice == "1":
-                sku = Console.input_prompt("SKU товару")
-                product = self.warehouse.get_product(sku.upper())
+                product = self._pick_product("SKU товару або його початок")
                 if not product:
-                    Console.print_error(f"Товар з SKU '{sku}' не знайдено")
                     continue
                 
                 Console.print_info(f"Товар: {product.get_name()} - {product.get_price():.2f} грн.")
@@ -656,7 +711,7 @@ class WarehouseApp:
                     Console.print_error("Недостатня кількість на складі")
                     continue
                     
-                order.add_item(sku.upper(), qty)
+                order.add_item(product.get_sku(), qty)
                 Console.print_success(f"Додано: {product.get_name()} x {qty}")
             
             elif choice == "2":
@@ -674,7 +729,7 @@ class WarehouseApp:
         print()
         Console.print_subheader("Підтвердження замовлення")
         Console.print_info(f"Номер замовлення: {order.get_order_id()}")
-        Console.print_info(f"Кількість позицій: {len(order.get_items())}")
+        Console.print_info(f"Кількість позицій: {order.get_item_count()}")
         Console.print_info(f"Загальна сума: {order.get_total_amount():.2f} грн.")
         
         confirm = Console.input_prompt("Підтвердити замовлення? (так/ні)")
@@ -685,7 +740,8 @@ class WarehouseApp:
 
         if order.process_order(self.warehouse):
             order.set_status(OrderStatus.PROCESSING)
-            self.orders.append(order)
+            self.orders.add(order)
+            self.warehouse.record_order(order)
             self.history.add_record(
                 OperationType.ORDER_CREATED,
                 f"Створено замовлення #{order.get_order_id()}",
@@ -703,29 +759,45 @@ class WarehouseApp:
         Console.clear()
         Console.print_header("📑 Замовлення")
         
-        if not self.orders:
+        if not self.orders.get_count():
             Console.print_warning("Список замовлень порожній")
             Console.pause()
             return
 
-        widths = [12, 20, 18, 15]
+        widths = [18, 20, 18, 15]
         Console.print_table_header(["№ Замовлення", "Дата", "Статус", "Сума (грн)"], widths)
         
-        for order in self.orders:
+        for order in self.orders.iter_orders():
             status = order.get_status()
             status_color = Colors.GREEN if status == OrderStatus.DELIVERED else \
                           Colors.YELLOW if status == OrderStatus.PROCESSING else \
                           Colors.RED if status == OrderStatus.CANCELLED else Colors.WHITE
             
-            print(f"{Colors.WHITE}{order.get_order_id():<12}"
+            print(f"{Colors.WHITE}{order.get_order_id():<18}"
                   f"{order.get_created_date().strftime('%d.%m.%Y %H:%M'):<20}"
                   f"{status_color}{status:<18}{Colors.ENDC}"
                   f"{Colors.GREEN}{order.get_total_amount():<15.2f}{Colors.ENDC}")
 
         print()
-        total_revenue = sum(o.get_total_amount() for o in self.orders)
-        Console.print_info(f"Всього замовлень: {len(self.orders)}")
+        total_revenue = self.orders.get_total_amount()
+        Console.print_info(f"Всього замовлень: {self.orders.get_count()}")
         Console.print_info(f"Загальний дохід: {total_revenue:,.2f} грн.")
+
+        order_id = Console.input_prompt("Номер замовлення для перегляду (Enter - назад)").strip().upper()
+        if not order_id:
+            return
+        order = self.orders.get(order_id)
+        if order is None:
+            Console.print_error(f"Замовлення #{order_id} не знайдено")
+        else:
+            print()
+            Console.print_subheader(f"Замовлення #{order.get_order_id()}")
+            Console.print_info(f"Статус: {order.get_status()}")
+            Console.print_info(f"Дата: {order.get_created_date().strftime('%d.%m.%Y %H:%M')}")
+            for sku, qty in order.get_items():
+                product = self.warehouse.get_product(sku)
+                Console.print_item(f"{product.get_name() if product else sku} x {qty}")
+            Console.print_info(f"Сума: {order.get_total_amount():.2f} грн.")
         Console.pause()
 
     def _view_suppliers(self):
@@ -1172,7 +1244,7 @@ class WarehouseApp:
             filepath = self.backup_service.create_backup(
                 self.warehouse, 
                 self.suppliers, 
-                self.orders
+                self.orders.get_all()
             )
             Console.print_success(f"Резервну копію створено: {filepath}")
             self.history.add_record(
@@ -1253,15 +1325,19 @@ class WarehouseApp:
             Console.print_success("✓ Моделі товарів ініціалізовано")
             Console.print_success("✓ Сервіси запущено")
             Console.print_success("✓ Утиліти доступні")
-            Console.print_success("✓ База даних (в пам'яті) працює")
+            Console.print_success(f"✓ Сховище {type(self.warehouse).__name__} працює")
+            changes = self.warehouse.get_change_stream()
+            if changes.get_errors():
+                Console.print_warning(f"Помилок у підписниках змін: {changes.get_errors()} "
+                                      f"(остання: {changes.get_last_error()!r})")
             print()
             Console.print_success("Система працює коректно!")
         
         elif choice == "2":
             import sys
-            products_count = len(self.warehouse.get_all_products())
+            products_count = self.warehouse.get_product_count()
             suppliers_count = len(self.suppliers)
-            orders_count = len(self.orders)
+            orders_count = self.orders.get_count()
             history_count = self.history.get_records_count()
             alerts_count = len(self.notifications.get_all_alerts())
             
@@ -1286,6 +1362,7 @@ class WarehouseApp:
 
     def _exit_app(self):
         Console.clear()
+        self.warehouse.close()
         
         summary = self.statistics.get_summary()
         history_count = self.history.get_records_count()
@@ -0,0 +1,35 @@
+import sys
+import time
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.product_query import Eq, In, Range
+
+
+QUERIES = [
+    ("бренд Apple, гарантія 24+ міс.", Eq("brand", "Apple") & Range("warranty_months", 24)),
+    ("S/M, чорний, жіночий", In("size", ["S", "M"]) & Eq("color", "Чорний") & Eq("gender", "Жіночий")),
+    ("органічні або кухня", Eq("is_organic", True) | Eq("room_type", "Кухня")),
+    ("ціна 1000..1100, запас < 20", Range("price", 1000, 1100) & Range("quantity", None, 19)),
+]
+
+
+def run(products: int) -> None:
+    warehouse = Warehouse("Атрибути", "-")
+    warehouse.add_many(generate_products(products))
+    print(f"\n{products} товарів")
+    for label, condition in QUERIES:
+        scan = timed(lambda: [p for p in warehouse.iter_products() if condition.matches(p)])
+        start = time.perf_counter()
+        warehouse.find_products(condition)
+        cold = time.perf_counter() - start
+        warm = timed(lambda: warehouse.find_products(condition), 5)
+        found = len(warehouse.find_products(condition))
+        assert found == len([p for p in warehouse.iter_products() if condition.matches(p)])
+        print(f"  {label:<32}{found:>7} шт.   перебір {scan * 1000:>8.2f} мс   перший запит {cold * 1000:>8.2f} мс"
+              f"   з індексами {warm * 1000:>7.2f} мс")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 500_000]):
+        run(size)
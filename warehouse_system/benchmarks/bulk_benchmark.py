@@ -0,0 +1,34 @@
+import sys
+import random
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+
+
+def run(lines: int) -> None:
+    one_by_one = Warehouse("Поштучно", "-")
+    batched = Warehouse("Пакетно", "-")
+    add_time = timed(lambda: [one_by_one.add_product(p) for p in generate_products(lines)])
+    add_many_time = timed(lambda: batched.add_many(generate_products(lines)))
+
+    rng = random.Random(7)
+    skus = [p.get_sku() for p in one_by_one.get_all_products()]
+    receipt = [(rng.choice(skus), rng.randrange(1, 100)) for _ in range(lines)]
+    receive_time = timed(lambda: [one_by_one.receive_product(sku, quantity) for sku, quantity in receipt])
+    receive_many_time = timed(lambda: batched.receive_many(receipt))
+    shipment = [(sku, quantity // 2) for sku, quantity in receipt]
+    issue_time = timed(lambda: [one_by_one.issue_product(sku, quantity) for sku, quantity in shipment])
+    issue_many_time = timed(lambda: batched.issue_many(shipment))
+    assert one_by_one.get_total_units() == batched.get_total_units()
+
+    print(f"\n{lines} рядків")
+    for label, single, batch in (("додавання", add_time, add_many_time),
+                                 ("надходження", receive_time, receive_many_time),
+                                 ("видача", issue_time, issue_many_time)):
+        print(f"  {label:<14}поштучно {single * 1000:>9.2f} мс   пакетом {batch * 1000:>9.2f} мс"
+              f"   ({single / batch:.2f}x)")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 50_000]):
+        run(size)
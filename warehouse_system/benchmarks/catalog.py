@@ -0,0 +1,82 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import random
+import time
+from datetime import date, timedelta
+from typing import Iterator, List
+
+from interfaces.product_interface import IProduct
+from models.food_product import FoodProduct
+from models.electronics_product import ElectronicsProduct
+from models.clothing_product import ClothingProduct
+from models.household_product import HouseholdProduct
+
+
+FOOD_WORDS = ["Молоко", "Хліб", "Сир", "Масло", "Кефір", "Йогурт", "Ковбаса", "Гречка", "Рис", "Кава"]
+ELECTRONICS_WORDS = ["Смартфон", "Ноутбук", "Навушники", "Планшет", "Монітор", "Клавіатура", "Мишка", "Колонка"]
+CLOTHING_WORDS = ["Футболка", "Джинси", "Куртка", "Светр", "Сорочка", "Шорти", "Пальто", "Сукня"]
+HOUSEHOLD_WORDS = ["Стілець", "Лампа", "Стіл", "Полиця", "Килим", "Дзеркало", "Шафа", "Крісло"]
+ADJECTIVES = ["органічний", "класичний", "зимовий", "сучасний", "базовий", "преміум", "легкий", "теплий",
+              "офісний", "домашній", "спортивний", "дитячий"]
+BRANDS = ["Samsung", "Lenovo", "Apple", "Xiaomi", "Sony", "Philips", "Asus", "Acer"]
+COLORS = ["Чорний", "Білий", "Синій", "Червоний", "Зелений", "Сірий"]
+MATERIALS = ["Бавовна", "Денім", "Поліестер", "Вовна", "Льон"]
+SIZES = ["XS", "S", "M", "L", "XL", "32", "34"]
+GENDERS = ["Чоловічий", "Жіночий", "Унісекс"]
+ROOMS = ["Офіс", "Кабінет", "Кухня", "Спальня", "Вітальня"]
+
+
+def generate_products(count: int, seed: int = 42) -> Iterator[IProduct]:
+    rng = random.Random(seed)
+    today = date.today()
+    for i in range(count):
+        kind = i % 4
+        adjective = rng.choice(ADJECTIVES)
+        serial = rng.randrange(100000)
+        price = round(rng.uniform(10, 50000), 2)
+        quantity = rng.randrange(1, 500)
+        if kind == 0:
+            word = rng.choice(FOOD_WORDS)
+            yield FoodProduct(f"FOOD-{i:07d}", f"{word} {adjective} {serial}", price, quantity,
+                              f"{word} {adjective} від постачальника {serial % 97}",
+                              today + timedelta(days=rng.randrange(-5, 60)), round(rng.uniform(0.1, 5), 2),
+                              rng.random() < 0.3)
+        elif kind == 1:
+            word = rng.choice(ELECTRONICS_WORDS)
+            brand = rng.choice(BRANDS)
+            yield ElectronicsProduct(f"ELEC-{i:07d}", f"{word} {brand} {serial}", price, quantity,
+                                     f"{word} {brand} {adjective}", brand, rng.choice([6, 12, 24, 36]),
+                                     round(rng.uniform(0.5, 300), 1))
+        elif kind == 2:
+            word = rng.choice(CLOTHING_WORDS)
+            yield ClothingProduct(f"CLOTH-{i:07d}", f"{word} {adjective} {serial}", price, quantity,
+                                  f"{word} {adjective} з колекції {serial % 53}", rng.choice(SIZES),
+                                  rng.choice(COLORS), rng.choice(MATERIALS), rng.choice(GENDERS))
+        else:
+            word = rng.choice(HOUSEHOLD_WORDS)
+            size = rng.randrange(10, 200)
+            yield HouseholdProduct(f"HOUSE-{i:07d}", f"{word} {adjective} {serial}", price, quantity,
+                                   f"{word} {adjective} для дому", rng.choice(ROOMS),
+                                   {"width": size, "height": size * 2, "depth": size}, round(rng.uniform(0.5, 40), 1))
+
+
+def timed(func, repeat: int = 1) -> float:
+    best = float("inf")
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best
+
+
+def parse_sizes(argv: List[str], default: List[int]) -> List[int]:
+    return [int(arg) for arg in argv] if argv else default
@@ -0,0 +1,94 @@
+import sys
+import time
+import random
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.statistics_service import StatisticsService
+from services.change_stream import ChangeType
+
+
+def health_bucket(quantity: int) -> str:
+    if quantity <= 5:
+        return "критично_низький"
+    if quantity <= 15:
+        return "низький"
+    if quantity <= 50:
+        return "нормальний"
+    return "високий"
+
+
+def build(products: int) -> Warehouse:
+    warehouse = Warehouse("Події", "-")
+    warehouse.add_many(generate_products(products))
+    return warehouse
+
+
+def operations(warehouse: Warehouse, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    skus = [p.get_sku() for p in warehouse.page(0, 5000)]
+    return [(rng.choice(skus), rng.randrange(1, 5)) for _ in range(count)]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(products: int, ops: int = 50_000) -> None:
+    print(f"\n{products} товарів, {ops} операцій приймання")
+
+    def receive_all(warehouse: Warehouse, items: list):
+        return lambda: [warehouse.receive_product(sku, quantity) for sku, quantity in items]
+
+    warehouse = build(products)
+    items = operations(warehouse, ops)
+    baseline = timed(receive_all(warehouse, items))
+    print(f"  без підписників        {baseline / ops * 1e6:>8.2f} мкс/оп")
+
+    sync_latencies = []
+    warehouse.get_change_stream().subscribe(
+        lambda event: sync_latencies.append(time.perf_counter() - event.get_timestamp()))
+    sync_time = timed(receive_all(warehouse, items))
+    print(f"  синхронний підписник   {sync_time / ops * 1e6:>8.2f} мкс/оп"
+          f"   затримка p50 {percentile(sync_latencies, 0.5) * 1e6:.2f} мкс"
+          f"   p99 {percentile(sync_latencies, 0.99) * 1e6:.2f} мкс")
+
+    warehouse = build(products)
+    queued_latencies = []
+    subscriber = warehouse.get_change_stream().subscribe_queued(
+        lambda event: queued_latencies.append(time.perf_counter() - event.get_timestamp()))
+    start = time.perf_counter()
+    for sku, quantity in items:
+        warehouse.receive_product(sku, quantity)
+    produced = time.perf_counter() - start
+    subscriber.wait_for(warehouse.get_change_stream().get_version())
+    drained = time.perf_counter() - start
+    warehouse.get_change_stream().unsubscribe_queued(subscriber)
+    print(f"  черговий підписник     {produced / ops * 1e6:>8.2f} мкс/оп"
+          f"   затримка p50 {percentile(queued_latencies, 0.5) * 1000:.2f} мс"
+          f"   p99 {percentile(queued_latencies, 0.99) * 1000:.2f} мс   спорожнено за {drained * 1000:.0f} мс")
+
+    warehouse = build(products)
+    statistics = StatisticsService(warehouse)
+    health = statistics.get_stock_health()
+
+    def on_change(event):
+        if event.get_change_type() is ChangeType.QUANTITY_CHANGED:
+            health[health_bucket(event.get_before())] -= 1
+            health[health_bucket(event.get_after())] += 1
+
+    warehouse.get_change_stream().subscribe(on_change)
+    refreshes = items[:200]
+    rescan = timed(lambda: [(warehouse.receive_product(sku, quantity), statistics.get_stock_health())
+                            for sku, quantity in refreshes])
+    incremental = timed(lambda: [(warehouse.receive_product(sku, quantity), dict(health))
+                                 for sku, quantity in refreshes])
+    assert health == statistics.get_stock_health()
+    print(f"  стан запасів після кожної зміни: перерахунок {rescan / len(refreshes) * 1000:>8.2f} мс"
+          f"   інкрементально {incremental / len(refreshes) * 1e6:>6.2f} мкс")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 500_000]):
+        run(size)
@@ -0,0 +1,61 @@
+import os
+import sys
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.mapped_warehouse import MappedWarehouse
+from services.warehouse_cluster import WarehouseCluster
+
+
+SHARDS = 4
+
+
+def dashboard(warehouse) -> tuple:
+    return (warehouse.get_total_value(), warehouse.inventory_check()["загальна_кількість_одиниць"],
+            len(warehouse.get_low_stock_products(20)))
+
+
+def build_shards(size: int, directory: str):
+    shards = [Warehouse(f"Склад {i + 1}", "-") for i in range(SHARDS)]
+    routing = WarehouseCluster("Маршрутизація", "-", shards)
+    for product in generate_products(size):
+        routing.add_product(product)
+    routing.close()
+    mapped = [MappedWarehouse(MappedWarehouse.build(os.path.join(directory, f"shard-{i}.whm"), shard))
+              for i, shard in enumerate(shards)]
+    return shards, mapped
+
+
+def run(size: int) -> None:
+    directory = tempfile.mkdtemp(prefix="cluster-bench-")
+    try:
+        shards, mapped = build_shards(size, directory)
+        single = Warehouse("Один склад", "-")
+        single.add_many(generate_products(size))
+        expected = dashboard(single)
+        print(f"\n{size} товарів, {SHARDS} шарди, ядер: {os.cpu_count()}")
+        print(f"  {'конфігурація':<44}{'панель, мс':>12}")
+        print(f"  {'один Warehouse':<44}{timed(lambda: dashboard(single), repeat=3) * 1000:>12.1f}")
+        configurations = (
+            ("Warehouse-шарди, потоки", shards, ThreadPoolExecutor(SHARDS)),
+            ("MappedWarehouse-шарди, потоки", mapped, ThreadPoolExecutor(SHARDS)),
+            ("MappedWarehouse-шарди, процеси", mapped, ProcessPoolExecutor(SHARDS)),
+        )
+        for name, members, executor in configurations:
+            with executor:
+                cluster = WarehouseCluster("Кластер", "-", members, executor)
+                result = dashboard(cluster)
+                assert abs(result[0] - expected[0]) < 1e-6 * expected[0] and result[1:] == expected[1:]
+                print(f"  {name:<44}{timed(lambda: dashboard(cluster), repeat=3) * 1000:>12.1f}")
+        for shard in mapped:
+            shard.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 400_000]):
+        run(size)
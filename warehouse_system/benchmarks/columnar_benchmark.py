@@ -0,0 +1,39 @@
+import sys
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.columnar_warehouse import ColumnarWarehouse
+from services.statistics_service import StatisticsService
+
+
+def object_scan_value(warehouse) -> float:
+    return sum(p.get_price() * p.get_quantity() for p in warehouse.get_all_products())
+
+
+def run(size: int) -> None:
+    objects = Warehouse("Об'єкти", "-")
+    columns = ColumnarWarehouse("Колонки", "-")
+    for product in generate_products(size):
+        objects.add_product(product)
+    for product in generate_products(size):
+        columns.add_product(product)
+    assert abs(object_scan_value(objects) - columns.get_total_value()) < 1e-6 * columns.get_total_value()
+    assert {p.get_sku() for p in objects.get_low_stock_products(50)} == \
+           {p.get_sku() for p in columns.get_low_stock_products(50)}
+
+    cases = [
+        ("вартість (скан об'єктів)", lambda: object_scan_value(objects)),
+        ("вартість (колонки)", columns.get_total_value),
+        ("інвентаризація (колонки)", columns.inventory_check),
+        ("низький запас <50 (колонки)", lambda: columns.get_low_stock_products(50)),
+        ("категорія (колонки)", lambda: columns.get_products_by_category("Одяг")),
+        ("зведення статистики (колонки)", StatisticsService(columns).get_summary),
+    ]
+    print(f"\n{size} товарів")
+    for label, func in cases:
+        print(f"  {label:<32}{timed(func, repeat=3) * 1000:>10.2f} мс")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 100_000, 1_000_000]):
+        run(size)
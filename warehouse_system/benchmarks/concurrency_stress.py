@@ -0,0 +1,62 @@
+import sys
+import random
+import threading
+import time
+from catalog import parse_sizes
+
+from models.base_product import BaseProduct
+from services.warehouse_service import Warehouse
+from services.concurrent_warehouse import ConcurrentWarehouse
+
+
+INITIAL_QUANTITY = 1_000_000
+
+
+def hammer(warehouse, skus, operations: int, seed: int, deltas: dict, errors: list) -> None:
+    rng = random.Random(seed)
+    for _ in range(operations):
+        sku = rng.choice(skus)
+        quantity = rng.randrange(1, 10)
+        try:
+            if rng.random() < 0.5:
+                if warehouse.issue_product(sku, quantity):
+                    deltas[sku] = deltas.get(sku, 0) - quantity
+            elif warehouse.receive_product(sku, quantity):
+                deltas[sku] = deltas.get(sku, 0) + quantity
+        except Exception as error:
+            errors.append(error)
+
+
+def run(warehouse, threads: int, sku_count: int, operations: int) -> int:
+    skus = [f"SKU-{i:04d}" for i in range(sku_count)]
+    for sku in skus:
+        warehouse.add_product(BaseProduct(sku, sku, 1.0, INITIAL_QUANTITY, "Стрес", ""))
+    thread_deltas = [{} for _ in range(threads)]
+    errors = []
+    workers = [threading.Thread(target=hammer,
+                                args=(warehouse, skus, operations, seed, thread_deltas[seed], errors))
+               for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    lost = 0
+    for sku in skus:
+        expected = INITIAL_QUANTITY + sum(deltas.get(sku, 0) for deltas in thread_deltas)
+        lost += abs(warehouse.get_product(sku).get_quantity() - expected)
+    totals_ok = warehouse.verify_totals()
+    print(f"  {type(warehouse).__name__:<22}{elapsed:>8.2f} с   втрачено одиниць: {lost:<8}"
+          f"помилок: {len(errors):<8}агрегати {'узгоджені' if totals_ok else 'РОЗІЙШЛИСЯ'}")
+    return lost + len(errors) + (0 if totals_ok else 1)
+
+
+if __name__ == "__main__":
+    threads, sku_count, operations = (parse_sizes(sys.argv[1:], [16, 32, 20_000]) + [16, 32, 20_000])[:3]
+    sys.setswitchinterval(1e-6)
+    print(f"{threads} потоків x {operations} операцій на {sku_count} SKU")
+    run(Warehouse("Без блокувань", "-"), threads, sku_count, operations)
+    if run(ConcurrentWarehouse("Смугасті блокування", "-"), threads, sku_count, operations):
+        sys.exit(1)
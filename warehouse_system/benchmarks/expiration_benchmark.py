@@ -0,0 +1,30 @@
+import sys
+from datetime import date, timedelta
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+
+
+def run(products: int) -> None:
+    warehouse = Warehouse("Терміни", "-")
+    warehouse.add_many(generate_products(products))
+    until = date.today() + timedelta(days=7)
+
+    def scan():
+        return [p for p in warehouse.iter_products()
+                if hasattr(p, 'get_expiration_date') and p.get_expiration_date() <= until]
+
+    def indexed():
+        return warehouse.get_expiring_products(until)
+
+    assert sorted(p.get_sku() for p in scan()) == sorted(p.get_sku() for p in indexed())
+    scan_time = timed(scan, 3)
+    indexed_time = timed(indexed, 3)
+    print(f"\n{products} товарів, {len(indexed())} спливають протягом 7 днів")
+    print(f"  перебір з hasattr {scan_time * 1000:>9.2f} мс   індекс термінів {indexed_time * 1000:>8.2f} мс"
+          f"   ({scan_time / indexed_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 500_000]):
+        run(size)
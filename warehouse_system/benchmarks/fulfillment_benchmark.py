@@ -0,0 +1,57 @@
+import sys
+import random
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.order_service import Order
+from services.fulfillment_service import FulfillmentEngine, FifoPolicy, PriorityPolicy, FillRatePolicy
+
+
+SKU_COUNT = 20_000
+DEMAND_FACTOR = 1.5
+
+
+def build(orders: int, seed: int = 11):
+    rng = random.Random(seed)
+    products = list(generate_products(SKU_COUNT))
+    skus = [product.get_sku() for product in products]
+    order_list = []
+    demand = dict.fromkeys(skus, 0)
+    for i in range(orders):
+        order = Order(f"B{i:07d}", rng.randrange(5))
+        for sku in rng.sample(skus, rng.randrange(1, 9)):
+            quantity = rng.randrange(1, 6)
+            order.add_item(sku, quantity)
+            demand[sku] += quantity
+        order_list.append(order)
+    for product in products:
+        product.set_quantity(int(demand[product.get_sku()] / DEMAND_FACTOR))
+    warehouse = Warehouse("Нічна партія", "-")
+    warehouse.add_many(product for product in products if product.get_quantity() > 0)
+    return warehouse, order_list
+
+
+def run(orders: int) -> None:
+    print(f"\n{orders} замовлень на {SKU_COUNT} SKU, попит у {DEMAND_FACTOR}x перевищує запас")
+    warehouse, order_list = build(orders)
+    lines = sum(order.get_item_count() for order in order_list)
+    elapsed = timed(lambda: [order.process_order(warehouse) for order in order_list])
+    filled = sum(1 for order in order_list if order.get_status() != "Очікує")
+    print(f"  process_order по одному       {elapsed:>7.2f} с   виконано повністю {filled / orders:>6.1%}"
+          f"   часткових: -      ({lines} рядків)")
+    for name, policy, partial in (("FIFO, лише повні", FifoPolicy(), False),
+                                  ("FIFO, часткові", FifoPolicy(), True),
+                                  ("пріоритет, часткові", PriorityPolicy(), True),
+                                  ("макс. виконання, повні", FillRatePolicy(), False)):
+        warehouse, order_list = build(orders)
+        engine = FulfillmentEngine(warehouse, policy, partial)
+        result = engine.run(order_list)
+        summary = result.get_summary()
+        assert warehouse.verify_totals()
+        print(f"  {name:<29} {result.get_elapsed():>7.2f} с   виконано повністю {result.get_order_fill_rate():>6.1%}"
+              f"   одиниць {result.get_fill_rate():>6.1%}   дозамовлень {summary['дозамовлень']}")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 100_000]):
+        run(size)
@@ -0,0 +1,48 @@
+import sys
+import time
+import random
+from catalog import generate_products, parse_sizes
+
+from services.warehouse_service import Warehouse
+
+
+def typo(word: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(word) - 1)
+    kind = rng.randrange(3)
+    if kind == 0:
+        return word[:position] + word[position + 1:]
+    if kind == 1:
+        return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+    return word[:position] + rng.choice("аеиоу") + word[position + 1:]
+
+
+def percentile(values: list, share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+def run(products: int, queries: int = 200) -> None:
+    warehouse = Warehouse("Нечіткий пошук", "-")
+    warehouse.add_many(generate_products(products))
+    rng = random.Random(13)
+    names = [product.get_name() for product in warehouse.page(0, 5000)]
+    latencies = []
+    hits = 0
+    for _ in range(queries):
+        words = rng.choice(names).split()[:2]
+        query = " ".join(typo(word, rng) if len(word) > 4 else word for word in words)
+        start = time.perf_counter()
+        results = warehouse.fuzzy_search_products(query)
+        latencies.append(time.perf_counter() - start)
+        if results and all(word.lower() in results[0].get_name().lower() for word in words):
+            hits += 1
+
+    print(f"\n{products} товарів, {queries} запитів з одруківкою")
+    print(f"  p50 {percentile(latencies, 0.5) * 1000:>8.2f} мс   p99 {percentile(latencies, 0.99) * 1000:>8.2f} мс"
+          f"   максимум {max(latencies) * 1000:>8.2f} мс")
+    print(f"  перший результат містить задумані слова: {hits / queries:.0%}")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [500_000]):
+        run(size)
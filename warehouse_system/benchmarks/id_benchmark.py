@@ -0,0 +1,71 @@
+import sys
+import uuid
+import threading
+from datetime import datetime
+from multiprocessing import Pool
+from catalog import timed, parse_sizes
+
+from utils.id_generator import IdGenerator, next_id, next_ids
+
+
+THREADS = 4
+PROCESSES = 4
+
+
+def uuid_prefix() -> str:
+    return str(uuid.uuid4())[:8].upper()
+
+
+def timestamp_id() -> str:
+    return datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+
+def generate(count: int) -> list:
+    return [next_id() for _ in range(count)]
+
+
+def check_threads(count: int) -> str:
+    results = [[] for _ in range(THREADS)]
+    with IdGenerator() as generator:
+        def work(target: list) -> None:
+            target.extend(generator.next_int() for _ in range(count // THREADS))
+
+        threads = [threading.Thread(target=work, args=(results[i],)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    merged = [identifier for result in results for identifier in result]
+    monotonic = all(all(a < b for a, b in zip(result, result[1:])) for result in results)
+    return f"{len(merged) - len(set(merged))} колізій, монотонні: {'так' if monotonic else 'ні'}"
+
+
+def check_processes(count: int) -> str:
+    with Pool(PROCESSES) as pool:
+        chunks = pool.map(generate, [count // PROCESSES] * PROCESSES)
+    merged = [identifier for chunk in chunks for identifier in chunk]
+    return f"{len(merged) - len(set(merged))} колізій"
+
+
+def run(count: int) -> None:
+    print(f"\n{count} ідентифікаторів")
+    print(f"  {'спосіб':<28}{'ІД/с':>14}{'колізій':>10}")
+    for name, func in (("uuid4()[:8]", uuid_prefix),
+                       ("strftime до мікросекунд", timestamp_id),
+                       ("IdGenerator.next_id", next_id)):
+        produced = []
+        elapsed = timed(lambda: produced.append([func() for _ in range(count)]))
+        identifiers = produced[-1]
+        print(f"  {name:<28}{count / elapsed:>14,.0f}{len(identifiers) - len(set(identifiers)):>10}")
+    produced = []
+    elapsed = timed(lambda: produced.append(next_ids(count)))
+    identifiers = produced[-1]
+    assert identifiers == sorted(identifiers)
+    print(f"  {'IdGenerator.next_ids':<28}{count / elapsed:>14,.0f}{len(identifiers) - len(set(identifiers)):>10}")
+    print(f"  {THREADS} потоки: {check_threads(count)}")
+    print(f"  {PROCESSES} процеси: {check_processes(count)}")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 1_000_000]):
+        run(size)
@@ -0,0 +1,91 @@
+import sys
+import time
+import random
+import asyncio
+from typing import List, Optional
+from catalog import generate_products, parse_sizes
+
+from services.concurrent_warehouse import ConcurrentWarehouse
+from services.order_service import Order
+from services.order_repository import OrderRepository
+from services.pricing_service import PricingService
+from services.history_service import HistoryService
+from services.intake_pipeline import IntakePipeline
+
+
+SKU_COUNT = 20_000
+RATES = (2_000, 5_000, None)
+CONFIGURATIONS = (
+    ("1/1/1/1, черга 100", {}, 100),
+    ("1/1/2/1, черга 1000", {"price": 2}, 1000),
+)
+
+
+def build_orders(count: int, skus: List[str], seed: int = 21) -> List[Order]:
+    rng = random.Random(seed)
+    orders = []
+    for i in range(count):
+        order = Order(f"IN{i:07d}")
+        for sku in rng.sample(skus, rng.randrange(1, 6)):
+            order.add_item(sku, rng.randrange(1, 4))
+        if rng.random() < 0.02:
+            order.add_item("НЕМАЄ-0000000", 1)
+        elif rng.random() < 0.02:
+            order.add_item(rng.choice(skus), 10_000)
+        orders.append(order)
+    return orders
+
+
+async def generate_load(pipeline: IntakePipeline, orders: List[Order], rate: Optional[int]) -> None:
+    await pipeline.start()
+    tickets = []
+    start = time.perf_counter()
+    for i, order in enumerate(orders):
+        if rate is not None:
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif i % 64 == 0:
+            await asyncio.sleep(0)
+        tickets.append(await pipeline.submit(order, "BULK10" if i % 10 == 0 else None))
+    await asyncio.gather(*(ticket.wait() for ticket in tickets))
+    await pipeline.close()
+
+
+def build_warehouse(count: int) -> ConcurrentWarehouse:
+    warehouse = ConcurrentWarehouse("Приймання", "-")
+    products = list(generate_products(SKU_COUNT))
+    for product in products:
+        product.set_quantity(count)
+    warehouse.add_many(products)
+    return warehouse
+
+
+def run(count: int) -> None:
+    skus = [product.get_sku() for product in generate_products(SKU_COUNT)]
+    print(f"\n{count} замовлень на {SKU_COUNT} SKU")
+    print(f"  {'етапи перевірка/резерв/ціна/облік':<36}{'навантаження':>14}{'зам./с':>10}{'p50 мс':>9}{'p99 мс':>9}"
+          f"{'відхилено':>11}{'очікування входу':>18}")
+    for name, concurrency, queue_size in CONFIGURATIONS:
+        for rate in RATES:
+            warehouse = build_warehouse(count)
+            history = HistoryService()
+            history.clear_history()
+            repository = OrderRepository()
+            pipeline = IntakePipeline(warehouse, PricingService(), history, repository, concurrency, queue_size)
+            asyncio.run(generate_load(pipeline, build_orders(count, skus), rate))
+            report = pipeline.get_report()
+            assert repository.get_count() == report["прийнято"] == history.get_records_count()
+            assert warehouse.verify_totals()
+            load = f"{rate} /с" if rate else "максимум"
+            print(f"  {name:<36}{load:>14}{report['замовлень_за_секунду']:>10,.0f}"
+                  f"{report['затримка_p50_мс']:>9.2f}{report['затримка_p99_мс']:>9.2f}"
+                  f"{sum(report['відхилено'].values()):>11}{report['очікування_на_вході_с']:>16.2f} с")
+    bottleneck = max(report["етапи"].items(), key=lambda item: item[1]["p50_мс"] / item[1]["обробників"])
+    print(f"  найповільніший етап: {bottleneck[0]} (p50 {bottleneck[1]['p50_мс']:.3f} мс,"
+          f" p99 {bottleneck[1]['p99_мс']:.3f} мс)")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [20_000]):
+        run(size)
@@ -0,0 +1,67 @@
+import os
+import sys
+import json
+import random
+import shutil
+import tempfile
+import tracemalloc
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.mapped_warehouse import MappedWarehouse
+from utils.product_codec import product_to_dict, product_from_dict
+
+
+def load_json(path: str) -> Warehouse:
+    warehouse = Warehouse("JSON", "-")
+    with open(path, "r", encoding="utf-8") as f:
+        warehouse.add_many(product_from_dict(json.loads(line)) for line in f)
+    return warehouse
+
+
+def traced(func):
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def run(products: int) -> None:
+    directory = tempfile.mkdtemp(prefix="mapped-bench-")
+    try:
+        source = Warehouse("Каталог", "-")
+        source.add_many(generate_products(products))
+        json_path = os.path.join(directory, "catalog.jsonl")
+        with open(json_path, "w", encoding="utf-8") as f:
+            for product in source.get_all_products():
+                f.write(json.dumps(product_to_dict(product), ensure_ascii=False) + "\n")
+        mapped_path = MappedWarehouse.build(os.path.join(directory, "catalog.whm"), source)
+        del source
+
+        json_open = timed(lambda: load_json(json_path), repeat=1)
+        mapped_open = timed(lambda: MappedWarehouse(mapped_path).close())
+        loaded, json_memory = traced(lambda: load_json(json_path))
+        mapped, mapped_memory = traced(lambda: MappedWarehouse(mapped_path))
+
+        skus = [product.get_sku() for product in loaded.get_all_products()]
+        sample = random.Random(5).sample(skus, min(10_000, len(skus)))
+        json_lookup = timed(lambda: [loaded.get_product(sku).get_quantity() for sku in sample])
+        mapped_lookup = timed(lambda: [mapped.get_product(sku).get_quantity() for sku in sample])
+        json_check = timed(loaded.inventory_check)
+        mapped_check = timed(mapped.inventory_check)
+        assert abs(loaded.get_total_value() - mapped.get_total_value()) < 1e-3 * products
+        mapped.close()
+
+        print(f"\n{products} товарів, файл {os.path.getsize(mapped_path) / 2 ** 20:.1f} МБ")
+        print(f"  старт             JSON {json_open * 1000:>9.2f} мс   mmap {mapped_open * 1000:>9.2f} мс")
+        print(f"  пам'ять процесу   JSON {json_memory / 2 ** 20:>9.2f} МБ   mmap {mapped_memory / 2 ** 20:>9.2f} МБ")
+        print(f"  пошук {len(sample)} SKU  JSON {json_lookup * 1000:>7.2f} мс   mmap {mapped_lookup * 1000:>9.2f} мс")
+        print(f"  інвентаризація    JSON {json_check * 1000:>9.2f} мс   mmap {mapped_check * 1000:>9.2f} мс")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [50_000, 200_000]):
+        run(size)
@@ -0,0 +1,65 @@
+import sys
+import tracemalloc
+from catalog import generate_products, parse_sizes
+
+from models.food_product import FoodProduct
+from models.electronics_product import ElectronicsProduct
+from models.clothing_product import ClothingProduct
+from models.household_product import HouseholdProduct
+
+
+class LegacyProduct:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def fresh(value: str) -> str:
+    return value.encode().decode()
+
+
+def product_kwargs(product) -> dict:
+    kwargs = {"sku": product.get_sku(), "name": product.get_name(), "price": product.get_price(),
+              "quantity": product.get_quantity(), "description": product.get_description()}
+    if isinstance(product, FoodProduct):
+        kwargs.update(expiration_date=product.get_expiration_date(), weight=product.get_weight(),
+                      is_organic=product.is_organic())
+    elif isinstance(product, ElectronicsProduct):
+        kwargs.update(brand=fresh(product.get_brand()), warranty_months=product.get_warranty_months(),
+                      power_consumption=product.get_power_consumption())
+    elif isinstance(product, ClothingProduct):
+        kwargs.update(size=fresh(product.get_size()), color=fresh(product.get_color()),
+                      material=fresh(product.get_material()), gender=fresh(product.get_gender()))
+    elif isinstance(product, HouseholdProduct):
+        kwargs.update(room_type=fresh(product.get_room_type()), dimensions=product.get_dimensions(),
+                      weight=product.get_weight())
+    return kwargs
+
+
+def build_legacy(product):
+    kwargs = product_kwargs(product)
+    fields = {"_" + key: kwargs.pop(key) for key in ("sku", "name", "price", "quantity", "description")}
+    fields["_category"] = product.get_category()
+    fields.update({"_" + key: value for key, value in kwargs.items()})
+    return LegacyProduct(**fields)
+
+
+def build_slotted(product):
+    return type(product)(**product_kwargs(product))
+
+
+def measure(build, size: int) -> float:
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    products = [build(product) for product in generate_products(size)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del products
+    return used / size
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [1_000_000]):
+        before = measure(build_legacy, size)
+        after = measure(build_slotted, size)
+        print(f"{size} товарів: до {before:.0f} Б/товар, після {after:.0f} Б/товар "
+              f"(економія {(1 - after / before) * 100:.1f}%)")
@@ -0,0 +1,97 @@
+import sys
+import random
+import threading
+import time
+from catalog import parse_sizes
+
+from models.base_product import BaseProduct
+from services.warehouse_service import Warehouse, CasResult
+from services.concurrent_warehouse import ConcurrentWarehouse
+
+
+INITIAL_QUANTITY = 1_000_000
+WRITE_SHARE = 0.1
+THINK_TIMES = (0.0, 0.0002)
+
+
+def take_one(quantity: int):
+    return quantity - 1 if quantity > 0 else None
+
+
+def think(seconds: float) -> None:
+    if seconds:
+        time.sleep(seconds)
+
+
+def coarse_worker(warehouse: Warehouse, lock: threading.Lock, think_time: float, skus, operations: int,
+                  seed: int, stats: list) -> None:
+    rng = random.Random(seed)
+    taken = 0
+    for _ in range(operations):
+        sku = rng.choice(skus)
+        with lock:
+            product = warehouse.get_product(sku)
+            quantity = product.get_quantity()
+            if rng.random() < WRITE_SHARE and quantity > 0:
+                think(think_time)
+                warehouse.update_product_quantity(sku, quantity - 1)
+                taken += 1
+    stats[seed] = (taken, 0)
+
+
+def optimistic_worker(warehouse: ConcurrentWarehouse, think_time: float, skus, operations: int, seed: int,
+                      stats: list) -> None:
+    rng = random.Random(seed)
+    taken = attempts = 0
+
+    def compute(quantity: int):
+        nonlocal attempts
+        attempts += 1
+        think(think_time)
+        return take_one(quantity)
+
+    for _ in range(operations):
+        sku = rng.choice(skus)
+        warehouse.get_product_version(sku)
+        warehouse.get_product(sku).get_quantity()
+        if rng.random() < WRITE_SHARE and warehouse.update_with_retry(sku, compute) is CasResult.OK:
+            taken += 1
+    stats[seed] = (taken, attempts)
+
+
+def run(name: str, warehouse, target, threads: int, skus, operations: int) -> None:
+    for sku in skus:
+        warehouse.add_product(BaseProduct(sku, sku, 1.0, INITIAL_QUANTITY, "Конкуренція", ""))
+    stats = [None] * threads
+    workers = [threading.Thread(target=target, args=(warehouse, skus, operations, seed, stats))
+               for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    taken = sum(item[0] for item in stats)
+    attempts = sum(item[1] for item in stats)
+    remaining = sum(warehouse.get_product(sku).get_quantity() for sku in skus)
+    consistent = remaining == INITIAL_QUANTITY * len(skus) - taken
+    retries = f"{(attempts - taken) / attempts * 100:.1f}%" if attempts else "-"
+    print(f"  {name:<28}{threads * operations / elapsed:>12,.0f} оп/с   повторів CAS: {retries:<8}"
+          f"залишки {'узгоджені' if consistent else 'РОЗІЙШЛИСЯ'}")
+
+
+if __name__ == "__main__":
+    threads, sku_count, operations = (parse_sizes(sys.argv[1:], [8, 4, 50_000]) + [8, 4, 50_000])[:3]
+    sys.setswitchinterval(1e-5)
+    skus = [f"HOT-{i:03d}" for i in range(sku_count)]
+    print(f"{threads} потоків x {operations} операцій на {sku_count} гарячих SKU, записів {WRITE_SHARE:.0%}")
+    for think_time in THINK_TIMES:
+        print(f"\nобчислення між читанням і записом: {think_time * 1e6:.0f} мкс")
+        lock = threading.Lock()
+        run("глобальне блокування", Warehouse("Блокування", "-"),
+            lambda w, s, o, seed, stats: coarse_worker(w, lock, think_time, s, o, seed, stats),
+            threads, skus, operations)
+        run("оптимістичні версії (CAS)", ConcurrentWarehouse("Версії", "-"),
+            lambda w, s, o, seed, stats: optimistic_worker(w, think_time, s, o, seed, stats),
+            threads, skus, operations)
@@ -0,0 +1,47 @@
+import sys
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.order_service import Order
+
+
+def build(lines: int, orders: int):
+    warehouse = Warehouse("Бенчмарк", "-")
+    products = list(generate_products(lines))
+    for product in products:
+        product.set_quantity(orders * 10)
+        warehouse.add_product(product)
+    order_list = []
+    for _ in range(orders):
+        order = Order()
+        for product in products:
+            order.add_item(product.get_sku(), 1)
+        order_list.append(order)
+    return warehouse, order_list
+
+
+def check_then_issue(order: Order, warehouse: Warehouse) -> bool:
+    items = order.get_items()
+    for sku, quantity in items:
+        product = warehouse.get_product(sku)
+        if not product or product.get_quantity() < quantity:
+            return False
+    for sku, quantity in items:
+        warehouse.issue_product(sku, quantity)
+    return True
+
+
+def run(lines: int, orders: int = 50) -> None:
+    legacy_warehouse, legacy_orders = build(lines, orders)
+    warehouse, order_list = build(lines, orders)
+    legacy_time = timed(lambda: [check_then_issue(order, legacy_warehouse) for order in legacy_orders])
+    reserve_time = timed(lambda: [order.process_order(warehouse) for order in order_list])
+    assert legacy_warehouse.get_total_units() == warehouse.get_total_units()
+    print(f"  {lines:>6} рядків x {orders} замовлень: перевірка+видача {legacy_time * 1000:>9.2f} мс, "
+          f"reserve_many+commit {reserve_time * 1000:>9.2f} мс ({legacy_time / reserve_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    print("Обробка замовлень")
+    for size in parse_sizes(sys.argv[1:], [10, 100, 1_000]):
+        run(size)
@@ -0,0 +1,73 @@
+import sys
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.order_service import Order
+
+
+class ListOrder:
+    def __init__(self):
+        self._items = []
+
+    def get_items(self):
+        return self._items.copy()
+
+    def add_item(self, sku: str, quantity: int) -> bool:
+        if quantity <= 0:
+            return False
+        for i, (item_sku, item_qty) in enumerate(self._items):
+            if item_sku == sku:
+                self._items[i] = (sku, item_qty + quantity)
+                return True
+        self._items.append((sku, quantity))
+        return True
+
+    def remove_item(self, sku: str) -> bool:
+        for i, (item_sku, _) in enumerate(self._items):
+            if item_sku == sku:
+                self._items.pop(i)
+                return True
+        return False
+
+    def calculate_total(self, warehouse: Warehouse) -> float:
+        total = 0.0
+        for sku, quantity in self._items:
+            product = warehouse.get_product(sku)
+            if product:
+                total += product.get_price() * quantity
+        return total
+
+
+def build(order, skus: list):
+    for sku in skus:
+        order.add_item(sku, 1)
+    for sku in skus[::10]:
+        order.add_item(sku, 2)
+    for sku in skus[::25]:
+        order.remove_item(sku)
+    return order
+
+
+def run(lines: int, warehouse: Warehouse, skus: list) -> None:
+    skus = skus[:lines]
+    legacy_build = timed(lambda: build(ListOrder(), skus))
+    dict_build = timed(lambda: build(Order(), skus), 3)
+    legacy_order, order = build(ListOrder(), skus), build(Order(), skus)
+    assert legacy_order.get_items() == list(order.get_items())
+    legacy_price = timed(lambda: legacy_order.calculate_total(warehouse), 3)
+    dict_price = timed(lambda: order.calculate_total(warehouse), 3)
+    legacy_view = timed(lambda: [legacy_order.get_items() for _ in range(100)])
+    dict_view = timed(lambda: [order.get_items() for _ in range(100)])
+    print(f"  {lines:>6} рядків: побудова список {legacy_build * 1000:>9.2f} мс   словник {dict_build * 1000:>7.2f} мс"
+          f" ({legacy_build / dict_build:>6.1f}x)   розрахунок {legacy_price * 1000:>6.2f} / {dict_price * 1000:>6.2f} мс"
+          f"   get_items x100 {legacy_view * 1000:>6.2f} / {dict_view * 1000:>5.3f} мс")
+
+
+if __name__ == "__main__":
+    sizes = parse_sizes(sys.argv[1:], [10, 1_000, 10_000])
+    warehouse = Warehouse("Замовлення", "-")
+    warehouse.add_many(generate_products(max(sizes)))
+    skus = [product.get_sku() for product in warehouse.iter_products()]
+    print("Рядки замовлення: список кортежів проти словника")
+    for size in sizes:
+        run(size, warehouse, skus)
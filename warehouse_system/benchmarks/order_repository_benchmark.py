@@ -0,0 +1,61 @@
+import sys
+import random
+from datetime import datetime, timedelta
+from catalog import timed, parse_sizes
+
+from services.order_service import Order, OrderStatus
+from services.order_repository import OrderRepository
+
+
+STATUSES = [OrderStatus.PENDING, OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.DELIVERED,
+            OrderStatus.CANCELLED]
+
+
+def build(count: int, seed: int = 5) -> list:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    orders = []
+    for i in range(count):
+        order = Order(f"R{i:07d}")
+        order._created_date = start + timedelta(minutes=i * 5)
+        order.set_status(STATUSES[min(rng.randrange(20), 4)])
+        for _ in range(rng.randrange(1, 6)):
+            order.add_item(f"SKU-{rng.randrange(5000):05d}", rng.randrange(1, 10))
+        orders.append(order)
+    return orders
+
+
+def run(count: int) -> None:
+    orders = build(count)
+    repository = OrderRepository(orders)
+    rng = random.Random(9)
+    ids = [orders[rng.randrange(count)].get_order_id() for _ in range(100)]
+    skus = [f"SKU-{rng.randrange(5000):05d}" for _ in range(100)]
+    low = orders[count // 3].get_created_date()
+    high = orders[count // 3 + count // 50].get_created_date()
+
+    def scan_id():
+        return [next(o for o in orders if o.get_order_id() == order_id) for order_id in ids]
+
+    def scan_window():
+        return [o for o in orders if o.get_status() == OrderStatus.CANCELLED and low <= o.get_created_date() <= high]
+
+    def scan_sku():
+        return [[o for o in orders if any(item_sku == sku for item_sku, _ in o.get_items())] for sku in skus[:10]]
+
+    assert scan_window() == repository.find(OrderStatus.CANCELLED, low, high)
+    assert scan_sku() == [sorted(repository.get_by_sku(sku), key=lambda o: o.get_created_date()) for sku in skus[:10]]
+    print(f"\n{count} замовлень")
+    for name, scan, indexed in (
+            ("100 пошуків за номером", scan_id, lambda: [repository.get(order_id) for order_id in ids]),
+            ("статус + 2% діапазону дат", scan_window, lambda: repository.find(OrderStatus.CANCELLED, low, high)),
+            ("10 пошуків за SKU", scan_sku, lambda: [repository.get_by_sku(sku) for sku in skus[:10]])):
+        scan_time = timed(scan)
+        indexed_time = timed(indexed, 3)
+        print(f"  {name:<28} перебір {scan_time * 1000:>9.2f} мс   індекси {indexed_time * 1000:>7.3f} мс"
+              f"   ({scan_time / indexed_time:,.0f}x)")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 100_000]):
+        run(size)
@@ -0,0 +1,43 @@
+import sys
+import tracemalloc
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+
+
+def peak(func) -> int:
+    tracemalloc.start()
+    func()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def run(products: int) -> None:
+    warehouse = Warehouse("Сторінки", "-")
+    warehouse.add_many(generate_products(products))
+    value = lambda p: p.get_price() * p.get_quantity()
+
+    def copy_top():
+        return sorted(warehouse.get_all_products(), key=value, reverse=True)[:10]
+
+    def page_top():
+        return warehouse.page(0, 10, key=value, reverse=True)
+
+    def copy_page():
+        return warehouse.get_all_products()[1000:1020]
+
+    def lazy_page():
+        return warehouse.page(1000, 20)
+
+    assert copy_top() == page_top() and copy_page() == lazy_page()
+    print(f"\n{products} товарів")
+    for label, copied, lazy in (("ТОП-10 за вартістю", copy_top, page_top),
+                                ("сторінка 1000..1020", copy_page, lazy_page)):
+        print(f"  {label:<22}копія списку {timed(copied, 3) * 1000:>8.2f} мс {peak(copied) / 2 ** 20:>7.2f} МБ"
+              f"   page {timed(lazy, 3) * 1000:>8.2f} мс {peak(lazy) / 2 ** 20:>7.2f} МБ")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 500_000]):
+        run(size)
@@ -0,0 +1,44 @@
+import sys
+import random
+import shutil
+import tempfile
+from catalog import generate_products, parse_sizes
+
+from services.persistent_warehouse import PersistentWarehouse
+
+
+def fill(directory: str, products: int, operations: int, snapshot_every: int) -> dict:
+    warehouse = PersistentWarehouse("Журнал", "-", directory, snapshot_every=snapshot_every)
+    warehouse.add_many(generate_products(products))
+    rng = random.Random(3)
+    skus = [product.get_sku() for product in warehouse.get_all_products()]
+    for _ in range(operations):
+        if rng.random() < 0.5:
+            warehouse.receive_product(rng.choice(skus), rng.randrange(1, 20))
+        else:
+            warehouse.issue_product(rng.choice(skus), rng.randrange(1, 5))
+    warehouse.close()
+    return {product.get_sku(): product.get_quantity() for product in warehouse.get_all_products()}
+
+
+def run(products: int) -> None:
+    operations = products * 2
+    print(f"\n{products} товарів, {operations} операцій")
+    for label, snapshot_every in (("без знімків", operations * 10), ("знімок кожні 5000", 5000)):
+        directory = tempfile.mkdtemp(prefix="wal-bench-")
+        try:
+            expected = fill(directory, products, operations, snapshot_every)
+            recovered = PersistentWarehouse("Журнал", "-", directory, snapshot_every=snapshot_every)
+            stats = recovered.get_recovery_stats()
+            recovered.close()
+            assert {product.get_sku(): product.get_quantity()
+                    for product in recovered.get_all_products()} == expected
+            print(f"  {label:<20}відновлення {stats['seconds'] * 1000:>9.2f} мс"
+                  f"   знімок LSN {stats['snapshot_lsn']:>8}   дограно {stats['replayed']:>7} записів")
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 50_000]):
+        run(size)
@@ -0,0 +1,35 @@
+import sys
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+
+
+QUERIES = ["молоко", "ноутбук lenovo", "зимовий", "sam", "ал", "12345", "неіснуючий"]
+
+
+def scan_search(products, keyword: str):
+    keyword_lower = keyword.lower()
+    return [p for p in products
+            if keyword_lower in p.get_name().lower() or
+               keyword_lower in p.get_description().lower()]
+
+
+def run(size: int) -> None:
+    warehouse = Warehouse("Бенчмарк", "-")
+    build_time = timed(lambda: [warehouse.add_product(p) for p in generate_products(size)])
+    products = warehouse.get_all_products()
+    print(f"\n{size} товарів (побудова складу з індексом: {build_time:.2f} с)")
+    print(f"  {'запит':<16}{'знайдено':>10}{'скан, мс':>12}{'індекс, мс':>12}{'прискорення':>14}")
+    for query in QUERIES:
+        expected = scan_search(products, query)
+        actual = warehouse.search_products(query)
+        assert [p.get_sku() for p in actual] == [p.get_sku() for p in expected], query
+        scan_time = timed(lambda: scan_search(products, query), repeat=3)
+        index_time = timed(lambda: warehouse.search_products(query), repeat=3)
+        print(f"  {query:<16}{len(actual):>10}{scan_time * 1000:>12.2f}{index_time * 1000:>12.2f}"
+              f"{scan_time / max(index_time, 1e-9):>13.1f}x")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [10_000, 100_000, 1_000_000]):
+        run(size)
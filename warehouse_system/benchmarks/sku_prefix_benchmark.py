@@ -0,0 +1,59 @@
+import sys
+import random
+from bisect import insort
+from catalog import generate_products, timed, parse_sizes
+
+from services.warehouse_service import Warehouse
+from services.sku_index import SkuIndex
+
+
+INSERTS = 2000
+
+
+def run(products: int) -> None:
+    warehouse = Warehouse("Префікси", "-")
+    warehouse.add_many(generate_products(products))
+    rng = random.Random(11)
+    skus = [product.get_sku() for product in warehouse.iter_products()]
+    prefixes = [rng.choice(skus)[:rng.randrange(6, 12)] for _ in range(50)]
+
+    def scan():
+        return [sorted((p for p in warehouse.iter_products() if p.get_sku().startswith(prefix)),
+                       key=lambda p: p.get_sku())[:10]
+                for prefix in prefixes]
+
+    def indexed():
+        return [warehouse.get_products_by_sku_prefix(prefix, 10) for prefix in prefixes]
+
+    assert scan() == indexed()
+    scan_time = timed(scan)
+    indexed_time = timed(indexed, 3)
+    print(f"\n{products} товарів, {len(prefixes)} префіксів (до 10 підказок)")
+    print(f"  повний перебір {scan_time * 1000:>10.2f} мс   індекс SKU {indexed_time * 1000:>8.2f} мс"
+          f"   ({scan_time / indexed_time:.0f}x)")
+
+    new_skus = [f"{rng.choice(skus)[:6]}-N{i:05d}" for i in range(INSERTS)]
+    flat = sorted(skus)
+    index = SkuIndex()
+    index.add_many(skus)
+
+    def insert_flat():
+        copy = list(flat)
+        for sku in new_skus:
+            insort(copy, sku)
+
+    def insert_blocks():
+        for sku in new_skus:
+            index.add(sku)
+        for sku in new_skus:
+            index.remove(sku)
+
+    flat_time = timed(insert_flat)
+    blocks_time = timed(insert_blocks, 3) / 2
+    print(f"  {INSERTS} вставок по одному: список {flat_time * 1000:>8.2f} мс   блоки {blocks_time * 1000:>8.2f} мс"
+          f"   ({flat_time / blocks_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    for size in parse_sizes(sys.argv[1:], [100_000, 500_000]):
+        run(size)
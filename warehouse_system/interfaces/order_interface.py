@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import ItemsView
 from datetime import datetime
 
 
@@ -9,7 +9,7 @@ class IOrder(ABC):
         pass
 
     @abstractmethod
-    def get_items(self) -> List[Tuple[str, int]]:
+    def get_items(self) -> ItemsView[str, int]:
         pass
 
     @abstractmethod
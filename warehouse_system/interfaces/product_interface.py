@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class IProduct(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         pass
@@ -1,5 +1,8 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional
 from interfaces.product_interface import IProduct
 
 
@@ -39,3 +42,40 @@ class IWarehouse(ABC):
     @abstractmethod
     def search_products(self, keyword: str) -> List[IProduct]:
         pass
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return iter(self.get_all_products())
+
+    def page(self, offset: int, limit: int, key: Optional[Callable[[IProduct], Any]] = None,
+             predicate: Optional[Callable[[IProduct], bool]] = None, reverse: bool = False) -> List[IProduct]:
+        products = self.iter_products()
+        if predicate is not None:
+            products = filter(predicate, products)
+        if key is None:
+            return list(islice(products, offset, offset + limit))
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(offset + limit, products, key=key)[offset:]
+
+    def get_product_count(self) -> int:
+        return sum(1 for _ in self.iter_products())
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        return [product for product in self.iter_products() if product.get_category() == category]
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        return sorted((product for product in self.iter_products() if product.get_quantity() < threshold),
+                      key=lambda product: product.get_quantity())
+
+    def get_categories(self) -> List[str]:
+        return list(dict.fromkeys(product.get_category() for product in self.iter_products()))
+
+    def get_products_by_sku_prefix(self, prefix: str, limit: Optional[int] = None) -> List[IProduct]:
+        products = sorted((product for product in self.iter_products() if product.get_sku().startswith(prefix)),
+                          key=lambda product: product.get_sku())
+        return products[:limit]
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        return sorted((product for product in self.iter_products()
+                       if hasattr(product, 'get_expiration_date') and product.get_expiration_date() <= until
+                       and (since is None or product.get_expiration_date() >= since)),
+                      key=lambda product: product.get_expiration_date())
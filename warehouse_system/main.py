@@ -165,7 +165,7 @@ def main():
     order1.add_item("CLOTH-001", 5)
     order1.calculate_total(warehouse)
     print(order1)
-    print(f"  Товари: {order1.get_items()}")
+    print(f"  Товари: {list(order1.get_items())}")
     print()
 
     order2 = Order()
@@ -173,7 +173,7 @@ def main():
     order2.add_item("HOUSE-001", 1)
     order2.calculate_total(warehouse)
     print(order2)
-    print(f"  Товари: {order2.get_items()}")
+    print(f"  Товари: {list(order2.get_items())}")
     print()
 
     print("-" * 60)
@@ -1,13 +1,16 @@
+import sys
 from interfaces.product_interface import IProduct
 
 
 class BaseProduct(IProduct):
+    __slots__ = ("_sku", "_name", "_price", "_quantity", "_category", "_description")
+
     def __init__(self, sku: str, name: str, price: float, quantity: int, category: str, description: str):
         self._sku = sku
         self._name = name
         self._price = price
         self._quantity = quantity
-        self._category = category
+        self._category = sys.intern(category)
         self._description = description
 
     def get_name(self) -> str:
@@ -23,6 +26,10 @@ class BaseProduct(IProduct):
         if quantity >= 0:
             self._quantity = quantity
 
+    def set_price(self, price: float) -> None:
+        if price >= 0:
+            self._price = price
+
     def get_category(self) -> str:
         return self._category
 
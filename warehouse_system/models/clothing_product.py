@@ -1,14 +1,17 @@
+import sys
 from models.base_product import BaseProduct
 
 
 class ClothingProduct(BaseProduct):
+    __slots__ = ("_size", "_color", "_material", "_gender")
+
     def __init__(self, sku: str, name: str, price: float, quantity: int, description: str,
                  size: str, color: str, material: str, gender: str):
         super().__init__(sku, name, price, quantity, "Одяг", description)
-        self._size = size
-        self._color = color
-        self._material = material
-        self._gender = gender
+        self._size = sys.intern(size)
+        self._color = sys.intern(color)
+        self._material = sys.intern(material)
+        self._gender = sys.intern(gender)
 
     def get_size(self) -> str:
         return self._size
@@ -1,11 +1,14 @@
+import sys
 from models.base_product import BaseProduct
 
 
 class ElectronicsProduct(BaseProduct):
+    __slots__ = ("_brand", "_warranty_months", "_power_consumption")
+
     def __init__(self, sku: str, name: str, price: float, quantity: int, description: str,
                  brand: str, warranty_months: int, power_consumption: float):
         super().__init__(sku, name, price, quantity, "Електроніка", description)
-        self._brand = brand
+        self._brand = sys.intern(brand)
         self._warranty_months = warranty_months
         self._power_consumption = power_consumption
 
@@ -1,18 +1,80 @@
+from heapq import heappop, heappush
+from typing import List, Tuple
 from models.base_product import BaseProduct
 from datetime import date
 
 
 class FoodProduct(BaseProduct):
+    __slots__ = ("_expiration_date", "_weight", "_is_organic", "_lots")
+
     def __init__(self, sku: str, name: str, price: float, quantity: int, description: str, 
                  expiration_date: date, weight: float, is_organic: bool = False):
         super().__init__(sku, name, price, quantity, "Продукти харчування", description)
         self._expiration_date = expiration_date
         self._weight = weight
         self._is_organic = is_organic
+        self._lots = None
 
     def get_expiration_date(self) -> date:
         return self._expiration_date
 
+    def get_lots(self) -> List[Tuple[date, int]]:
+        if self._lots is None:
+            return [(self._expiration_date, self._quantity)] if self._quantity else []
+        return sorted((expiration_date, quantity) for expiration_date, quantity in self._lots)
+
+    def add_lot(self, quantity: int, expiration_date: date) -> None:
+        if quantity <= 0:
+            return
+        if self._lots is None:
+            if not self._quantity or expiration_date == self._expiration_date:
+                self._expiration_date = expiration_date
+                self._quantity += quantity
+                return
+            self._lots = [[self._expiration_date, self._quantity]]
+        for lot in self._lots:
+            if lot[0] == expiration_date:
+                lot[1] += quantity
+                break
+        else:
+            heappush(self._lots, [expiration_date, quantity])
+        self._quantity += quantity
+        self._expiration_date = self._lots[0][0]
+
+    def take_lots(self, quantity: int) -> List[Tuple[date, int]]:
+        quantity = min(quantity, self._quantity)
+        if quantity <= 0:
+            return []
+        self._quantity -= quantity
+        if self._lots is None:
+            return [(self._expiration_date, quantity)]
+        taken = []
+        while quantity:
+            lot = self._lots[0]
+            if lot[1] > quantity:
+                lot[1] -= quantity
+                taken.append((lot[0], quantity))
+                break
+            quantity -= lot[1]
+            taken.append(tuple(heappop(self._lots)))
+            self._expiration_date = lot[0]
+        if self._lots:
+            self._expiration_date = self._lots[0][0]
+        if len(self._lots) <= 1:
+            self._lots = None
+        return taken
+
+    def set_quantity(self, quantity: int) -> None:
+        if quantity < 0:
+            return
+        if quantity < self._quantity:
+            self.take_lots(self._quantity - quantity)
+        elif self._lots is None:
+            self._quantity = quantity
+        else:
+            self._lots[0][1] += quantity - self._quantity
+            self._quantity = quantity
+
     def get_weight(self) -> float:
         return self._weight
 
@@ -24,4 +86,5 @@ class FoodProduct(BaseProduct):
 
     def __str__(self) -> str:
         organic_status = "органічний" if self._is_organic else "звичайний"
-        return f"{super().__str__()} | Термін придатності: {self._expiration_date} | {organic_status}"
+        lots = f" | Партій: {len(self._lots)}" if self._lots else ""
+        return f"{super().__str__()} | Термін придатності: {self._expiration_date}{lots} | {organic_status}"
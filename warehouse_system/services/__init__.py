@@ -1,6 +1,17 @@
-from services.warehouse_service import Warehouse
+from services.warehouse_service import Warehouse, CasResult
+from services.columnar_warehouse import ColumnarWarehouse
+from services.concurrent_warehouse import ConcurrentWarehouse
+from services.warehouse_cluster import WarehouseCluster
+from services.sqlite_warehouse import SqliteWarehouse
+from services.persistent_warehouse import PersistentWarehouse
+from services.mapped_warehouse import MappedWarehouse
+from services.product_query import Eq, In, Range, And, Or
+from services.change_stream import ChangeStream, ChangeEvent, ChangeType
 from services.supplier_service import Supplier
 from services.order_service import Order, OrderStatus
+from services.order_repository import OrderRepository
+from services.intake_pipeline import IntakePipeline, IntakeTicket
+from services.fulfillment_service import FulfillmentEngine, FifoPolicy, PriorityPolicy, FillRatePolicy
 from services.report_service import InventoryReport, LowStockReport, SalesReport
 from services.history_service import HistoryService, OperationType
 from services.statistics_service import StatisticsService
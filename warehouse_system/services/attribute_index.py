@@ -0,0 +1,167 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+from interfaces.product_interface import IProduct
+from services.product_query import MISSING, VOLATILE_ATTRIBUTES, attribute_value, Condition, Eq, In, Range, And, Or
+
+
+class AttributeIndex:
+    def __init__(self, attribute: str):
+        self._attribute = attribute
+        self._buckets: Dict[Any, Dict[str, IProduct]] = {}
+        self._keys: Optional[List[Any]] = None
+        self._size = 0
+
+    def add(self, product: IProduct) -> None:
+        self._put(product, attribute_value(product, self._attribute))
+
+    def remove(self, product: IProduct) -> None:
+        self._drop(product, attribute_value(product, self._attribute))
+
+    def move(self, product: IProduct, old_value: Any) -> None:
+        value = attribute_value(product, self._attribute)
+        if value != old_value:
+            self._drop(product, old_value)
+            self._put(product, value)
+
+    def equal(self, value: Any) -> Dict[str, IProduct]:
+        return self._buckets.get(value, {})
+
+    def between(self, low: Optional[Any], high: Optional[Any]) -> List[Dict[str, IProduct]]:
+        start, end = self._span(low, high)
+        return [self._buckets[key] for key in self._keys[start:end]]
+
+    def estimate_between(self, low: Optional[Any], high: Optional[Any]) -> int:
+        if not self._buckets:
+            return 0
+        start, end = self._span(low, high)
+        return (end - start) * self._size // len(self._buckets)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _span(self, low: Optional[Any], high: Optional[Any]) -> Tuple[int, int]:
+        if self._keys is None:
+            self._keys = sorted(self._buckets)
+        start = 0 if low is None else bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect_right(self._keys, high)
+        return start, max(start, end)
+
+    def _put(self, product: IProduct, value: Any) -> None:
+        if value is MISSING:
+            return
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            bucket = self._buckets[value] = {}
+            if self._keys is not None:
+                insort(self._keys, value)
+        bucket[product.get_sku()] = product
+        self._size += 1
+
+    def _drop(self, product: IProduct, value: Any) -> None:
+        if value is MISSING:
+            return
+        bucket = self._buckets[value]
+        del bucket[product.get_sku()]
+        self._size -= 1
+        if not bucket:
+            del self._buckets[value]
+            if self._keys is not None:
+                del self._keys[bisect_left(self._keys, value)]
+
+
+class AttributeIndexes:
+    def __init__(self, source: Callable[[], Collection[IProduct]]):
+        self._source = source
+        self._indexes: Dict[str, AttributeIndex] = {}
+        self._scan_only: Set[str] = set(VOLATILE_ATTRIBUTES)
+
+    def get_indexed_attributes(self) -> List[str]:
+        return list(self._indexes)
+
+    def add(self, product: IProduct) -> None:
+        for attribute, index in list(self._indexes.items()):
+            self._update(attribute, index.add, product)
+
+    def add_many(self, products: Iterable[IProduct]) -> None:
+        for attribute, index in list(self._indexes.items()):
+            for product in products:
+                if not self._update(attribute, index.add, product):
+                    break
+
+    def remove(self, product: IProduct) -> None:
+        for attribute, index in list(self._indexes.items()):
+            self._update(attribute, index.remove, product)
+
+    def move(self, product: IProduct, attribute: str, old_value: Any) -> None:
+        index = self._indexes.get(attribute)
+        if index is not None:
+            self._update(attribute, index.move, product, old_value)
+
+    def estimate(self, condition: Condition) -> int:
+        if isinstance(condition, (Eq, In, Range)) and not self._indexed(condition.get_attribute()):
+            return len(self._source())
+        if isinstance(condition, Eq):
+            return len(self._index(condition.get_attribute()).equal(condition.get_value()))
+        if isinstance(condition, In):
+            index = self._index(condition.get_attribute())
+            return sum(len(index.equal(value)) for value in condition.get_values())
+        if isinstance(condition, Range):
+            return self._index(condition.get_attribute()).estimate_between(*condition.get_bounds())
+        if isinstance(condition, And):
+            return min((self.estimate(child) for child in condition.get_conditions()), default=len(self._source()))
+        if isinstance(condition, Or):
+            return sum(self.estimate(child) for child in condition.get_conditions())
+        raise TypeError(f"Непідтримувана умова: {condition!r}")
+
+    def select(self, condition: Condition) -> Dict[str, IProduct]:
+        if isinstance(condition, (Eq, In, Range)) and not self._indexed(condition.get_attribute()):
+            return {product.get_sku(): product for product in self._source() if condition.matches(product)}
+        if isinstance(condition, Eq):
+            return self._index(condition.get_attribute()).equal(condition.get_value())
+        if isinstance(condition, In):
+            index = self._index(condition.get_attribute())
+            return self._union(index.equal(value) for value in condition.get_values())
+        if isinstance(condition, Range):
+            return self._union(self._index(condition.get_attribute()).between(*condition.get_bounds()))
+        if isinstance(condition, And):
+            children = sorted(condition.get_conditions(), key=self.estimate)
+            if not children:
+                return {product.get_sku(): product for product in self._source()}
+            rest = children[1:]
+            return {sku: product for sku, product in self.select(children[0]).items()
+                    if all(child.matches(product) for child in rest)}
+        if isinstance(condition, Or):
+            return self._union(self.select(child) for child in condition.get_conditions())
+        raise TypeError(f"Непідтримувана умова: {condition!r}")
+
+    def _index(self, attribute: str) -> AttributeIndex:
+        return self._indexes[attribute]
+
+    def _indexed(self, attribute: str) -> bool:
+        if attribute in self._scan_only:
+            return False
+        if attribute not in self._indexes:
+            index = AttributeIndex(attribute)
+            try:
+                for product in self._source():
+                    index.add(product)
+            except TypeError:
+                self._scan_only.add(attribute)
+                return False
+            self._indexes[attribute] = index
+        return True
+
+    def _update(self, attribute: str, operation: Callable[..., None], *args: Any) -> bool:
+        try:
+            operation(*args)
+        except TypeError:
+            del self._indexes[attribute]
+            self._scan_only.add(attribute)
+            return False
+        return True
+
+    def _union(self, buckets: Iterable[Dict[str, IProduct]]) -> Dict[str, IProduct]:
+        result: Dict[str, IProduct] = {}
+        for bucket in buckets:
+            result.update(bucket)
+        return result
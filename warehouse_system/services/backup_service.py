@@ -3,6 +3,7 @@ import json
 import shutil
 from datetime import datetime
 from typing import Dict, List, Optional
+from utils.product_codec import product_to_dict
 
 
 class BackupService:
@@ -34,42 +35,8 @@ class BackupService:
             "orders": []
         }
         
-        for product in warehouse.get_all_products():
-            product_data = {
-                "sku": product.get_sku(),
-                "name": product.get_name(),
-                "price": product.get_price(),
-                "quantity": product.get_quantity(),
-                "category": product.get_category(),
-                "description": product.get_description()
-            }
-            
-            if hasattr(product, 'get_expiration_date'):
-                product_data["expiration_date"] = str(product.get_expiration_date())
-                product_data["weight"] = product.get_weight()
-                product_data["is_organic"] = product.is_organic()
-                product_data["type"] = "food"
-            
-            elif hasattr(product, 'get_brand'):
-                product_data["brand"] = product.get_brand()
-                product_data["warranty_months"] = product.get_warranty_months()
-                product_data["power_consumption"] = product.get_power_consumption()
-                product_data["type"] = "electronics"
-            
-            elif hasattr(product, 'get_size'):
-                product_data["size"] = product.get_size()
-                product_data["color"] = product.get_color()
-                product_data["material"] = product.get_material()
-                product_data["gender"] = product.get_gender()
-                product_data["type"] = "clothing"
-            
-            elif hasattr(product, 'get_room_type'):
-                product_data["room_type"] = product.get_room_type()
-                product_data["dimensions"] = product.get_dimensions()
-                product_data["weight"] = product.get_weight()
-                product_data["type"] = "household"
-            
-            backup_data["warehouse"]["products"].append(product_data)
+        for product in warehouse.iter_products():
+            backup_data["warehouse"]["products"].append(product_to_dict(product))
         
         for supplier in suppliers:
             supplier_data = {
@@ -81,14 +48,7 @@ class BackupService:
             backup_data["suppliers"].append(supplier_data)
         
         for order in orders:
-            order_data = {
-                "id": order.get_order_id(),
-                "items": order.get_items(),
-                "status": order.get_status(),
-                "total": order.get_total_amount(),
-                "created": order.get_created_date().isoformat()
-            }
-            backup_data["orders"].append(order_data)
+            backup_data["orders"].append(order.to_dict())
         
         filename = self._generate_backup_name()
         filepath = self._get_filepath(filename)
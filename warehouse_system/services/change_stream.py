@@ -0,0 +1,194 @@
+import queue
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+from interfaces.product_interface import IProduct
+
+
+class ChangeType(Enum):
+    ADDED = "Додано товар"
+    REMOVED = "Видалено товар"
+    QUANTITY_CHANGED = "Змінено кількість"
+    PRICE_CHANGED = "Змінено ціну"
+
+
+class ChangeEvent:
+    __slots__ = ("_version", "_change_type", "_product", "_before", "_after", "_timestamp")
+
+    def __init__(self, version: int, change_type: ChangeType, product: IProduct, before: Any, after: Any):
+        self._version = version
+        self._change_type = change_type
+        self._product = product
+        self._before = before
+        self._after = after
+        self._timestamp = time.perf_counter()
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_change_type(self) -> ChangeType:
+        return self._change_type
+
+    def get_product(self) -> IProduct:
+        return self._product
+
+    def get_sku(self) -> str:
+        return self._product.get_sku()
+
+    def get_before(self) -> Any:
+        return self._before
+
+    def get_after(self) -> Any:
+        return self._after
+
+    def get_timestamp(self) -> float:
+        return self._timestamp
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self._version,
+            "type": self._change_type.name,
+            "sku": self._product.get_sku(),
+            "before": self._before,
+            "after": self._after
+        }
+
+    def __str__(self) -> str:
+        return f"#{self._version} {self._change_type.value}: {self._product.get_sku()} ({self._before} → {self._after})"
+
+
+class QueuedSubscriber:
+    _STOP = object()
+
+    def __init__(self, callback: Callable[[ChangeEvent], None]):
+        self._callback = callback
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._version = 0
+        self._errors = 0
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, event: ChangeEvent) -> None:
+        self._queue.put(event)
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_errors(self) -> int:
+        return self._errors
+
+    def get_backlog(self) -> int:
+        return self._queue.qsize()
+
+    def wait_for(self, version: int, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._version >= version, timeout)
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is self._STOP:
+                return
+            try:
+                self._callback(event)
+            except Exception:
+                self._errors += 1
+            with self._condition:
+                self._version = event.get_version()
+                self._condition.notify_all()
+
+
+class ChangeStream:
+    def __init__(self):
+        self._version = 0
+        self._subscribers: Tuple[Callable[[ChangeEvent], None], ...] = ()
+        self._queued: Tuple[QueuedSubscriber, ...] = ()
+        self._deferred: Optional[List[ChangeEvent]] = None
+        self._errors = 0
+        self._last_error: Optional[Exception] = None
+
+    def get_version(self) -> int:
+        return self._version
+
+    def get_errors(self) -> int:
+        return self._errors
+
+    def get_last_error(self) -> Optional[Exception]:
+        return self._last_error
+
+    def is_observed(self) -> bool:
+        return bool(self._subscribers or self._queued)
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        self._subscribers = self._subscribers + (callback,)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]) -> bool:
+        if callback not in self._subscribers:
+            return False
+        self._subscribers = tuple(s for s in self._subscribers if s is not callback)
+        return True
+
+    def subscribe_queued(self, callback: Callable[[ChangeEvent], None]) -> QueuedSubscriber:
+        subscriber = QueuedSubscriber(callback)
+        self._queued = self._queued + (subscriber,)
+        return subscriber
+
+    def unsubscribe_queued(self, subscriber: QueuedSubscriber) -> bool:
+        if subscriber not in self._queued:
+            return False
+        self._queued = tuple(s for s in self._queued if s is not subscriber)
+        subscriber.close()
+        return True
+
+    def publish(self, change_type: ChangeType, product: IProduct, before: Any, after: Any) -> None:
+        self._version += 1
+        if not (self._subscribers or self._queued):
+            return
+        event = ChangeEvent(self._version, change_type, product, before, after)
+        for subscriber in self._queued:
+            subscriber.put(event)
+        if self._deferred is not None:
+            self._deferred.append(event)
+        else:
+            self._notify(event)
+
+    def defer(self) -> bool:
+        if self._deferred is not None:
+            return False
+        self._deferred = []
+        return True
+
+    def take_deferred(self) -> List[ChangeEvent]:
+        events, self._deferred = self._deferred or [], None
+        return events
+
+    def notify(self, events: List[ChangeEvent]) -> None:
+        for event in events:
+            self._notify(event)
+
+    def publish_added(self, products: List[IProduct]) -> None:
+        if not (self._subscribers or self._queued):
+            self._version += len(products)
+            return
+        for product in products:
+            self.publish(ChangeType.ADDED, product, None, product.get_quantity())
+
+    def publish_quantities(self, changes: List[Tuple[IProduct, int]]) -> None:
+        for product, old_quantity in changes:
+            quantity = product.get_quantity()
+            if quantity != old_quantity:
+                self.publish(ChangeType.QUANTITY_CHANGED, product, old_quantity, quantity)
+
+    def _notify(self, event: ChangeEvent) -> None:
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception as error:
+                self._errors += 1
+                self._last_error = error
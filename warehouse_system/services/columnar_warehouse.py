@@ -0,0 +1,293 @@
+from array import array
+from datetime import date
+from functools import partial
+from itertools import compress
+from operator import mul
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from services.search_index import SearchIndex
+from utils.lots import add_lot, take_lots
+from utils.product_codec import product_to_dict
+
+
+class ProductRow(IProduct):
+    __slots__ = ("_store", "_sku")
+
+    def __init__(self, store: "ColumnarWarehouse", sku: str):
+        self._store = store
+        self._sku = sku
+
+    def get_name(self) -> str:
+        return self._store._names[self._store._row(self._sku)]
+
+    def get_price(self) -> float:
+        return self._store._prices[self._store._row(self._sku)]
+
+    def set_price(self, price: float) -> None:
+        self._store._row(self._sku)
+        self._store.update_product_price(self._sku, price)
+
+    def get_quantity(self) -> int:
+        return self._store._quantities[self._store._row(self._sku)]
+
+    def set_quantity(self, quantity: int) -> None:
+        self._store._row(self._sku)
+        self._store.update_product_quantity(self._sku, quantity)
+
+    def get_category(self) -> str:
+        return self._store._category_names[self._store._category_codes[self._store._row(self._sku)]]
+
+    def get_description(self) -> str:
+        return self._store._descriptions[self._store._row(self._sku)]
+
+    def get_sku(self) -> str:
+        return self._sku
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._store._accessor(self._sku, name)
+
+    def __str__(self) -> str:
+        return f"{self.get_name()} (SKU: {self._sku}) - {self.get_quantity()} шт. по {self.get_price()} грн."
+
+
+class ColumnarWarehouse(IWarehouse):
+    TYPES = (None, "food", "electronics", "clothing", "household")
+    ATTRIBUTES = {
+        "food": ("weight", "is_organic"),
+        "electronics": ("brand", "warranty_months", "power_consumption"),
+        "clothing": ("size", "color", "material", "gender"),
+        "household": ("room_type", "dimensions", "weight")
+    }
+    LOT_METHODS = ("get_expiration_date", "get_lots", "is_expired", "add_lot", "take_lots")
+
+    def __init__(self, name: str, location: str):
+        self._name = name
+        self._location = location
+        self._rows: Dict[str, int] = {}
+        self._skus: List[str] = []
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._types = array("B")
+        self._attributes: List[Optional[tuple]] = []
+        self._lots: Dict[str, List[list]] = {}
+        self._prices = array("d")
+        self._quantities = array("q")
+        self._category_codes = array("H")
+        self._category_names: List[str] = []
+        self._category_lookup: Dict[str, int] = {}
+        self._search_index = SearchIndex()
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_location(self) -> str:
+        return self._location
+
+    def add_product(self, product: IProduct) -> bool:
+        sku = product.get_sku()
+        row = self._rows.get(sku)
+        if row is not None:
+            lots = self._lots.get(sku)
+            if lots is not None and hasattr(product, 'get_lots'):
+                for expiration_date, quantity in product.get_lots():
+                    add_lot(lots, quantity, expiration_date)
+            elif lots is not None:
+                add_lot(lots, product.get_quantity())
+            self._quantities[row] += product.get_quantity()
+            return True
+        data = product_to_dict(product)
+        product_type = data.get("type")
+        self._rows[sku] = len(self._skus)
+        self._skus.append(sku)
+        self._names.append(data["name"])
+        self._descriptions.append(data["description"])
+        self._types.append(self.TYPES.index(product_type))
+        self._attributes.append(tuple(data[key] for key in self.ATTRIBUTES[product_type])
+                                if product_type else None)
+        if product_type == "food":
+            self._lots[sku] = [[expiration_date, quantity] for expiration_date, quantity in product.get_lots()] \
+                or [[product.get_expiration_date(), 0]]
+        self._prices.append(product.get_price())
+        self._quantities.append(product.get_quantity())
+        self._category_codes.append(self._category_code(product.get_category()))
+        self._search_index.add(sku, product.get_name(), product.get_description())
+        return True
+
+    def remove_product(self, sku: str) -> bool:
+        row = self._rows.pop(sku, None)
+        if row is None:
+            return False
+        last = len(self._skus) - 1
+        if row != last:
+            moved = self._skus[last]
+            self._rows[moved] = row
+            self._skus[row] = moved
+            self._names[row] = self._names[last]
+            self._descriptions[row] = self._descriptions[last]
+            self._types[row] = self._types[last]
+            self._attributes[row] = self._attributes[last]
+            self._prices[row] = self._prices[last]
+            self._quantities[row] = self._quantities[last]
+            self._category_codes[row] = self._category_codes[last]
+        self._skus.pop()
+        self._names.pop()
+        self._descriptions.pop()
+        self._types.pop()
+        self._attributes.pop()
+        self._lots.pop(sku, None)
+        self._prices.pop()
+        self._quantities.pop()
+        self._category_codes.pop()
+        self._search_index.remove(sku)
+        return True
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        row = self._rows.get(sku)
+        if row is None or self._quantities[row] < quantity:
+            return False
+        self._set_quantity(row, sku, self._quantities[row] - quantity)
+        if self._quantities[row] == 0:
+            self.remove_product(sku)
+        return True
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        row = self._rows.get(sku)
+        if row is None:
+            return False
+        self._set_quantity(row, sku, self._quantities[row] + quantity)
+        return True
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        row = self._rows.get(sku)
+        if row is None:
+            return False
+        if quantity >= 0:
+            self._set_quantity(row, sku, quantity)
+        return True
+
+    def update_product_price(self, sku: str, price: float) -> bool:
+        row = self._rows.get(sku)
+        if row is None or price < 0:
+            return False
+        self._prices[row] = price
+        return True
+
+    def get_product(self, sku: str) -> Optional[IProduct]:
+        return ProductRow(self, sku) if sku in self._rows else None
+
+    def get_all_products(self) -> List[IProduct]:
+        return [ProductRow(self, sku) for sku in self._skus]
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return (ProductRow(self, sku) for sku in self._skus)
+
+    def get_product_count(self) -> int:
+        return len(self._skus)
+
+    def inventory_check(self) -> dict:
+        counts = [0] * len(self._category_names)
+        units = [0] * len(self._category_names)
+        values = [0.0] * len(self._category_names)
+        for code, price, quantity in zip(self._category_codes, self._prices, self._quantities):
+            counts[code] += 1
+            units[code] += quantity
+            values[code] += price * quantity
+        return {
+            "назва_складу": self._name,
+            "локація": self._location,
+            "загальна_кількість_товарів": len(self._skus),
+            "загальна_кількість_одиниць": sum(self._quantities),
+            "загальна_вартість": self.get_total_value(),
+            "категорії": {
+                category: {"кількість_товарів": counts[code], "кількість_одиниць": units[code],
+                           "вартість": values[code]}
+                for code, category in enumerate(self._category_names) if counts[code]
+            }
+        }
+
+    def get_total_value(self) -> float:
+        return sum(map(mul, self._prices, self._quantities))
+
+    def get_total_units(self) -> int:
+        return sum(self._quantities)
+
+    def search_products(self, keyword: str) -> List[IProduct]:
+        return [ProductRow(self, sku) for sku in self._search_index.search(keyword)]
+
+    def fuzzy_search_products(self, query: str, limit: int = 10) -> List[IProduct]:
+        return [ProductRow(self, sku) for sku, _ in self._search_index.fuzzy_search(query, limit)]
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        code = self._category_lookup.get(category)
+        if code is None:
+            return []
+        return [ProductRow(self, sku) for sku in compress(self._skus, map(code.__eq__, self._category_codes))]
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        rows = list(compress(range(len(self._skus)), map(threshold.__gt__, self._quantities)))
+        rows.sort(key=self._quantities.__getitem__)
+        return [ProductRow(self, self._skus[row]) for row in rows]
+
+    def get_categories(self) -> List[str]:
+        present = set(self._category_codes)
+        return [category for code, category in enumerate(self._category_names) if code in present]
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_lookup.get(category)
+        if code is None:
+            code = self._category_lookup[category] = len(self._category_names)
+            self._category_names.append(category)
+        return code
+
+    def _row(self, sku: str) -> int:
+        row = self._rows.get(sku)
+        if row is None:
+            raise LookupError(f"Товар {sku} видалено зі складу '{self._name}'")
+        return row
+
+    def _set_quantity(self, row: int, sku: str, quantity: int) -> List[Tuple[date, int]]:
+        lots = self._lots.get(sku)
+        old_quantity = self._quantities[row]
+        self._quantities[row] = quantity
+        if lots is None:
+            return []
+        if quantity < old_quantity:
+            return take_lots(lots, old_quantity - quantity)
+        add_lot(lots, quantity - old_quantity)
+        return []
+
+    def _accessor(self, sku: str, name: str) -> Callable[..., Any]:
+        row = self._row(sku)
+        product_type = self.TYPES[self._types[row]]
+        if product_type == "food" and name in self.LOT_METHODS:
+            return partial(getattr(self, "_" + name), sku)
+        fields = self.ATTRIBUTES.get(product_type, ())
+        field = name[4:] if name.startswith("get_") else name
+        if field not in fields:
+            raise AttributeError(name)
+        value = self._attributes[row][fields.index(field)]
+        return lambda: dict(value) if isinstance(value, dict) else value
+
+    def _get_expiration_date(self, sku: str) -> date:
+        return self._lots[sku][0][0]
+
+    def _get_lots(self, sku: str) -> List[Tuple[date, int]]:
+        return [(expiration_date, quantity) for expiration_date, quantity in self._lots[sku] if quantity]
+
+    def _is_expired(self, sku: str) -> bool:
+        return date.today() > self._lots[sku][0][0]
+
+    def _add_lot(self, sku: str, quantity: int, expiration_date: date) -> None:
+        if quantity > 0:
+            add_lot(self._lots[sku], quantity, expiration_date)
+            self._quantities[self._row(sku)] += quantity
+
+    def _take_lots(self, sku: str, quantity: int) -> List[Tuple[date, int]]:
+        row = self._row(sku)
+        quantity = min(quantity, self._quantities[row])
+        if quantity <= 0:
+            return []
+        return self._set_quantity(row, sku, self._quantities[row] - quantity)
@@ -0,0 +1,215 @@
+import time
+import threading
+from datetime import date
+from contextlib import ExitStack
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+from interfaces.product_interface import IProduct
+from services.warehouse_service import Warehouse, CasResult
+from services.product_query import Condition
+
+
+class ConcurrentWarehouse(Warehouse):
+    def __init__(self, name: str, location: str, stripes: int = 64, debug: bool = False):
+        super().__init__(name, location, debug)
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        self._index_lock = threading.RLock()
+
+    def add_product(self, product: IProduct) -> bool:
+        with self._stripe(product.get_sku()):
+            return super().add_product(product)
+
+    def remove_product(self, sku: str) -> bool:
+        with self._stripe(sku):
+            return super().remove_product(sku)
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        with self._stripe(sku):
+            return super().issue_product(sku, quantity)
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        with self._stripe(sku):
+            return super().receive_product(sku, quantity)
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        with self._stripe(sku):
+            return super().update_product_quantity(sku, quantity)
+
+    def update_product_price(self, sku: str, price: float) -> bool:
+        with self._stripe(sku):
+            return super().update_product_price(sku, price)
+
+    def compare_and_issue(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        with self._stripe(sku):
+            if self._versions.get(sku) != expected_version:
+                return CasResult.CONFLICT
+            return CasResult.OK if self.issue_product(sku, quantity) else CasResult.REJECTED
+
+    def compare_and_receive(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        with self._stripe(sku):
+            if self._versions.get(sku) != expected_version:
+                return CasResult.CONFLICT
+            return CasResult.OK if quantity > 0 and self.receive_product(sku, quantity) else CasResult.REJECTED
+
+    def compare_and_set_quantity(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        with self._stripe(sku):
+            if self._versions.get(sku) != expected_version:
+                return CasResult.CONFLICT
+            if quantity >= 0 and self.update_product_quantity(sku, quantity):
+                return CasResult.OK
+            return CasResult.REJECTED
+
+    def issue_with_retry(self, sku: str, quantity: int, attempts: int = 8) -> CasResult:
+        return self._retry(sku, lambda version: self.compare_and_issue(sku, quantity, version), attempts)
+
+    def receive_with_retry(self, sku: str, quantity: int, attempts: int = 8) -> CasResult:
+        return self._retry(sku, lambda version: self.compare_and_receive(sku, quantity, version), attempts)
+
+    def update_with_retry(self, sku: str, compute: Callable[[int], Optional[int]], attempts: int = 8) -> CasResult:
+        def attempt(version: Optional[int]) -> CasResult:
+            product = self._products.get(sku)
+            quantity = compute(product.get_quantity()) if product is not None else None
+            if quantity is None:
+                return CasResult.REJECTED
+            return self.compare_and_set_quantity(sku, quantity, version)
+
+        return self._retry(sku, attempt, attempts)
+
+    def add_many(self, products: Iterable[IProduct]) -> bytearray:
+        products = list(products)
+        with self._stripes_for(product.get_sku() for product in products):
+            return super().add_many(products)
+
+    def issue_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        items = list(items)
+        with self._stripes_for(sku for sku, _ in items):
+            return super().issue_many(items)
+
+    def receive_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        items = list(items)
+        with self._stripes_for(sku for sku, _ in items):
+            return super().receive_many(items)
+
+    def reserve_many(self, items: Iterable[Tuple[str, int]]) -> Optional[str]:
+        items = list(items)
+        with self._stripes_for(sku for sku, _ in items):
+            return super().reserve_many(items)
+
+    def commit(self, reservation_id: str) -> bool:
+        with self._stripes_for(sku for sku, _ in self.get_reserved_items(reservation_id)):
+            return super().commit(reservation_id)
+
+    def release(self, reservation_id: str) -> bool:
+        with self._stripes_for(sku for sku, _ in self.get_reserved_items(reservation_id)):
+            return super().release(reservation_id)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_stripes"] = len(self._stripes)
+        del state["_index_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._stripes = [threading.RLock() for _ in range(state["_stripes"])]
+        self._index_lock = threading.RLock()
+
+    def get_all_products(self) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_all_products()
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return iter(self.get_all_products())
+
+    def inventory_check(self) -> dict:
+        with self._index_lock:
+            return super().inventory_check()
+
+    def get_total_value(self) -> float:
+        with self._index_lock:
+            return super().get_total_value()
+
+    def search_products(self, keyword: str) -> List[IProduct]:
+        with self._index_lock:
+            return super().search_products(keyword)
+
+    def fuzzy_search_products(self, query: str, limit: int = 10) -> List[IProduct]:
+        with self._index_lock:
+            return super().fuzzy_search_products(query, limit)
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_expiring_products(until, since)
+
+    def find_products(self, condition: Condition) -> List[IProduct]:
+        with self._index_lock:
+            return super().find_products(condition)
+
+    def get_products_by_sku_prefix(self, prefix: str, limit: Optional[int] = None) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_products_by_sku_prefix(prefix, limit)
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_products_by_category(category)
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_low_stock_products(threshold)
+
+    def get_products_by_quantity(self, min_quantity: Optional[int] = None,
+                                 max_quantity: Optional[int] = None) -> List[IProduct]:
+        with self._index_lock:
+            return super().get_products_by_quantity(min_quantity, max_quantity)
+
+    def get_categories(self) -> List[str]:
+        with self._index_lock:
+            return super().get_categories()
+
+    def verify_totals(self) -> bool:
+        with self._index_lock:
+            return super().verify_totals()
+
+    def _retry(self, sku: str, attempt: Callable[[Optional[int]], CasResult], attempts: int) -> CasResult:
+        result = CasResult.CONFLICT
+        for _ in range(attempts):
+            result = attempt(self._versions.get(sku))
+            if result is not CasResult.CONFLICT:
+                break
+            time.sleep(0)
+        return result
+
+    def _stripe(self, sku: str) -> threading.RLock:
+        return self._stripes[hash(sku) % len(self._stripes)]
+
+    def _stripes_for(self, skus: Iterable[str]) -> ExitStack:
+        stack = ExitStack()
+        for index in sorted({hash(sku) % len(self._stripes) for sku in skus}):
+            stack.enter_context(self._stripes[index])
+        return stack
+
+    def _publishing(self, hook: Callable[..., None], *args) -> None:
+        with self._index_lock:
+            deferred = self._changes.defer()
+            try:
+                hook(*args)
+            finally:
+                events = self._changes.take_deferred() if deferred else []
+        self._changes.notify(events)
+
+    def _insert_product(self, product: IProduct) -> None:
+        self._publishing(super()._insert_product, product)
+
+    def _delete_product(self, sku: str) -> None:
+        self._publishing(super()._delete_product, sku)
+
+    def _insert_products(self, products: List[IProduct]) -> None:
+        self._publishing(super()._insert_products, products)
+
+    def _quantity_changed(self, product: IProduct, old_quantity: int) -> None:
+        self._publishing(super()._quantity_changed, product, old_quantity)
+
+    def _quantities_changed(self, changes: List[Tuple[IProduct, int]]) -> None:
+        self._publishing(super()._quantities_changed, changes)
+
+    def _price_changed(self, product: IProduct, old_price: float) -> None:
+        self._publishing(super()._price_changed, product, old_price)
@@ -0,0 +1,58 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, List, Optional
+from interfaces.product_interface import IProduct
+
+
+class ExpirationIndex:
+    def __init__(self):
+        self._buckets: Dict[date, Dict[str, IProduct]] = {}
+        self._dates: List[date] = []
+        self._indexed: Dict[str, date] = {}
+
+    def add(self, product: IProduct) -> None:
+        if hasattr(product, 'get_expiration_date'):
+            self._put(product, product.get_expiration_date())
+
+    def remove(self, product: IProduct) -> None:
+        expiration_date = self._indexed.pop(product.get_sku(), None)
+        if expiration_date is not None:
+            self._drop(product.get_sku(), expiration_date)
+
+    def update(self, product: IProduct) -> Optional[date]:
+        sku = product.get_sku()
+        old_date = self._indexed.get(sku)
+        if old_date is None:
+            return None
+        expiration_date = product.get_expiration_date()
+        if expiration_date == old_date:
+            return None
+        self._drop(sku, old_date)
+        self._put(product, expiration_date)
+        return old_date
+
+    def range(self, start: Optional[date] = None, end: Optional[date] = None) -> List[IProduct]:
+        first = 0 if start is None else bisect_left(self._dates, start)
+        last = len(self._dates) if end is None else bisect_right(self._dates, end)
+        result: List[IProduct] = []
+        for expiration_date in self._dates[first:last]:
+            result.extend(self._buckets[expiration_date].values())
+        return result
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def _put(self, product: IProduct, expiration_date: date) -> None:
+        bucket = self._buckets.get(expiration_date)
+        if bucket is None:
+            bucket = self._buckets[expiration_date] = {}
+            insort(self._dates, expiration_date)
+        bucket[product.get_sku()] = product
+        self._indexed[product.get_sku()] = expiration_date
+
+    def _drop(self, sku: str, expiration_date: date) -> None:
+        bucket = self._buckets[expiration_date]
+        del bucket[sku]
+        if not bucket:
+            del self._buckets[expiration_date]
+            del self._dates[bisect_left(self._dates, expiration_date)]
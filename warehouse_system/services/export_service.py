@@ -27,13 +27,11 @@ class ExportService:
         filename = self._generate_filename("products", "csv")
         filepath = self._get_filepath(filename)
         
-        products = warehouse.get_all_products()
-        
         with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
             writer = csv.writer(f, delimiter=';')
             writer.writerow(['SKU', 'Назва', 'Категорія', 'Кількість', 'Ціна', 'Вартість', 'Опис'])
             
-            for p in products:
+            for p in warehouse.iter_products():
                 writer.writerow([
                     p.get_sku(),
                     p.get_name(),
@@ -50,15 +48,14 @@ class ExportService:
         filename = self._generate_filename("products", "json")
         filepath = self._get_filepath(filename)
         
-        products = warehouse.get_all_products()
         data = {
             "export_date": datetime.now().isoformat(),
-            "total_products": len(products),
+            "total_products": 0,
             "total_value": warehouse.get_total_value(),
             "products": []
         }
         
-        for p in products:
+        for p in warehouse.iter_products():
             data["products"].append({
                 "sku": p.get_sku(),
                 "name": p.get_name(),
@@ -68,6 +65,7 @@ class ExportService:
                 "total_value": p.get_price() * p.get_quantity(),
                 "description": p.get_description()
             })
+        data["total_products"] = len(data["products"])
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -106,7 +104,7 @@ class ExportService:
         lines.append("ДЕТАЛЬНИЙ СПИСОК ТОВАРІВ:")
         lines.append("-" * 60)
         
-        for p in warehouse.get_all_products():
+        for p in warehouse.iter_products():
             lines.append(f"SKU: {p.get_sku()}")
             lines.append(f"  Назва: {p.get_name()}")
             lines.append(f"  Категорія: {p.get_category()}")
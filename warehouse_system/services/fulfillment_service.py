@@ -0,0 +1,201 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from services.order_service import Order, OrderStatus
+
+
+class AllocationPolicy(ABC):
+    @abstractmethod
+    def sequence(self, orders: List[Order], available: Dict[str, int]) -> List[Order]:
+        pass
+
+
+class FifoPolicy(AllocationPolicy):
+    def sequence(self, orders: List[Order], available: Dict[str, int]) -> List[Order]:
+        return orders
+
+
+class PriorityPolicy(AllocationPolicy):
+    def sequence(self, orders: List[Order], available: Dict[str, int]) -> List[Order]:
+        return sorted(orders, key=lambda order: -order.get_priority())
+
+
+class FillRatePolicy(AllocationPolicy):
+    def sequence(self, orders: List[Order], available: Dict[str, int]) -> List[Order]:
+        def load(order: Order) -> float:
+            total = 0.0
+            for sku, quantity in order.get_items():
+                stock = available[sku]
+                if stock:
+                    total += quantity / stock
+            return total
+
+        return sorted(orders, key=load)
+
+
+class Allocation:
+    __slots__ = ("_order", "_allocated", "_backorder", "_amount")
+
+    def __init__(self, order: Order, allocated: Dict[str, int], backorder: Optional[Order], amount: float):
+        self._order = order
+        self._allocated = allocated
+        self._backorder = backorder
+        self._amount = amount
+
+    def get_order(self) -> Order:
+        return self._order
+
+    def get_allocated(self) -> Dict[str, int]:
+        return dict(self._allocated)
+
+    def get_backorder(self) -> Optional[Order]:
+        return self._backorder
+
+    def get_amount(self) -> float:
+        return self._amount
+
+    def is_complete(self) -> bool:
+        return self._backorder is None
+
+
+class BatchResult:
+    def __init__(self, allocations: List[Allocation], requested_units: int, allocated_units: int,
+                 elapsed: float):
+        self._allocations = allocations
+        self._requested_units = requested_units
+        self._allocated_units = allocated_units
+        self._elapsed = elapsed
+
+    def get_allocations(self) -> List[Allocation]:
+        return list(self._allocations)
+
+    def get_backorders(self) -> List[Order]:
+        return [a.get_backorder() for a in self._allocations if a.get_backorder() is not None]
+
+    def get_total_amount(self) -> float:
+        return sum(a.get_amount() for a in self._allocations)
+
+    def get_fill_rate(self) -> float:
+        return self._allocated_units / self._requested_units if self._requested_units else 1.0
+
+    def get_order_fill_rate(self) -> float:
+        if not self._allocations:
+            return 1.0
+        return sum(1 for a in self._allocations if a.is_complete()) / len(self._allocations)
+
+    def get_elapsed(self) -> float:
+        return self._elapsed
+
+    def get_summary(self) -> dict:
+        return {
+            "замовлень": len(self._allocations),
+            "виконано_повністю": sum(1 for a in self._allocations if a.is_complete()),
+            "дозамовлень": len(self.get_backorders()),
+            "запитано_одиниць": self._requested_units,
+            "розподілено_одиниць": self._allocated_units,
+            "рівень_виконання": self.get_fill_rate(),
+            "сума": self.get_total_amount(),
+            "час_с": self._elapsed
+        }
+
+
+class FulfillmentEngine:
+    def __init__(self, warehouse: IWarehouse, policy: Optional[AllocationPolicy] = None,
+                 allow_partial: bool = True, attempts: int = 3):
+        self._warehouse = warehouse
+        self._policy = policy or FifoPolicy()
+        self._allow_partial = allow_partial
+        self._attempts = attempts
+
+    def get_policy(self) -> AllocationPolicy:
+        return self._policy
+
+    def set_policy(self, policy: AllocationPolicy) -> None:
+        self._policy = policy
+
+    def run(self, orders: Iterable[Order]) -> BatchResult:
+        start = time.perf_counter()
+        pending = [order for order in orders if order.get_status() == OrderStatus.PENDING and order.get_items()]
+        plan: List[Tuple[Order, Dict[str, int]]] = [(order, {}) for order in pending]
+        prices: Dict[str, float] = {}
+        for _ in range(self._attempts):
+            products = self._snapshot(pending)
+            available = {sku: product.get_quantity() if product is not None else 0
+                         for sku, product in products.items()}
+            candidate, taken = self._allocate(self._policy.sequence(pending, available), available)
+            prices = {sku: products[sku].get_price() for sku in taken}
+            if self._apply(taken):
+                plan = candidate
+                break
+
+        allocations: List[Allocation] = []
+        requested_units = allocated_units = 0
+        for order, allocated in plan:
+            amount = 0.0
+            shortfall: Dict[str, int] = {}
+            for sku, quantity in order.get_items():
+                requested_units += quantity
+                granted = allocated.get(sku, 0)
+                if granted:
+                    amount += prices[sku] * granted
+                if granted < quantity:
+                    shortfall[sku] = quantity - granted
+            allocated_units += sum(allocated.values())
+            if not allocated:
+                allocations.append(Allocation(order, allocated, order, 0.0))
+                continue
+            backorder = order.split(shortfall) if shortfall else None
+            order.set_total_amount(amount)
+            order.set_status(OrderStatus.PROCESSING)
+            allocations.append(Allocation(order, allocated, backorder, amount))
+        return BatchResult(allocations, requested_units, allocated_units, time.perf_counter() - start)
+
+    def _snapshot(self, orders: List[Order]) -> Dict[str, Optional[IProduct]]:
+        get_product = self._warehouse.get_product
+        products: Dict[str, Optional[IProduct]] = {}
+        for order in orders:
+            for sku, _ in order.get_items():
+                if sku not in products:
+                    products[sku] = get_product(sku)
+        return products
+
+    def _allocate(self, orders: List[Order], available: Dict[str, int]) \
+            -> Tuple[List[Tuple[Order, Dict[str, int]]], Dict[str, int]]:
+        remaining = dict(available)
+        plan: List[Tuple[Order, Dict[str, int]]] = []
+        for order in orders:
+            items = order.get_items()
+            allocated: Dict[str, int] = {}
+            if self._allow_partial:
+                for sku, quantity in items:
+                    stock = remaining[sku]
+                    if stock:
+                        granted = quantity if quantity <= stock else stock
+                        remaining[sku] = stock - granted
+                        allocated[sku] = granted
+            elif all(remaining[sku] >= quantity for sku, quantity in items):
+                for sku, quantity in items:
+                    remaining[sku] -= quantity
+                allocated = dict(items)
+            plan.append((order, allocated))
+        taken = {sku: available[sku] - stock for sku, stock in remaining.items() if stock != available[sku]}
+        return plan, taken
+
+    def _apply(self, taken: Dict[str, int]) -> bool:
+        if not taken:
+            return True
+        if hasattr(self._warehouse, 'reserve_many'):
+            reservation_id = self._warehouse.reserve_many(taken.items())
+            if reservation_id is None:
+                return False
+            self._warehouse.commit(reservation_id)
+            return True
+        for sku, quantity in taken.items():
+            product = self._warehouse.get_product(sku)
+            if not product or product.get_quantity() < quantity:
+                return False
+        for sku, quantity in taken.items():
+            self._warehouse.issue_product(sku, quantity)
+        return True
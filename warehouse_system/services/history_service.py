@@ -1,6 +1,9 @@
-from datetime import datetime
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
 from typing import List, Optional
 from enum import Enum
+from utils.id_generator import IdGenerator, next_id
 
 
 class OperationType(Enum):
@@ -18,7 +21,7 @@ class OperationType(Enum):
 class HistoryRecord:
     def __init__(self, operation_type: OperationType, description: str, 
                  user: str = "Система", details: dict = None):
-        self._id = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self._id = next_id()
         self._timestamp = datetime.now()
         self._operation_type = operation_type
         self._description = description
@@ -65,12 +68,21 @@ class HistoryService:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._records: List[HistoryRecord] = []
+            cls._instance._ids: List[str] = []
+            cls._instance._lock = threading.Lock()
         return cls._instance
 
     def add_record(self, operation_type: OperationType, description: str,
                    user: str = "Система", details: dict = None) -> HistoryRecord:
         record = HistoryRecord(operation_type, description, user, details)
-        self._records.append(record)
+        with self._lock:
+            if self._ids and record.get_id() < self._ids[-1]:
+                position = bisect_right(self._ids, record.get_id())
+                self._ids.insert(position, record.get_id())
+                self._records.insert(position, record)
+            else:
+                self._ids.append(record.get_id())
+                self._records.append(record)
         return record
 
     def get_all_records(self) -> List[HistoryRecord]:
@@ -80,17 +92,33 @@ class HistoryService:
         return [r for r in self._records if r.get_operation_type() == operation_type]
 
     def get_records_by_date(self, date: datetime) -> List[HistoryRecord]:
-        return [r for r in self._records 
-                if r.get_timestamp().date() == date.date()]
+        day = datetime(date.year, date.month, date.day)
+        return self.get_records_between(day, day + timedelta(days=1) - timedelta(microseconds=1))
+
+    def get_records_between(self, start: datetime, end: datetime) -> List[HistoryRecord]:
+        first = bisect_left(self._ids, IdGenerator.lower_bound(start))
+        last = bisect_right(self._ids, IdGenerator.upper_bound(end))
+        return self._records[first:last]
 
     def get_recent_records(self, count: int = 10) -> List[HistoryRecord]:
         return self._records[-count:] if self._records else []
 
+    def remove_record(self, record: HistoryRecord) -> bool:
+        with self._lock:
+            position = bisect_left(self._ids, record.get_id())
+            if position == len(self._records) or self._records[position] is not record:
+                return False
+            del self._ids[position]
+            del self._records[position]
+            return True
+
     def get_records_count(self) -> int:
         return len(self._records)
 
     def clear_history(self) -> None:
-        self._records.clear()
+        with self._lock:
+            self._records.clear()
+            self._ids.clear()
 
     def export_to_list(self) -> List[dict]:
         return [r.to_dict() for r in self._records]
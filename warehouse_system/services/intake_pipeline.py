@@ -0,0 +1,284 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from services.order_service import Order, OrderStatus
+from services.pricing_service import PricingService
+from services.history_service import HistoryService, OperationType
+
+
+class IntakeTicket:
+    ACCEPTED = "Прийнято"
+    REJECTED = "Відхилено"
+
+    def __init__(self, order: Order, discount_code: Optional[str], future: asyncio.Future):
+        self._order = order
+        self._discount_code = discount_code
+        self._future = future
+        self._submitted = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._status: Optional[str] = None
+        self._reason: Optional[str] = None
+        self._reservation_id: Optional[str] = None
+        self._products: Dict[str, IProduct] = {}
+        self._lines: List[dict] = []
+
+    def get_order(self) -> Order:
+        return self._order
+
+    def get_discount_code(self) -> Optional[str]:
+        return self._discount_code
+
+    def get_status(self) -> Optional[str]:
+        return self._status
+
+    def get_reason(self) -> Optional[str]:
+        return self._reason
+
+    def get_reservation_id(self) -> Optional[str]:
+        return self._reservation_id
+
+    def set_reservation_id(self, reservation_id: Optional[str]) -> None:
+        self._reservation_id = reservation_id
+
+    def get_products(self) -> Dict[str, IProduct]:
+        return dict(self._products)
+
+    def get_product(self, sku: str) -> Optional[IProduct]:
+        return self._products.get(sku)
+
+    def set_products(self, products: Dict[str, IProduct]) -> None:
+        self._products = dict(products)
+
+    def get_lines(self) -> List[dict]:
+        return list(self._lines)
+
+    def set_lines(self, lines: List[dict]) -> None:
+        self._lines = list(lines)
+
+    def get_submitted(self) -> float:
+        return self._submitted
+
+    def get_finished(self) -> Optional[float]:
+        return self._finished
+
+    def get_latency(self) -> Optional[float]:
+        return self._finished - self._submitted if self._finished is not None else None
+
+    def is_accepted(self) -> bool:
+        return self._status == self.ACCEPTED
+
+    async def wait(self) -> "IntakeTicket":
+        return await self._future
+
+    def finish(self, status: str, reason: Optional[str] = None) -> None:
+        self._status = status
+        self._reason = reason
+        self._finished = time.perf_counter()
+        if not self._future.done():
+            self._future.set_result(self)
+
+
+class IntakePipeline:
+    STAGES = ("validate", "reserve", "price", "record")
+
+    def __init__(self, warehouse: IWarehouse, pricing: PricingService, history: HistoryService,
+                 repository=None, concurrency: Optional[Dict[str, int]] = None, queue_size: int = 100,
+                 executor: Optional[Executor] = None):
+        self._warehouse = warehouse
+        self._pricing = pricing
+        self._history = history
+        self._repository = repository
+        self._concurrency = {stage: 1 for stage in self.STAGES}
+        self._concurrency.update(concurrency or {})
+        self._queue_size = queue_size
+        self._executor = executor
+        self._handlers: Dict[str, Callable[[IntakeTicket], Optional[str]]] = {
+            "validate": self._validate, "reserve": self._reserve, "price": self._price, "record": self._record
+        }
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._service_times: Dict[str, List[float]] = {stage: [] for stage in self.STAGES}
+        self._peaks: Dict[str, int] = dict.fromkeys(self.STAGES, 0)
+        self._latencies: List[float] = []
+        self._rejections: Dict[str, int] = {}
+        self._accepted = 0
+        self._blocked = 0.0
+        self._first_submit: Optional[float] = None
+        self._last_finish: Optional[float] = None
+
+    async def start(self) -> None:
+        self._queues = {stage: asyncio.Queue(self._queue_size) for stage in self.STAGES}
+        for position, stage in enumerate(self.STAGES):
+            outbox = self._queues[self.STAGES[position + 1]] if position + 1 < len(self.STAGES) else None
+            for _ in range(self._concurrency[stage]):
+                self._workers.append(asyncio.create_task(self._work(stage, self._queues[stage], outbox)))
+
+    async def submit(self, order: Order, discount_code: Optional[str] = None) -> IntakeTicket:
+        ticket = IntakeTicket(order, discount_code, asyncio.get_running_loop().create_future())
+        if self._first_submit is None:
+            self._first_submit = ticket.get_submitted()
+        await self._put("validate", self._queues["validate"], ticket)
+        return ticket
+
+    async def close(self) -> None:
+        for stage in self.STAGES:
+            await self._queues[stage].join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def get_report(self) -> dict:
+        finished = len(self._latencies)
+        elapsed = (self._last_finish - self._first_submit) if finished else 0.0
+        return {
+            "оброблено": finished,
+            "прийнято": self._accepted,
+            "відхилено": dict(self._rejections),
+            "замовлень_за_секунду": finished / elapsed if elapsed else 0.0,
+            "затримка_p50_мс": _percentile(self._latencies, 0.5) * 1000,
+            "затримка_p99_мс": _percentile(self._latencies, 0.99) * 1000,
+            "очікування_на_вході_с": self._blocked,
+            "етапи": {
+                stage: {
+                    "обробників": self._concurrency[stage],
+                    "p50_мс": _percentile(self._service_times[stage], 0.5) * 1000,
+                    "p99_мс": _percentile(self._service_times[stage], 0.99) * 1000,
+                    "пік_черги": self._peaks[stage]
+                }
+                for stage in self.STAGES
+            }
+        }
+
+    async def _work(self, stage: str, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]) -> None:
+        handler = self._handlers[stage]
+        loop = asyncio.get_running_loop()
+        while True:
+            ticket = await inbox.get()
+            started = time.perf_counter()
+            try:
+                if self._executor is not None:
+                    reason = await loop.run_in_executor(self._executor, handler, ticket)
+                else:
+                    reason = handler(ticket)
+            except Exception as error:
+                reason = f"Помилка етапу {stage}: {error}"
+            self._service_times[stage].append(time.perf_counter() - started)
+            if reason is not None:
+                self._reject(ticket, reason)
+            elif outbox is not None:
+                await self._put(self.STAGES[self.STAGES.index(stage) + 1], outbox, ticket)
+            else:
+                self._complete(ticket, IntakeTicket.ACCEPTED)
+            inbox.task_done()
+
+    async def _put(self, stage: str, queue: asyncio.Queue, ticket: IntakeTicket) -> None:
+        if queue.full():
+            started = time.perf_counter()
+            await queue.put(ticket)
+            if stage == "validate":
+                self._blocked += time.perf_counter() - started
+        else:
+            queue.put_nowait(ticket)
+        if queue.qsize() > self._peaks[stage]:
+            self._peaks[stage] = queue.qsize()
+
+    def _validate(self, ticket: IntakeTicket) -> Optional[str]:
+        items = ticket.get_order().get_items()
+        if not items:
+            return "Порожнє замовлення"
+        for sku, quantity in items:
+            product = self._warehouse.get_product(sku)
+            if product is None:
+                return f"Товар {sku} не знайдено"
+            if quantity <= 0 or product.get_quantity() < quantity:
+                return "Недостатньо товару"
+        return None
+
+    def _reserve(self, ticket: IntakeTicket) -> Optional[str]:
+        items = list(ticket.get_order().get_items())
+        if not hasattr(self._warehouse, 'reserve_many'):
+            ticket.set_products({sku: self._warehouse.get_product(sku) for sku, _ in items})
+            if any(not ticket.get_product(sku) or ticket.get_product(sku).get_quantity() < quantity
+                   for sku, quantity in items):
+                return "Недостатньо товару"
+            return None
+        reservation_id = self._warehouse.reserve_many(items)
+        if reservation_id is None:
+            return "Недостатньо товару"
+        ticket.set_reservation_id(reservation_id)
+        ticket.set_products(self._warehouse.get_reserved_products(reservation_id))
+        return None
+
+    def _price(self, ticket: IntakeTicket) -> Optional[str]:
+        order = ticket.get_order()
+        lines = [self._pricing.calculate_price(ticket.get_product(sku), quantity, ticket.get_discount_code())
+                 for sku, quantity in order.get_items()]
+        ticket.set_lines(lines)
+        order.set_total_amount(sum(line["final_price"] for line in lines))
+        return None
+
+    def _record(self, ticket: IntakeTicket) -> Optional[str]:
+        order = ticket.get_order()
+        status = order.get_status()
+        order.set_status(OrderStatus.PROCESSING)
+        added = False
+        record = None
+        try:
+            added = self._repository is not None and self._repository.add(order)
+            record = self._history.add_record(
+                OperationType.ORDER_CREATED,
+                f"Створено замовлення #{order.get_order_id()}",
+                details={"order_id": order.get_order_id(), "сума": order.get_total_amount()}
+            )
+            if self._commit(ticket):
+                return None
+            reason = "Недостатньо товару"
+        except Exception as error:
+            reason = f"Помилка етапу record: {error}"
+        order.set_status(status)
+        if added:
+            self._repository.remove(order.get_order_id())
+        if record is not None:
+            self._history.remove_record(record)
+        return reason
+
+    def _commit(self, ticket: IntakeTicket) -> bool:
+        reservation_id = ticket.get_reservation_id()
+        if reservation_id is not None:
+            if not self._warehouse.commit(reservation_id):
+                return False
+            ticket.set_reservation_id(None)
+            return True
+        items = list(ticket.get_order().get_items())
+        for sku, quantity in items:
+            product = self._warehouse.get_product(sku)
+            if not product or product.get_quantity() < quantity:
+                return False
+        for sku, quantity in items:
+            self._warehouse.issue_product(sku, quantity)
+        return True
+
+    def _reject(self, ticket: IntakeTicket, reason: str) -> None:
+        if ticket.get_reservation_id() is not None:
+            self._warehouse.release(ticket.get_reservation_id())
+            ticket.set_reservation_id(None)
+        self._rejections[reason] = self._rejections.get(reason, 0) + 1
+        self._complete(ticket, IntakeTicket.REJECTED, reason)
+
+    def _complete(self, ticket: IntakeTicket, status: str, reason: Optional[str] = None) -> None:
+        if status == IntakeTicket.ACCEPTED:
+            self._accepted += 1
+        ticket.finish(status, reason)
+        self._latencies.append(ticket.get_latency())
+        self._last_finish = ticket.get_finished()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
@@ -0,0 +1,120 @@
+import math
+from typing import Dict, Iterable, List, Tuple
+from interfaces.product_interface import IProduct
+
+
+class InventoryTotals:
+    def __init__(self):
+        self._categories: Dict[str, List] = {}
+        self._count = 0
+        self._units = 0
+        self._value = 0.0
+
+    def add(self, product: IProduct) -> None:
+        quantity = product.get_quantity()
+        value = product.get_price() * quantity
+        totals = self._categories.get(product.get_category())
+        if totals is None:
+            totals = self._categories[product.get_category()] = [0, 0, 0.0]
+        totals[0] += 1
+        totals[1] += quantity
+        totals[2] += value
+        self._count += 1
+        self._units += quantity
+        self._value += value
+
+    def remove(self, product: IProduct) -> None:
+        quantity = product.get_quantity()
+        value = product.get_price() * quantity
+        category = product.get_category()
+        totals = self._categories[category]
+        totals[0] -= 1
+        if totals[0] == 0:
+            del self._categories[category]
+        else:
+            totals[1] -= quantity
+            totals[2] -= value
+        self._count -= 1
+        if self._count == 0:
+            self._units = 0
+            self._value = 0.0
+        else:
+            self._units -= quantity
+            self._value -= value
+
+    def change_quantity(self, product: IProduct, old_quantity: int) -> None:
+        delta = product.get_quantity() - old_quantity
+        value = product.get_price() * delta
+        totals = self._categories[product.get_category()]
+        totals[1] += delta
+        totals[2] += value
+        self._units += delta
+        self._value += value
+
+    def change_price(self, product: IProduct, old_price: float) -> None:
+        value = (product.get_price() - old_price) * product.get_quantity()
+        self._categories[product.get_category()][2] += value
+        self._value += value
+
+    def add_many(self, products: Iterable[IProduct]) -> None:
+        count = units = 0
+        value = 0.0
+        for product in products:
+            quantity = product.get_quantity()
+            product_value = product.get_price() * quantity
+            totals = self._categories.get(product.get_category())
+            if totals is None:
+                totals = self._categories[product.get_category()] = [0, 0, 0.0]
+            totals[0] += 1
+            totals[1] += quantity
+            totals[2] += product_value
+            count += 1
+            units += quantity
+            value += product_value
+        self._count += count
+        self._units += units
+        self._value += value
+
+    def change_many(self, changes: Iterable[Tuple[IProduct, int]]) -> None:
+        deltas: Dict[str, List] = {}
+        for product, old_quantity in changes:
+            delta = product.get_quantity() - old_quantity
+            if delta:
+                category_delta = deltas.setdefault(product.get_category(), [0, 0.0])
+                category_delta[0] += delta
+                category_delta[1] += product.get_price() * delta
+        for category, (units, value) in deltas.items():
+            totals = self._categories[category]
+            totals[1] += units
+            totals[2] += value
+            self._units += units
+            self._value += value
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_units(self) -> int:
+        return self._units
+
+    def get_value(self) -> float:
+        return self._value
+
+    def get_categories(self) -> Dict[str, dict]:
+        return {category: {"кількість_товарів": count, "кількість_одиниць": units, "вартість": value}
+                for category, (count, units, value) in self._categories.items()}
+
+    def matches(self, products: Iterable[IProduct], rel_tol: float = 1e-9) -> bool:
+        expected = InventoryTotals()
+        for product in products:
+            expected.add(product)
+        if (expected._count, expected._units) != (self._count, self._units):
+            return False
+        if expected._categories.keys() != self._categories.keys():
+            return False
+        pairs = [(expected._value, self._value)]
+        for category, (count, units, value) in expected._categories.items():
+            actual = self._categories[category]
+            if (count, units) != (actual[0], actual[1]):
+                return False
+            pairs.append((value, actual[2]))
+        return all(math.isclose(a, b, rel_tol=rel_tol, abs_tol=1e-6) for a, b in pairs)
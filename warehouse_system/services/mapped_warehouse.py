@@ -0,0 +1,306 @@
+import os
+import json
+import mmap
+import struct
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from services.search_index import SearchIndex
+from utils.product_codec import product_to_dict, product_from_dict
+
+_SHARED: Dict[str, Tuple[tuple, "MappedWarehouse"]] = {}
+
+
+class MappedProduct(IProduct):
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "MappedWarehouse", row: int):
+        self._store = store
+        self._row = row
+
+    def get_name(self) -> str:
+        return self._store._string(self._row, MappedWarehouse.NAME)
+
+    def get_price(self) -> float:
+        return self._store._record(self._row)[MappedWarehouse.PRICE]
+
+    def get_quantity(self) -> int:
+        return self._store._record(self._row)[MappedWarehouse.QUANTITY]
+
+    def set_quantity(self, quantity: int) -> None:
+        pass
+
+    def get_category(self) -> str:
+        return self._store._categories[self._store._record(self._row)[MappedWarehouse.CATEGORY]]
+
+    def get_description(self) -> str:
+        return self._store._string(self._row, MappedWarehouse.DESCRIPTION)
+
+    def get_sku(self) -> str:
+        return self._store._string(self._row, MappedWarehouse.SKU)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._store._materialize(self._row), name)
+
+    def __str__(self) -> str:
+        return f"{self.get_name()} (SKU: {self.get_sku()}) - {self.get_quantity()} шт. по {self.get_price()} грн."
+
+
+class MappedWarehouse(IWarehouse):
+    MAGIC = b"WHMM"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHQQQQ")
+    RECORD = struct.Struct("<QIQIQIQIdqiHB")
+    INDEX = struct.Struct("<Q")
+    SPAN = struct.Struct("<QI")
+    TYPES = (None, "food", "electronics", "clothing", "household")
+    BASE_FIELDS = ("sku", "name", "price", "quantity", "category", "description", "type")
+
+    SKU, NAME, DESCRIPTION, ATTRIBUTES = 0, 2, 4, 6
+    PRICE, QUANTITY, EXPIRATION, CATEGORY, TYPE = 8, 9, 10, 11, 12
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, self._count, meta_offset, index_offset, heap_offset = \
+            self.HEADER.unpack_from(self._map)
+        if magic != self.MAGIC or version != self.VERSION or record_size != self.RECORD.size:
+            self.close()
+            raise ValueError(f"Невідомий формат каталогу: {path}")
+        self._index_offset = index_offset
+        self._heap_offset = heap_offset
+        self._records = memoryview(self._map)[self.HEADER.size:self.HEADER.size + self._count * self.RECORD.size]
+        meta = json.loads(self._map[meta_offset:heap_offset].decode("utf-8"))
+        self._name = meta["name"]
+        self._location = meta["location"]
+        self._categories: List[str] = meta["categories"]
+        self._search_index: Optional[SearchIndex] = None
+
+    @classmethod
+    def build(cls, path: str, warehouse: IWarehouse) -> str:
+        skus = []
+        categories = {}
+        records = bytearray()
+        heap = bytearray()
+        strings = {}
+
+        def put(text: str) -> tuple:
+            span = strings.get(text)
+            if span is None:
+                encoded = text.encode("utf-8")
+                span = strings[text] = (len(heap), len(encoded))
+                heap.extend(encoded)
+            return span
+
+        for product in warehouse.iter_products():
+            data = product_to_dict(product)
+            skus.append(data["sku"].encode("utf-8"))
+            attributes = {key: value for key, value in data.items() if key not in cls.BASE_FIELDS}
+            expiration = data.get("expiration_date")
+            records.extend(cls.RECORD.pack(
+                *put(data["sku"]), *put(data["name"]), *put(data["description"]),
+                *put(json.dumps(attributes, ensure_ascii=False, separators=(",", ":"))),
+                data["price"], data["quantity"], date.fromisoformat(expiration).toordinal() if expiration else 0,
+                categories.setdefault(data["category"], len(categories)), cls.TYPES.index(data.get("type"))))
+
+        order = sorted(range(len(skus)), key=skus.__getitem__)
+        index = b"".join(cls.INDEX.pack(row) for row in order)
+        meta = json.dumps({"name": warehouse.get_name(), "location": warehouse.get_location(),
+                           "categories": list(categories)}, ensure_ascii=False).encode("utf-8")
+        index_offset = cls.HEADER.size + len(records)
+        meta_offset = index_offset + len(index)
+        heap_offset = meta_offset + len(meta)
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, cls.RECORD.size, len(skus),
+                                    meta_offset, index_offset, heap_offset))
+            f.write(records)
+            f.write(index)
+            f.write(meta)
+            f.write(heap)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def open_shared(cls, path: str) -> "MappedWarehouse":
+        stat = os.stat(path)
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        shared = _SHARED.get(path)
+        if shared is None or shared[0] != signature:
+            shared = _SHARED[path] = (signature, cls(path))
+        return shared[1]
+
+    def __reduce__(self):
+        return MappedWarehouse.open_shared, (self._path,)
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_location(self) -> str:
+        return self._location
+
+    def close(self) -> None:
+        if hasattr(self, "_records"):
+            self._records.release()
+        self._map.close()
+        self._file.close()
+
+    def add_product(self, product: IProduct) -> bool:
+        return False
+
+    def remove_product(self, sku: str) -> bool:
+        return False
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        return False
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        return False
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        return False
+
+    def get_product(self, sku: str) -> Optional[IProduct]:
+        row = self._find(sku)
+        return MappedProduct(self, row) if row is not None else None
+
+    def get_products_by_sku_prefix(self, prefix: str, limit: Optional[int] = None) -> List[IProduct]:
+        key = prefix.encode("utf-8")
+        result: List[IProduct] = []
+        position = self._lower_bound(key)
+        while position < self._count and (limit is None or len(result) < limit):
+            row = self._index_row(position)
+            if not self._sku_bytes(row).startswith(key):
+                break
+            result.append(MappedProduct(self, row))
+            position += 1
+        return result
+
+    def get_all_products(self) -> List[IProduct]:
+        return [MappedProduct(self, row) for row in range(self._count)]
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return (MappedProduct(self, row) for row in range(self._count))
+
+    def get_product_count(self) -> int:
+        return self._count
+
+    def inventory_check(self) -> dict:
+        counts = [0] * len(self._categories)
+        units = [0] * len(self._categories)
+        values = [0.0] * len(self._categories)
+        for record in self._iter_records():
+            code = record[self.CATEGORY]
+            counts[code] += 1
+            units[code] += record[self.QUANTITY]
+            values[code] += record[self.PRICE] * record[self.QUANTITY]
+        return {
+            "назва_складу": self._name,
+            "локація": self._location,
+            "загальна_кількість_товарів": self._count,
+            "загальна_кількість_одиниць": sum(units),
+            "загальна_вартість": sum(values),
+            "категорії": {
+                category: {"кількість_товарів": counts[code], "кількість_одиниць": units[code],
+                           "вартість": values[code]}
+                for code, category in enumerate(self._categories) if counts[code]
+            }
+        }
+
+    def get_total_value(self) -> float:
+        return sum(record[self.PRICE] * record[self.QUANTITY] for record in self._iter_records())
+
+    def get_total_units(self) -> int:
+        return sum(record[self.QUANTITY] for record in self._iter_records())
+
+    def search_products(self, keyword: str) -> List[IProduct]:
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for row in range(self._count):
+                self._search_index.add(str(row), self._string(row, self.NAME), self._string(row, self.DESCRIPTION))
+        return [MappedProduct(self, int(row)) for row in self._search_index.search(keyword)]
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        if category not in self._categories:
+            return []
+        code = self._categories.index(category)
+        return [MappedProduct(self, row) for row, record in enumerate(self._iter_records())
+                if record[self.CATEGORY] == code]
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        rows = [(record[self.QUANTITY], row) for row, record in enumerate(self._iter_records())
+                if record[self.QUANTITY] < threshold]
+        rows.sort(key=lambda item: item[0])
+        return [MappedProduct(self, row) for _, row in rows]
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        first = since.toordinal() if since is not None else 1
+        limit = until.toordinal()
+        rows = [(record[self.EXPIRATION], row) for row, record in enumerate(self._iter_records())
+                if first <= record[self.EXPIRATION] <= limit]
+        rows.sort(key=lambda item: item[0])
+        return [MappedProduct(self, row) for _, row in rows]
+
+    def get_categories(self) -> List[str]:
+        present = {record[self.CATEGORY] for record in self._iter_records()}
+        return [category for code, category in enumerate(self._categories) if code in present]
+
+    def _iter_records(self):
+        return self.RECORD.iter_unpack(self._records)
+
+    def _record(self, row: int) -> tuple:
+        return self.RECORD.unpack_from(self._records, row * self.RECORD.size)
+
+    def _string(self, row: int, field: int) -> str:
+        offset, length = self.SPAN.unpack_from(self._records, row * self.RECORD.size + field // 2 * self.SPAN.size)
+        return self._heap(offset, length).decode("utf-8")
+
+    def _heap(self, offset: int, length: int) -> bytes:
+        start = self._heap_offset + offset
+        return self._map[start:start + length]
+
+    def _find(self, sku: str) -> Optional[int]:
+        key = sku.encode("utf-8")
+        position = self._lower_bound(key)
+        if position < self._count:
+            row = self._index_row(position)
+            if self._sku_bytes(row) == key:
+                return row
+        return None
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._sku_bytes(self._index_row(middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _index_row(self, position: int) -> int:
+        return self.INDEX.unpack_from(self._map, self._index_offset + position * self.INDEX.size)[0]
+
+    def _sku_bytes(self, row: int) -> bytes:
+        return self._heap(*self.SPAN.unpack_from(self._records, row * self.RECORD.size))
+
+    def _materialize(self, row: int) -> IProduct:
+        record = self._record(row)
+        data = {
+            "sku": self._string(row, self.SKU),
+            "name": self._string(row, self.NAME),
+            "price": record[self.PRICE],
+            "quantity": record[self.QUANTITY],
+            "category": self._categories[record[self.CATEGORY]],
+            "description": self._string(row, self.DESCRIPTION),
+            "type": self.TYPES[record[self.TYPE]]
+        }
+        data.update(json.loads(self._heap(*record[self.ATTRIBUTES:self.ATTRIBUTES + 2]).decode("utf-8")))
+        return product_from_dict(data)
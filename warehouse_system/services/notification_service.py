@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import List, Callable, Optional
 from enum import Enum
+from services.change_stream import ChangeEvent, ChangeType
+from utils.id_generator import next_id
 
 
 class AlertLevel(Enum):
@@ -11,7 +13,7 @@ class AlertLevel(Enum):
 
 class Alert:
     def __init__(self, level: AlertLevel, title: str, message: str, source: str = "Система"):
-        self._id = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self._id = next_id()
         self._timestamp = datetime.now()
         self._level = level
         self._title = title
@@ -131,39 +133,56 @@ class NotificationService:
     def check_low_stock(self, warehouse, threshold: int = 10):
         low_stock = warehouse.get_low_stock_products(threshold)
         for product in low_stock:
-            qty = product.get_quantity()
-            if qty <= 3:
-                self.critical(
-                    f"Критично низький запас: {product.get_name()}",
-                    f"Залишилось лише {qty} од. товару {product.get_sku()}",
-                    "Моніторинг запасів"
-                )
-            elif qty <= threshold:
-                self.warning(
-                    f"Низький запас: {product.get_name()}",
-                    f"Залишилось {qty} од. товару {product.get_sku()}",
-                    "Моніторинг запасів"
-                )
+            self._low_stock_alert(product, product.get_quantity(), threshold)
+
+    def watch_stock(self, warehouse, threshold: int = 10) -> Callable[[ChangeEvent], None]:
+        def on_change(event: ChangeEvent):
+            if event.get_change_type() is not ChangeType.QUANTITY_CHANGED:
+                return
+            before, after = event.get_before(), event.get_after()
+            if after <= 3 < before or after <= threshold < before:
+                self._low_stock_alert(event.get_product(), after, threshold)
+
+        warehouse.get_change_stream().subscribe(on_change)
+        return on_change
+
+    def _low_stock_alert(self, product, qty: int, threshold: int):
+        if qty <= 3:
+            self.critical(
+                f"Критично низький запас: {product.get_name()}",
+                f"Залишилось лише {qty} од. товару {product.get_sku()}",
+                "Моніторинг запасів"
+            )
+        elif qty <= threshold:
+            self.warning(
+                f"Низький запас: {product.get_name()}",
+                f"Залишилось {qty} од. товару {product.get_sku()}",
+                "Моніторинг запасів"
+            )
 
     def check_expiring_products(self, warehouse, days_threshold: int = 7):
         from datetime import date, timedelta
-        products = warehouse.get_all_products()
         today = date.today()
+        until = today + timedelta(days=days_threshold)
+        
+        if hasattr(warehouse, 'get_expiring_products'):
+            products = warehouse.get_expiring_products(until)
+        else:
+            products = [p for p in warehouse.iter_products()
+                        if hasattr(p, 'get_expiration_date') and p.get_expiration_date() <= until]
         
         for product in products:
-            if hasattr(product, 'get_expiration_date'):
-                exp_date = product.get_expiration_date()
-                days_left = (exp_date - today).days
-                
-                if days_left < 0:
-                    self.critical(
-                        f"Прострочений товар: {product.get_name()}",
-                        f"Термін придатності закінчився {abs(days_left)} днів тому",
-                        "Контроль якості"
-                    )
-                elif days_left <= days_threshold:
-                    self.warning(
-                        f"Закінчується термін: {product.get_name()}",
-                        f"Залишилось {days_left} днів до закінчення терміну придатності",
-                        "Контроль якості"
-                    )
+            days_left = (product.get_expiration_date() - today).days
+            
+            if days_left < 0:
+                self.critical(
+                    f"Прострочений товар: {product.get_name()}",
+                    f"Термін придатності закінчився {abs(days_left)} днів тому",
+                    "Контроль якості"
+                )
+            else:
+                self.warning(
+                    f"Закінчується термін: {product.get_name()}",
+                    f"Залишилось {days_left} днів до закінчення терміну придатності",
+                    "Контроль якості"
+                )
@@ -0,0 +1,138 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from services.order_service import Order
+
+
+class OrderRepository:
+    def __init__(self, orders: Iterable[Order] = ()):
+        self._orders: Dict[str, Order] = {}
+        self._indexed: Dict[str, Tuple[str, float, Tuple[str, ...]]] = {}
+        self._by_status: Dict[str, Dict[str, Order]] = {}
+        self._by_sku: Dict[str, Dict[str, Order]] = {}
+        self._dates: List[datetime] = []
+        self._date_ids: List[str] = []
+        self._total_amount = 0.0
+        for order in orders:
+            self.add(order)
+
+    def add(self, order: Order) -> bool:
+        order_id = order.get_order_id()
+        if order_id in self._orders:
+            return False
+        self._orders[order_id] = order
+        created = order.get_created_date()
+        position = bisect_right(self._dates, created)
+        self._dates.insert(position, created)
+        self._date_ids.insert(position, order_id)
+        self._index(order)
+        return True
+
+    def remove(self, order_id: str) -> bool:
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return False
+        self._unindex(order_id)
+        position = self._date_position(order.get_created_date(), order_id)
+        del self._dates[position]
+        del self._date_ids[position]
+        return True
+
+    def reindex(self, order_id: str) -> bool:
+        order = self._orders.get(order_id)
+        if order is None:
+            return False
+        self._unindex(order_id)
+        self._index(order)
+        return True
+
+    def set_status(self, order_id: str, status: str) -> bool:
+        order = self._orders.get(order_id)
+        if order is None:
+            return False
+        order.set_status(status)
+        return self.reindex(order_id)
+
+    def get(self, order_id: str) -> Optional[Order]:
+        return self._orders.get(order_id)
+
+    def get_all(self) -> List[Order]:
+        return list(self._orders.values())
+
+    def iter_orders(self) -> Iterator[Order]:
+        return iter(self._orders.values())
+
+    def get_count(self) -> int:
+        return len(self._orders)
+
+    def get_total_amount(self) -> float:
+        return self._total_amount
+
+    def get_status_counts(self) -> Dict[str, int]:
+        return {status: len(orders) for status, orders in self._by_status.items()}
+
+    def get_by_status(self, status: str) -> List[Order]:
+        return list(self._by_status.get(status, {}).values())
+
+    def get_by_sku(self, sku: str) -> List[Order]:
+        return list(self._by_sku.get(sku, {}).values())
+
+    def get_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Order]:
+        first, last = self._date_span(start, end)
+        return [self._orders[order_id] for order_id in self._date_ids[first:last]]
+
+    def find(self, status: Optional[str] = None, start: Optional[datetime] = None,
+             end: Optional[datetime] = None, sku: Optional[str] = None) -> List[Order]:
+        first, last = self._date_span(start, end)
+        candidates = [(last - first, None)]
+        if status is not None:
+            candidates.append((len(self._by_status.get(status, {})), self._by_status.get(status, {})))
+        if sku is not None:
+            candidates.append((len(self._by_sku.get(sku, {})), self._by_sku.get(sku, {})))
+        _, bucket = min(candidates, key=lambda candidate: candidate[0])
+        if bucket is None:
+            orders = [self._orders[order_id] for order_id in self._date_ids[first:last]]
+        else:
+            orders = sorted(bucket.values(), key=lambda order: order.get_created_date())
+        return [order for order in orders
+                if (status is None or self._indexed[order.get_order_id()][0] == status)
+                and (start is None or order.get_created_date() >= start)
+                and (end is None or order.get_created_date() <= end)
+                and (sku is None or sku in self._indexed[order.get_order_id()][2])]
+
+    def _index(self, order: Order) -> None:
+        order_id = order.get_order_id()
+        status = order.get_status()
+        amount = order.get_total_amount()
+        skus = tuple(sku for sku, _ in order.get_items())
+        self._indexed[order_id] = (status, amount, skus)
+        self._by_status.setdefault(status, {})[order_id] = order
+        for sku in skus:
+            self._by_sku.setdefault(sku, {})[order_id] = order
+        self._total_amount += amount
+
+    def _unindex(self, order_id: str) -> None:
+        status, amount, skus = self._indexed.pop(order_id)
+        self._discard(self._by_status, status, order_id)
+        for sku in skus:
+            self._discard(self._by_sku, sku, order_id)
+        self._total_amount -= amount
+        if not self._indexed:
+            self._total_amount = 0.0
+
+    def _discard(self, index: Dict[str, Dict[str, Order]], key: str, order_id: str) -> None:
+        bucket = index[key]
+        del bucket[order_id]
+        if not bucket:
+            del index[key]
+
+    def _date_span(self, start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+        first = 0 if start is None else bisect_left(self._dates, start)
+        last = len(self._dates) if end is None else bisect_right(self._dates, end)
+        return first, last
+
+    def _date_position(self, created: datetime, order_id: str) -> int:
+        position = bisect_left(self._dates, created)
+        while self._date_ids[position] != order_id:
+            position += 1
+        return position
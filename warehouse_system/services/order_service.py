@@ -1,8 +1,8 @@
-from typing import List, Tuple
+from typing import Dict, ItemsView
 from datetime import datetime
 from interfaces.order_interface import IOrder
 from interfaces.warehouse_interface import IWarehouse
-import uuid
+from utils.id_generator import next_id
 
 
 class OrderStatus:
@@ -14,9 +14,10 @@ class OrderStatus:
 
 
 class Order(IOrder):
-    def __init__(self, order_id: str = None):
-        self._order_id = order_id or str(uuid.uuid4())[:8].upper()
-        self._items: List[Tuple[str, int]] = []
+    def __init__(self, order_id: str = None, priority: int = 0):
+        self._order_id = order_id or next_id()
+        self._items: Dict[str, int] = {}
+        self._priority = priority
         self._status = OrderStatus.PENDING
         self._created_date = datetime.now()
         self._total_amount = 0.0
@@ -24,25 +25,42 @@ class Order(IOrder):
     def get_order_id(self) -> str:
         return self._order_id
 
-    def get_items(self) -> List[Tuple[str, int]]:
-        return self._items.copy()
+    def get_items(self) -> ItemsView[str, int]:
+        return self._items.items()
+
+    def get_item_quantity(self, sku: str) -> int:
+        return self._items.get(sku, 0)
+
+    def get_item_count(self) -> int:
+        return len(self._items)
 
     def add_item(self, sku: str, quantity: int) -> bool:
         if quantity <= 0:
             return False
-        for i, (item_sku, item_qty) in enumerate(self._items):
-            if item_sku == sku:
-                self._items[i] = (sku, item_qty + quantity)
-                return True
-        self._items.append((sku, quantity))
+        self._items[sku] = self._items.get(sku, 0) + quantity
         return True
 
     def remove_item(self, sku: str) -> bool:
-        for i, (item_sku, _) in enumerate(self._items):
-            if item_sku == sku:
-                self._items.pop(i)
-                return True
-        return False
+        return self._items.pop(sku, None) is not None
+
+    def split(self, quantities: Dict[str, int], order_id: str = None) -> "Order":
+        backorder = Order(order_id or f"{self._order_id}-B", self._priority)
+        for sku, quantity in quantities.items():
+            remaining = self._items.get(sku, 0) - quantity
+            if quantity <= 0 or remaining < 0:
+                continue
+            if remaining:
+                self._items[sku] = remaining
+            else:
+                del self._items[sku]
+            backorder._items[sku] = quantity
+        return backorder
+
+    def get_priority(self) -> int:
+        return self._priority
+
+    def set_priority(self, priority: int) -> None:
+        self._priority = priority
 
     def get_status(self) -> str:
         return self._status
@@ -56,24 +74,55 @@ class Order(IOrder):
     def get_total_amount(self) -> float:
         return self._total_amount
 
+    def set_total_amount(self, amount: float) -> None:
+        self._total_amount = amount
+
     def calculate_total(self, warehouse: IWarehouse) -> float:
         total = 0.0
-        for sku, quantity in self._items:
-            product = warehouse.get_product(sku)
+        get_product = warehouse.get_product
+        for sku, quantity in self._items.items():
+            product = get_product(sku)
             if product:
                 total += product.get_price() * quantity
         self._total_amount = total
         return total
 
     def process_order(self, warehouse: IWarehouse) -> bool:
-        for sku, quantity in self._items:
+        if hasattr(warehouse, 'reserve_many'):
+            reservation_id = warehouse.reserve_many(self._items.items())
+            if reservation_id is None:
+                return False
+            warehouse.commit(reservation_id)
+            self._status = OrderStatus.PROCESSING
+            return True
+        for sku, quantity in self._items.items():
             product = warehouse.get_product(sku)
             if not product or product.get_quantity() < quantity:
                 return False
-        for sku, quantity in self._items:
+        for sku, quantity in self._items.items():
             warehouse.issue_product(sku, quantity)
         self._status = OrderStatus.PROCESSING
         return True
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self._order_id,
+            "items": list(self._items.items()),
+            "status": self._status,
+            "priority": self._priority,
+            "total": self._total_amount,
+            "created": self._created_date.isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Order":
+        order = cls(data["id"], data.get("priority", 0))
+        for sku, quantity in data["items"]:
+            order.add_item(sku, quantity)
+        order._status = data["status"]
+        order._total_amount = data["total"]
+        order._created_date = datetime.fromisoformat(data["created"])
+        return order
+
     def __str__(self) -> str:
         return f"Замовлення #{self._order_id} | Статус: {self._status} | Сума: {self._total_amount:.2f} грн."
@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import threading
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+from interfaces.product_interface import IProduct
+from services.warehouse_service import Warehouse
+from services.order_service import Order
+from services.wal_service import WriteAheadLog
+from utils.product_codec import product_to_dict, product_from_dict
+
+
+class PersistentWarehouse(Warehouse):
+    SNAPSHOT_PREFIX = "snapshot-"
+    SNAPSHOT_SUFFIX = ".jsonl"
+
+    def __init__(self, name: str, location: str, directory: str = "data/warehouse",
+                 snapshot_every: int = 10000, group_size: int = 64, sync_interval: float = 0.05,
+                 debug: bool = False):
+        super().__init__(name, location, debug)
+        self._directory = directory
+        self._snapshot_every = snapshot_every
+        self._orders: Dict[str, dict] = {}
+        self._since_snapshot = 0
+        self._snapshotter: Optional[threading.Thread] = None
+        self._replaying = True
+        self._recovery_stats = self._recover()
+        self._replaying = False
+        self._wal = WriteAheadLog(directory, self._recovery_stats["last_lsn"], group_size, sync_interval)
+
+    def add_product(self, product: IProduct) -> bool:
+        self._log(["add", product_to_dict(product)])
+        return super().add_product(product)
+
+    def remove_product(self, sku: str) -> bool:
+        self._log(["remove", sku])
+        return super().remove_product(sku)
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        self._log(["issue", sku, quantity])
+        return super().issue_product(sku, quantity)
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        self._log(["receive", sku, quantity])
+        return super().receive_product(sku, quantity)
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        self._log(["set", sku, quantity])
+        return super().update_product_quantity(sku, quantity)
+
+    def update_product_price(self, sku: str, price: float) -> bool:
+        self._log(["price", sku, price])
+        return super().update_product_price(sku, price)
+
+    def add_many(self, products: Iterable[IProduct]) -> bytearray:
+        products = list(products)
+        self._log(["add_many", [product_to_dict(product) for product in products]])
+        return super().add_many(products)
+
+    def issue_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        items = list(items)
+        self._log(["issue_many", items])
+        return super().issue_many(items)
+
+    def receive_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        items = list(items)
+        self._log(["receive_many", items])
+        return super().receive_many(items)
+
+    def reserve_many(self, items: Iterable[Tuple[str, int]]) -> Optional[str]:
+        items = list(items)
+        self._log(["reserve", items])
+        return super().reserve_many(items)
+
+    def commit(self, reservation_id: str) -> bool:
+        self._log(["commit", reservation_id])
+        return super().commit(reservation_id)
+
+    def release(self, reservation_id: str) -> bool:
+        self._log(["release", reservation_id])
+        return super().release(reservation_id)
+
+    def record_order(self, order: Order) -> None:
+        data = order.to_dict()
+        self._log(["order", data])
+        self._orders[data["id"]] = data
+
+    def get_recovered_orders(self) -> List[Order]:
+        return [Order.from_dict(data) for data in self._orders.values()]
+
+    def get_recovery_stats(self) -> dict:
+        return dict(self._recovery_stats)
+
+    def sync(self) -> None:
+        self._wal.sync()
+
+    def close(self) -> None:
+        self.wait_for_snapshot()
+        self._wal.close()
+
+    def snapshot(self) -> Optional[str]:
+        self.wait_for_snapshot()
+        return self._compact(self._rotate())
+
+    def wait_for_snapshot(self) -> None:
+        if self._snapshotter is not None:
+            self._snapshotter.join()
+            self._snapshotter = None
+
+    def _start_snapshot(self) -> None:
+        if self._snapshotter is not None and self._snapshotter.is_alive():
+            return
+        self._snapshotter = threading.Thread(target=self._compact, args=(self._rotate(),),
+                                             name="warehouse-snapshot", daemon=True)
+        self._snapshotter.start()
+
+    def _rotate(self) -> int:
+        lsn = self._wal.get_last_lsn()
+        self._wal.rotate()
+        self._since_snapshot = 0
+        return lsn
+
+    def _compact(self, lsn: int) -> Optional[str]:
+        replica = Warehouse(self._name, self._location)
+        orders: Dict[str, dict] = {}
+        snapshot_lsn = self._load_snapshot(replica, orders)
+        for record in WriteAheadLog.read(self._directory, snapshot_lsn):
+            if record[0] > lsn:
+                break
+            self._replay(replica, orders, record[1], record[2:])
+        if replica._reservations:
+            return None
+        filepath = os.path.join(self._directory, f"{self.SNAPSHOT_PREFIX}{lsn:020d}{self.SNAPSHOT_SUFFIX}")
+        temp_path = filepath + ".tmp"
+        header = {
+            "lsn": lsn,
+            "name": self._name,
+            "location": self._location,
+            "next_reservation": next(replica._reservation_ids),
+            "orders": list(orders.values())
+        }
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n")
+            for product in replica.iter_products():
+                f.write(json.dumps(product_to_dict(product), ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+        for snapshot_lsn, filename in self._list_snapshots():
+            if snapshot_lsn < lsn:
+                os.remove(os.path.join(self._directory, filename))
+        self._wal.truncate_before(lsn)
+        return filepath
+
+    def _log(self, record: list) -> None:
+        if self._replaying:
+            return
+        if self._since_snapshot >= self._snapshot_every:
+            self._start_snapshot()
+        self._wal.append(record)
+        self._since_snapshot += 1
+
+    def _recover(self) -> dict:
+        start = time.perf_counter()
+        repaired = WriteAheadLog.repair(self._directory)
+        snapshot_lsn = self._load_snapshot(self, self._orders)
+        last_lsn = snapshot_lsn
+        replayed = 0
+        for record in WriteAheadLog.read(self._directory, snapshot_lsn):
+            self._replay(self, self._orders, record[1], record[2:])
+            last_lsn = record[0]
+            replayed += 1
+        return {
+            "snapshot_lsn": snapshot_lsn,
+            "last_lsn": last_lsn,
+            "replayed": replayed,
+            "repaired_segments": repaired,
+            "products": len(self._products),
+            "seconds": time.perf_counter() - start
+        }
+
+    def _load_snapshot(self, warehouse: Warehouse, orders: Dict[str, dict]) -> int:
+        snapshots = self._list_snapshots()
+        if not snapshots:
+            return 0
+        with open(os.path.join(self._directory, snapshots[-1][1]), "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            warehouse.add_many(product_from_dict(json.loads(line)) for line in f)
+        orders.update((data["id"], data) for data in header["orders"])
+        warehouse._reservation_ids = count(header["next_reservation"])
+        return header["lsn"]
+
+    @staticmethod
+    def _replay(warehouse: Warehouse, orders: Dict[str, dict], operation: str, args: list) -> None:
+        if operation == "add":
+            warehouse.add_product(product_from_dict(args[0]))
+        elif operation == "add_many":
+            warehouse.add_many(product_from_dict(data) for data in args[0])
+        elif operation == "remove":
+            warehouse.remove_product(args[0])
+        elif operation == "issue":
+            warehouse.issue_product(args[0], args[1])
+        elif operation == "receive":
+            warehouse.receive_product(args[0], args[1])
+        elif operation == "set":
+            warehouse.update_product_quantity(args[0], args[1])
+        elif operation == "price":
+            warehouse.update_product_price(args[0], args[1])
+        elif operation == "issue_many":
+            warehouse.issue_many(tuple(item) for item in args[0])
+        elif operation == "receive_many":
+            warehouse.receive_many(tuple(item) for item in args[0])
+        elif operation == "reserve":
+            warehouse.reserve_many(tuple(item) for item in args[0])
+        elif operation == "commit":
+            warehouse.commit(args[0])
+        elif operation == "release":
+            warehouse.release(args[0])
+        elif operation == "order":
+            orders[args[0]["id"]] = args[0]
+
+    def _list_snapshots(self) -> List[Tuple[int, str]]:
+        if not os.path.exists(self._directory):
+            return []
+        snapshots = []
+        for filename in os.listdir(self._directory):
+            if filename.startswith(self.SNAPSHOT_PREFIX) and filename.endswith(self.SNAPSHOT_SUFFIX):
+                snapshots.append((int(filename[len(self.SNAPSHOT_PREFIX):-len(self.SNAPSHOT_SUFFIX)]), filename))
+        return sorted(snapshots)
@@ -0,0 +1,115 @@
+from abc import ABC, abstractmethod
+from typing import Any, FrozenSet, Iterable, Optional, Tuple
+from interfaces.product_interface import IProduct
+
+
+MISSING = object()
+VOLATILE_ATTRIBUTES = frozenset({"expired", "is_expired"})
+
+
+def attribute_value(product: IProduct, attribute: str) -> Any:
+    for name in (f"get_{attribute}", f"is_{attribute}", attribute if attribute.startswith("is_") else None):
+        getter = getattr(product, name, None) if name is not None else None
+        if getter is not None:
+            return getter()
+    return MISSING
+
+
+class Condition(ABC):
+    @abstractmethod
+    def matches(self, product: IProduct) -> bool:
+        pass
+
+    def __and__(self, other: "Condition") -> "And":
+        return And(self, other)
+
+    def __or__(self, other: "Condition") -> "Or":
+        return Or(self, other)
+
+
+class Eq(Condition):
+    def __init__(self, attribute: str, value: Any):
+        self._attribute = attribute
+        self._value = value
+
+    def get_attribute(self) -> str:
+        return self._attribute
+
+    def get_value(self) -> Any:
+        return self._value
+
+    def matches(self, product: IProduct) -> bool:
+        value = attribute_value(product, self._attribute)
+        return value is not MISSING and value == self._value
+
+    def __repr__(self) -> str:
+        return f"Eq({self._attribute!r}, {self._value!r})"
+
+
+class In(Condition):
+    def __init__(self, attribute: str, values: Iterable[Any]):
+        self._attribute = attribute
+        self._values = frozenset(values)
+
+    def get_attribute(self) -> str:
+        return self._attribute
+
+    def get_values(self) -> FrozenSet[Any]:
+        return self._values
+
+    def matches(self, product: IProduct) -> bool:
+        value = attribute_value(product, self._attribute)
+        return value is not MISSING and value in self._values
+
+    def __repr__(self) -> str:
+        return f"In({self._attribute!r}, {sorted(self._values, key=repr)!r})"
+
+
+class Range(Condition):
+    def __init__(self, attribute: str, low: Optional[Any] = None, high: Optional[Any] = None):
+        self._attribute = attribute
+        self._low = low
+        self._high = high
+
+    def get_attribute(self) -> str:
+        return self._attribute
+
+    def get_bounds(self) -> Tuple[Optional[Any], Optional[Any]]:
+        return self._low, self._high
+
+    def matches(self, product: IProduct) -> bool:
+        value = attribute_value(product, self._attribute)
+        if value is MISSING:
+            return False
+        return (self._low is None or value >= self._low) and (self._high is None or value <= self._high)
+
+    def __repr__(self) -> str:
+        return f"Range({self._attribute!r}, {self._low!r}, {self._high!r})"
+
+
+class And(Condition):
+    def __init__(self, *conditions: Condition):
+        self._conditions = conditions
+
+    def get_conditions(self) -> Tuple[Condition, ...]:
+        return self._conditions
+
+    def matches(self, product: IProduct) -> bool:
+        return all(condition.matches(product) for condition in self._conditions)
+
+    def __repr__(self) -> str:
+        return f"And{self._conditions!r}"
+
+
+class Or(Condition):
+    def __init__(self, *conditions: Condition):
+        self._conditions = conditions
+
+    def get_conditions(self) -> Tuple[Condition, ...]:
+        return self._conditions
+
+    def matches(self, product: IProduct) -> bool:
+        return any(condition.matches(product) for condition in self._conditions)
+
+    def __repr__(self) -> str:
+        return f"Or{self._conditions!r}"
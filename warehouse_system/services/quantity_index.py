@@ -0,0 +1,79 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from interfaces.product_interface import IProduct
+
+
+class QuantityIndex:
+    def __init__(self):
+        self._buckets: Dict[int, Dict[str, IProduct]] = {}
+        self._quantities: List[int] = []
+
+    def add(self, product: IProduct, quantity: Optional[int] = None) -> None:
+        if quantity is None:
+            quantity = product.get_quantity()
+        bucket = self._buckets.get(quantity)
+        if bucket is None:
+            bucket = self._buckets[quantity] = {}
+            insort(self._quantities, quantity)
+        bucket[product.get_sku()] = product
+
+    def remove(self, product: IProduct, quantity: Optional[int] = None) -> None:
+        if quantity is None:
+            quantity = product.get_quantity()
+        bucket = self._buckets[quantity]
+        del bucket[product.get_sku()]
+        if not bucket:
+            del self._buckets[quantity]
+            del self._quantities[bisect_left(self._quantities, quantity)]
+
+    def move(self, product: IProduct, old_quantity: int) -> None:
+        if product.get_quantity() != old_quantity:
+            self.remove(product, old_quantity)
+            self.add(product)
+
+    def add_many(self, products: Iterable[IProduct]) -> None:
+        touched: Set[int] = set()
+        for product in products:
+            quantity = product.get_quantity()
+            self._buckets.setdefault(quantity, {})[product.get_sku()] = product
+            touched.add(quantity)
+        self._sync(touched)
+
+    def move_many(self, changes: Iterable[Tuple[IProduct, int]]) -> None:
+        touched: Set[int] = set()
+        for product, old_quantity in changes:
+            quantity = product.get_quantity()
+            if quantity == old_quantity:
+                continue
+            sku = product.get_sku()
+            bucket = self._buckets[old_quantity]
+            del bucket[sku]
+            if not bucket:
+                del self._buckets[old_quantity]
+            self._buckets.setdefault(quantity, {})[sku] = product
+            touched.add(old_quantity)
+            touched.add(quantity)
+        self._sync(touched)
+
+    def range(self, low: Optional[int] = None, high: Optional[int] = None) -> List[IProduct]:
+        start = 0 if low is None else bisect_left(self._quantities, low)
+        end = len(self._quantities) if high is None else bisect_left(self._quantities, high)
+        result: List[IProduct] = []
+        for quantity in self._quantities[start:end]:
+            result.extend(self._buckets[quantity].values())
+        return result
+
+    def below(self, threshold: int) -> List[IProduct]:
+        return self.range(high=threshold)
+
+    def _sync(self, touched: Set[int]) -> None:
+        if len(touched) > len(self._quantities) // 8:
+            self._quantities = sorted(self._buckets)
+            return
+        for quantity in touched:
+            index = bisect_left(self._quantities, quantity)
+            listed = index < len(self._quantities) and self._quantities[index] == quantity
+            if quantity in self._buckets and not listed:
+                self._quantities.insert(index, quantity)
+            elif quantity not in self._buckets and listed:
+                del self._quantities[index]
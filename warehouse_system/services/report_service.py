@@ -123,13 +123,18 @@ class SalesReport(IReport):
     def generate(self) -> str:
         self._generated_date = datetime.now()
         
-        total_orders = len(self._orders)
-        total_revenue = sum(order.get_total_amount() for order in self._orders)
-        status_counts = {}
-        
-        for order in self._orders:
-            status = order.get_status()
-            status_counts[status] = status_counts.get(status, 0) + 1
+        if hasattr(self._orders, 'get_status_counts'):
+            total_orders = self._orders.get_count()
+            total_revenue = self._orders.get_total_amount()
+            status_counts = self._orders.get_status_counts()
+        else:
+            total_orders = len(self._orders)
+            total_revenue = sum(order.get_total_amount() for order in self._orders)
+            status_counts = {}
+
+            for order in self._orders:
+                status = order.get_status()
+                status_counts[status] = status_counts.get(status, 0) + 1
         
         self._report_data = {
             "загальна_кількість_замовлень": total_orders,
@@ -0,0 +1,131 @@
+import heapq
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class SearchIndex:
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        self._texts: Dict[str, Tuple[str, str]] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = 0
+        self._postings: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+
+    def add(self, sku: str, name: str, description: str) -> None:
+        if sku in self._texts:
+            self.remove(sku)
+        name_lower = name.lower()
+        description_lower = description.lower()
+        self._texts[sku] = (name_lower, description_lower)
+        self._order[sku] = self._counter
+        self._counter += 1
+        for token in set(name_lower.split()) | set(description_lower.split()):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                fuzzy_grams = self._fuzzy_grams(token)
+                for gram in self._token_grams(token) | fuzzy_grams:
+                    self._grams.setdefault(gram, set()).add(token)
+                self._trigram_counts[token] = len(fuzzy_grams)
+            postings.add(sku)
+
+    def remove(self, sku: str) -> bool:
+        texts = self._texts.pop(sku, None)
+        if texts is None:
+            return False
+        del self._order[sku]
+        name_lower, description_lower = texts
+        for token in set(name_lower.split()) | set(description_lower.split()):
+            postings = self._postings[token]
+            postings.discard(sku)
+            if not postings:
+                del self._postings[token]
+                del self._trigram_counts[token]
+                for gram in self._token_grams(token) | self._fuzzy_grams(token):
+                    tokens = self._grams[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._grams[gram]
+        return True
+
+    def search(self, keyword: str) -> List[str]:
+        keyword_lower = keyword.lower()
+        parts = keyword_lower.split()
+        if len(parts) == 1 and parts[0] == keyword_lower:
+            matches = self._skus_containing(keyword_lower)
+        else:
+            candidates = self._skus_containing(parts[0]) if parts else self._texts.keys()
+            for part in parts[1:]:
+                if not candidates:
+                    break
+                candidates &= self._skus_containing(part)
+            matches = [sku for sku in candidates
+                       if keyword_lower in self._texts[sku][0] or
+                          keyword_lower in self._texts[sku][1]]
+        return sorted(matches, key=self._order.__getitem__)
+
+    def fuzzy_search(self, query: str, limit: int = 10, min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        words = query.lower().split()
+        if not words:
+            return []
+        matches = [tokens for tokens in (self._similar_tokens(word, min_similarity) for word in words) if tokens]
+        if not matches:
+            return []
+        matches.sort(key=lambda tokens: sum(len(self._postings[token]) for token, _ in tokens))
+        scores: Dict[str, float] = {}
+        for token, similarity in matches[0]:
+            for sku in self._postings[token]:
+                if similarity > scores.get(sku, 0.0):
+                    scores[sku] = similarity
+        candidates = set(scores)
+        for tokens in matches[1:]:
+            best: Dict[str, float] = {}
+            for token, similarity in tokens:
+                for sku in self._postings[token] & candidates:
+                    if similarity > best.get(sku, 0.0):
+                        best[sku] = similarity
+            for sku, similarity in best.items():
+                scores[sku] += similarity
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -self._order[item[0]]))
+        return [(sku, score / len(words)) for sku, score in ranked]
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _skus_containing(self, fragment: str) -> Set[str]:
+        result: Set[str] = set()
+        for token in self._tokens_containing(fragment):
+            result |= self._postings[token]
+        return result
+
+    def _tokens_containing(self, fragment: str) -> Iterable[str]:
+        if len(fragment) <= self.GRAM_SIZE:
+            return self._grams.get(fragment, ())
+        grams = sorted((self._grams.get(gram, set()) for gram in self._token_grams(fragment, exact=True)),
+                       key=len)
+        if not grams[0]:
+            return ()
+        return [token for token in grams[0].intersection(*grams[1:]) if fragment in token]
+
+    def _similar_tokens(self, word: str, min_similarity: float) -> List[Tuple[str, float]]:
+        grams = self._fuzzy_grams(word)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for token in self._grams.get(gram, ()):
+                shared[token] = shared.get(token, 0) + 1
+        similar = []
+        for token, count in shared.items():
+            similarity = 2.0 * count / (len(grams) + self._trigram_counts[token])
+            if similarity >= min_similarity:
+                similar.append((token, similarity))
+        return similar
+
+    def _fuzzy_grams(self, token: str) -> Set[str]:
+        padded = f"  {token} "
+        return {padded[i:i + self.GRAM_SIZE] for i in range(len(padded) - self.GRAM_SIZE + 1)}
+
+    def _token_grams(self, token: str, exact: bool = False) -> Set[str]:
+        sizes = (self.GRAM_SIZE,) if exact else range(1, self.GRAM_SIZE + 1)
+        return {token[i:i + size] for size in sizes for i in range(len(token) - size + 1)}
@@ -0,0 +1,78 @@
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterable, List, Optional
+
+
+class SkuIndex:
+    BLOCK_SIZE = 512
+
+    def __init__(self):
+        self._blocks: List[List[str]] = []
+        self._maxes: List[str] = []
+        self._count = 0
+
+    def add(self, sku: str) -> None:
+        if not self._blocks:
+            self._blocks.append([sku])
+            self._maxes.append(sku)
+            self._count = 1
+            return
+        position = min(bisect_left(self._maxes, sku), len(self._maxes) - 1)
+        block = self._blocks[position]
+        index = bisect_left(block, sku)
+        if index < len(block) and block[index] == sku:
+            return
+        block.insert(index, sku)
+        self._maxes[position] = block[-1]
+        self._count += 1
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks[position:position + 1] = [block[:self.BLOCK_SIZE], block[self.BLOCK_SIZE:]]
+            self._maxes.insert(position, block[self.BLOCK_SIZE - 1])
+
+    def remove(self, sku: str) -> bool:
+        position = bisect_left(self._maxes, sku)
+        if position == len(self._maxes):
+            return False
+        block = self._blocks[position]
+        index = bisect_left(block, sku)
+        if index == len(block) or block[index] != sku:
+            return False
+        del block[index]
+        self._count -= 1
+        if block:
+            self._maxes[position] = block[-1]
+        else:
+            del self._blocks[position]
+            del self._maxes[position]
+        return True
+
+    def add_many(self, skus: Iterable[str]) -> None:
+        skus = list(skus)
+        if len(skus) > self._count // 8:
+            self._rebuild(sorted(set(chain.from_iterable(self._blocks)).union(skus)))
+            return
+        for sku in skus:
+            self.add(sku)
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        result: List[str] = []
+        position = bisect_left(self._maxes, prefix)
+        if position == len(self._blocks):
+            return result
+        index = bisect_left(self._blocks[position], prefix)
+        for block_position in range(position, len(self._blocks)):
+            block = self._blocks[block_position]
+            for sku in block[index:] if index else block:
+                if not sku.startswith(prefix) or (limit is not None and len(result) >= limit):
+                    return result
+                result.append(sku)
+            index = 0
+        return result
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _rebuild(self, skus: List[str]) -> None:
+        self._blocks = [skus[start:start + self.BLOCK_SIZE] for start in range(0, len(skus), self.BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._count = len(skus)
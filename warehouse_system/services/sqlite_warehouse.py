@@ -0,0 +1,259 @@
+import json
+import sqlite3
+import threading
+from datetime import date
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from utils.lots import add_lot, take_lots
+from utils.product_codec import product_to_dict, product_from_dict
+
+
+class SqliteWarehouse(IWarehouse):
+    BASE_FIELDS = ("sku", "name", "price", "quantity", "category", "description", "type")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS products (
+            sku TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            name_lower TEXT NOT NULL,
+            description_lower TEXT NOT NULL,
+            category TEXT NOT NULL,
+            type TEXT,
+            price REAL NOT NULL,
+            quantity INTEGER NOT NULL,
+            expiration_date TEXT,
+            attributes TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_products_category ON products (category);
+        CREATE INDEX IF NOT EXISTS idx_products_quantity ON products (quantity);
+        CREATE INDEX IF NOT EXISTS idx_products_expiration ON products (expiration_date)
+            WHERE expiration_date IS NOT NULL;
+    """
+
+    SELECT = "SELECT sku, name, price, quantity, category, description, type, attributes FROM products"
+    INSERT = ("INSERT INTO products (sku, name, description, name_lower, description_lower, category, type, "
+              "price, quantity, expiration_date, attributes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, name: str, location: str, path: str = ":memory:"):
+        self._name = name
+        self._location = location
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_location(self) -> str:
+        return self._location
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def add_product(self, product: IProduct) -> bool:
+        self.add_many([product])
+        return True
+
+    def add_many(self, products: Iterable[IProduct]) -> bytearray:
+        added = 0
+        rows = []
+        with self._lock, self._connection:
+            for product in products:
+                added += 1
+                if not hasattr(product, 'get_lots'):
+                    rows.append(self._to_row(product))
+                    continue
+                self._insert_rows(rows)
+                rows = []
+                self._add_lots(product)
+            self._insert_rows(rows)
+        return bytearray(b"\x01" * added)
+
+    def remove_product(self, sku: str) -> bool:
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM products WHERE sku = ?", (sku,))
+        return cursor.rowcount > 0
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        if quantity == 0:
+            return self._exists(sku)
+        return bool(self.issue_many([(sku, quantity)])[0])
+
+    def issue_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        results = bytearray()
+        with self._lock, self._connection:
+            for sku, quantity in items:
+                cursor = self._connection.execute(
+                    "UPDATE products SET quantity = quantity - ? "
+                    "WHERE sku = ? AND ? > 0 AND quantity >= ? AND type IS NOT 'food'",
+                    (quantity, sku, quantity, quantity))
+                issued = cursor.rowcount or (self._change_lots(sku, -quantity) if quantity > 0 else 0)
+                results.append(issued)
+                if issued:
+                    self._connection.execute("DELETE FROM products WHERE sku = ? AND quantity = 0", (sku,))
+        return results
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        if quantity == 0:
+            return self._exists(sku)
+        return bool(self.receive_many([(sku, quantity)])[0])
+
+    def receive_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        results = bytearray()
+        with self._lock, self._connection:
+            for sku, quantity in items:
+                cursor = self._connection.execute(
+                    "UPDATE products SET quantity = quantity + ? WHERE sku = ? AND ? > 0 AND type IS NOT 'food'",
+                    (quantity, sku, quantity))
+                results.append(cursor.rowcount or (self._change_lots(sku, quantity) if quantity > 0 else 0))
+        return results
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "UPDATE products SET quantity = CASE WHEN ? >= 0 THEN ? ELSE quantity END "
+                "WHERE sku = ? AND type IS NOT 'food'", (quantity, quantity, sku))
+            if cursor.rowcount:
+                return True
+            stock = self._stock(sku)
+            if stock is None:
+                return False
+            if quantity >= 0:
+                self._change_lots(sku, quantity - stock[0])
+        return True
+
+    def get_product(self, sku: str) -> Optional[IProduct]:
+        row = self._connection.execute(f"{self.SELECT} WHERE sku = ?", (sku,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def get_all_products(self) -> List[IProduct]:
+        return self._query(f"{self.SELECT} ORDER BY rowid")
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return map(self._from_row, self._connection.execute(f"{self.SELECT} ORDER BY rowid"))
+
+    def page(self, offset: int, limit: int, key: Optional[Callable[[IProduct], Any]] = None,
+             predicate: Optional[Callable[[IProduct], bool]] = None, reverse: bool = False) -> List[IProduct]:
+        if key is not None or predicate is not None:
+            return super().page(offset, limit, key, predicate, reverse)
+        return self._query(f"{self.SELECT} ORDER BY rowid LIMIT ? OFFSET ?", (limit, offset))
+
+    def get_product_count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def inventory_check(self) -> dict:
+        categories = {}
+        count = units = 0
+        value = 0.0
+        for category, category_count, category_units, category_value in self._connection.execute(
+                "SELECT category, COUNT(*), SUM(quantity), SUM(price * quantity) FROM products "
+                "GROUP BY category ORDER BY MIN(rowid)"):
+            categories[category] = {"кількість_товарів": category_count, "кількість_одиниць": category_units,
+                                    "вартість": category_value}
+            count += category_count
+            units += category_units
+            value += category_value
+        return {
+            "назва_складу": self._name,
+            "локація": self._location,
+            "загальна_кількість_товарів": count,
+            "загальна_кількість_одиниць": units,
+            "загальна_вартість": value,
+            "категорії": categories
+        }
+
+    def get_total_value(self) -> float:
+        return self._connection.execute("SELECT TOTAL(price * quantity) FROM products").fetchone()[0]
+
+    def search_products(self, keyword: str) -> List[IProduct]:
+        keyword_lower = keyword.lower()
+        return self._query(f"{self.SELECT} WHERE instr(name_lower, ?) > 0 OR instr(description_lower, ?) > 0 "
+                           "ORDER BY rowid", (keyword_lower, keyword_lower))
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        return self._query(f"{self.SELECT} WHERE category = ? ORDER BY rowid", (category,))
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        return self._query(f"{self.SELECT} WHERE quantity < ? ORDER BY quantity", (threshold,))
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        return self._query(f"{self.SELECT} WHERE expiration_date IS NOT NULL AND expiration_date BETWEEN ? AND ? "
+                           "ORDER BY expiration_date",
+                           (since.isoformat() if since is not None else "", until.isoformat()))
+
+    def get_categories(self) -> List[str]:
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT category FROM products")]
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[IProduct]:
+        return [self._from_row(row) for row in self._connection.execute(sql, parameters)]
+
+    def _exists(self, sku: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM products WHERE sku = ?", (sku,)).fetchone() is not None
+
+    def _insert_rows(self, rows: List[tuple]) -> None:
+        cursor = self._connection.executemany(
+            f"{self.INSERT} ON CONFLICT (sku) DO UPDATE SET quantity = quantity + excluded.quantity "
+            "WHERE products.type IS NOT 'food'", rows)
+        if cursor.rowcount < len(rows):
+            for row in rows:
+                self._change_lots(row[0], row[8])
+
+    def _stock(self, sku: str) -> Optional[Tuple[int, dict, List[list]]]:
+        row = self._connection.execute(
+            "SELECT quantity, attributes FROM products WHERE sku = ? AND type = 'food'", (sku,)).fetchone()
+        if row is None:
+            return None
+        quantity, attributes = row[0], json.loads(row[1])
+        lots = [[date.fromisoformat(expiration_date), lot_quantity]
+                for expiration_date, lot_quantity in attributes.get("lots") or
+                [[attributes["expiration_date"], quantity]]]
+        return quantity, attributes, lots
+
+    def _change_lots(self, sku: str, delta: int) -> int:
+        stock = self._stock(sku)
+        if stock is None or stock[0] + delta < 0:
+            return 0
+        quantity, attributes, lots = stock
+        if delta < 0:
+            take_lots(lots, -delta)
+        elif delta > 0:
+            add_lot(lots, delta)
+        self._write_lots(sku, quantity + delta, attributes, lots)
+        return 1
+
+    def _add_lots(self, product: IProduct) -> None:
+        stock = self._stock(product.get_sku())
+        if stock is None:
+            self._insert_rows([self._to_row(product)])
+            return
+        quantity, attributes, lots = stock
+        for expiration_date, lot_quantity in product.get_lots():
+            add_lot(lots, lot_quantity, expiration_date)
+        self._write_lots(product.get_sku(), quantity + product.get_quantity(), attributes, lots)
+
+    def _write_lots(self, sku: str, quantity: int, attributes: dict, lots: List[list]) -> None:
+        attributes["expiration_date"] = lots[0][0].isoformat()
+        attributes.pop("lots", None)
+        if len(lots) > 1:
+            attributes["lots"] = [[expiration_date.isoformat(), lot_quantity]
+                                  for expiration_date, lot_quantity in lots]
+        self._connection.execute(
+            "UPDATE products SET quantity = ?, expiration_date = ?, attributes = ? WHERE sku = ?",
+            (quantity, attributes["expiration_date"], json.dumps(attributes, ensure_ascii=False), sku))
+
+    def _to_row(self, product: IProduct) -> tuple:
+        data = product_to_dict(product)
+        attributes = {key: value for key, value in data.items() if key not in self.BASE_FIELDS}
+        return (data["sku"], data["name"], data["description"], data["name"].lower(),
+                data["description"].lower(), data["category"], data.get("type"), data["price"],
+                data["quantity"], data.get("expiration_date"), json.dumps(attributes, ensure_ascii=False))
+
+    def _from_row(self, row: tuple) -> IProduct:
+        data = dict(zip(self.BASE_FIELDS, row))
+        data.update(json.loads(row[7]))
+        return product_from_dict(data)
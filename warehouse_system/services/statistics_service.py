@@ -8,52 +8,49 @@ class StatisticsService:
         self._warehouse = warehouse
 
     def get_category_distribution(self) -> Dict[str, int]:
-        distribution = {}
-        for product in self._warehouse.get_all_products():
-            category = product.get_category()
-            distribution[category] = distribution.get(category, 0) + 1
-        return distribution
+        categories = self._warehouse.inventory_check()["категорії"]
+        return {category: data["кількість_товарів"] for category, data in categories.items()}
 
     def get_value_distribution(self) -> Dict[str, float]:
-        distribution = {}
-        for product in self._warehouse.get_all_products():
-            category = product.get_category()
-            value = product.get_price() * product.get_quantity()
-            distribution[category] = distribution.get(category, 0.0) + value
-        return distribution
+        categories = self._warehouse.inventory_check()["категорії"]
+        return {category: data["вартість"] for category, data in categories.items()}
 
     def get_top_products_by_value(self, count: int = 5) -> List[Tuple[str, float]]:
-        products = self._warehouse.get_all_products()
-        valued = [(p.get_name(), p.get_price() * p.get_quantity()) for p in products]
-        valued.sort(key=lambda x: x[1], reverse=True)
-        return valued[:count]
+        products = self._warehouse.page(0, count, key=lambda p: p.get_price() * p.get_quantity(), reverse=True)
+        return [(p.get_name(), p.get_price() * p.get_quantity()) for p in products]
 
     def get_top_products_by_quantity(self, count: int = 5) -> List[Tuple[str, int]]:
-        products = self._warehouse.get_all_products()
-        quantified = [(p.get_name(), p.get_quantity()) for p in products]
-        quantified.sort(key=lambda x: x[1], reverse=True)
-        return quantified[:count]
+        products = self._warehouse.page(0, count, key=lambda p: p.get_quantity(), reverse=True)
+        return [(p.get_name(), p.get_quantity()) for p in products]
 
     def get_price_range(self) -> Dict[str, float]:
-        products = self._warehouse.get_all_products()
-        if not products:
+        lowest = highest = None
+        total = 0.0
+        count = 0
+        for p in self._warehouse.iter_products():
+            price = p.get_price()
+            if count == 0 or price < lowest:
+                lowest = price
+            if count == 0 or price > highest:
+                highest = price
+            total += price
+            count += 1
+        if not count:
             return {"мінімум": 0, "максимум": 0, "середня": 0}
-        prices = [p.get_price() for p in products]
         return {
-            "мінімум": min(prices),
-            "максимум": max(prices),
-            "середня": sum(prices) / len(prices)
+            "мінімум": lowest,
+            "максимум": highest,
+            "середня": total / count
         }
 
     def get_stock_health(self) -> Dict[str, int]:
-        products = self._warehouse.get_all_products()
         health = {
             "критично_низький": 0,
             "низький": 0,
             "нормальний": 0,
             "високий": 0
         }
-        for p in products:
+        for p in self._warehouse.iter_products():
             qty = p.get_quantity()
             if qty <= 5:
                 health["критично_низький"] += 1
@@ -66,16 +63,16 @@ class StatisticsService:
         return health
 
     def get_summary(self) -> Dict:
-        products = self._warehouse.get_all_products()
-        total_items = sum(p.get_quantity() for p in products)
-        total_value = self._warehouse.get_total_value()
+        inventory = self._warehouse.inventory_check()
+        products_count = inventory["загальна_кількість_товарів"]
+        total_value = inventory["загальна_вартість"]
         
         return {
-            "загальна_кількість_товарів": len(products),
-            "загальна_кількість_одиниць": total_items,
+            "загальна_кількість_товарів": products_count,
+            "загальна_кількість_одиниць": inventory["загальна_кількість_одиниць"],
             "загальна_вартість": total_value,
-            "середня_вартість_товару": total_value / len(products) if products else 0,
-            "кількість_категорій": len(self.get_category_distribution()),
+            "середня_вартість_товару": total_value / products_count if products_count else 0,
+            "кількість_категорій": len(inventory["категорії"]),
             "дата_аналізу": datetime.now().strftime("%d.%m.%Y %H:%M")
         }
 
@@ -0,0 +1,126 @@
+import os
+import json
+import time
+import threading
+from typing import Iterator, List, Tuple
+
+
+class WriteAheadLog:
+    SEGMENT_PREFIX = "wal-"
+    SEGMENT_SUFFIX = ".log"
+
+    def __init__(self, directory: str, last_lsn: int = 0, group_size: int = 64, sync_interval: float = 0.05):
+        self._directory = directory
+        self._group_size = group_size
+        self._sync_interval = sync_interval
+        self._lsn = last_lsn
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._file = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        self._open_segment()
+        self._syncer = None
+        if sync_interval > 0:
+            self._syncer = threading.Thread(target=self._sync_loop, name="wal-sync", daemon=True)
+            self._syncer.start()
+
+    def get_last_lsn(self) -> int:
+        return self._lsn
+
+    def append(self, record: list) -> int:
+        with self._lock:
+            self._lsn += 1
+            self._file.write(json.dumps([self._lsn] + record, ensure_ascii=False, separators=(",", ":")))
+            self._file.write("\n")
+            self._file.flush()
+            self._pending += 1
+            if self._pending >= self._group_size or time.monotonic() - self._last_sync >= self._sync_interval:
+                self._sync()
+            return self._lsn
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def rotate(self) -> None:
+        with self._lock:
+            self._sync()
+            self._file.close()
+            self._open_segment()
+
+    def truncate_before(self, lsn: int) -> int:
+        removed = 0
+        current = os.path.basename(self._file.name)
+        for first_lsn, filename in self.list_segments(self._directory):
+            if filename != current and first_lsn <= lsn:
+                os.remove(os.path.join(self._directory, filename))
+                removed += 1
+        return removed
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+        with self._lock:
+            if self._file and not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def _sync(self) -> None:
+        if self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def _sync_loop(self) -> None:
+        while not self._closed.wait(self._sync_interval):
+            with self._lock:
+                if self._pending and not self._file.closed:
+                    self._sync()
+
+    def _open_segment(self) -> None:
+        filename = f"{self.SEGMENT_PREFIX}{self._lsn + 1:020d}{self.SEGMENT_SUFFIX}"
+        self._file = open(os.path.join(self._directory, filename), "a", encoding="utf-8")
+
+    @classmethod
+    def list_segments(cls, directory: str) -> List[Tuple[int, str]]:
+        if not os.path.exists(directory):
+            return []
+        segments = []
+        for filename in os.listdir(directory):
+            if filename.startswith(cls.SEGMENT_PREFIX) and filename.endswith(cls.SEGMENT_SUFFIX):
+                segments.append((int(filename[len(cls.SEGMENT_PREFIX):-len(cls.SEGMENT_SUFFIX)]), filename))
+        return sorted(segments)
+
+    @classmethod
+    def repair(cls, directory: str) -> int:
+        repaired = 0
+        for _, filename in cls.list_segments(directory):
+            with open(os.path.join(directory, filename), "rb+") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        intact = line.endswith(b"\n") and isinstance(json.loads(line), list)
+                    except ValueError:
+                        intact = False
+                    if not intact:
+                        f.truncate(offset)
+                        repaired += 1
+                        break
+                    offset += len(line)
+        return repaired
+
+    @classmethod
+    def read(cls, directory: str, after_lsn: int = 0) -> Iterator[list]:
+        for _, filename in cls.list_segments(directory):
+            with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    if record[0] > after_lsn:
+                        yield record
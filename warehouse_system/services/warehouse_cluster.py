@@ -0,0 +1,202 @@
+import heapq
+import zlib
+from datetime import date
+from itertools import chain, count, islice
+from operator import methodcaller
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from interfaces.warehouse_interface import IWarehouse
+from interfaces.product_interface import IProduct
+from services.mapped_warehouse import MappedWarehouse
+from services.warehouse_service import CasResult
+
+
+class WarehouseCluster(IWarehouse):
+    def __init__(self, name: str, location: str, shards: List[IWarehouse], executor: Optional[Executor] = None):
+        self._name = name
+        self._location = location
+        self._shards = list(shards)
+        self._executor = executor or ThreadPoolExecutor(max_workers=len(self._shards),
+                                                        thread_name_prefix="warehouse-shard")
+        self._owns_executor = executor is None
+        self._reservation_ids = count(1)
+        self._reservations: Dict[str, List[Tuple[IWarehouse, str]]] = {}
+        if not isinstance(self._executor, ThreadPoolExecutor) and \
+                not all(isinstance(shard, MappedWarehouse) for shard in self._shards):
+            raise TypeError("Пул процесів підтримує лише шарди MappedWarehouse, "
+                            "інші шарди обслуговуються пулом потоків")
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_location(self) -> str:
+        return self._location
+
+    def get_shards(self) -> List[IWarehouse]:
+        return list(self._shards)
+
+    def shard_for(self, sku: str) -> IWarehouse:
+        return self._shards[self._shard_index(sku)]
+
+    def add_product(self, product: IProduct) -> bool:
+        return self.shard_for(product.get_sku()).add_product(product)
+
+    def remove_product(self, sku: str) -> bool:
+        return self.shard_for(sku).remove_product(sku)
+
+    def issue_product(self, sku: str, quantity: int) -> bool:
+        return self.shard_for(sku).issue_product(sku, quantity)
+
+    def receive_product(self, sku: str, quantity: int) -> bool:
+        return self.shard_for(sku).receive_product(sku, quantity)
+
+    def update_product_quantity(self, sku: str, quantity: int) -> bool:
+        return self.shard_for(sku).update_product_quantity(sku, quantity)
+
+    def update_product_price(self, sku: str, price: float) -> bool:
+        return self.shard_for(sku).update_product_price(sku, price)
+
+    def reserve_many(self, items: Iterable[Tuple[str, int]]) -> Optional[str]:
+        grouped: Dict[int, List[Tuple[str, int]]] = {}
+        for sku, quantity in items:
+            grouped.setdefault(self._shard_index(sku), []).append((sku, quantity))
+        reserved: List[Tuple[IWarehouse, str]] = []
+        for index, shard_items in grouped.items():
+            shard = self._shards[index]
+            reservation_id = shard.reserve_many(shard_items)
+            if reservation_id is None:
+                for reserved_shard, reserved_id in reserved:
+                    reserved_shard.release(reserved_id)
+                return None
+            reserved.append((shard, reservation_id))
+        reservation_id = f"RES-{next(self._reservation_ids)}"
+        self._reservations[reservation_id] = reserved
+        return reservation_id
+
+    def commit(self, reservation_id: str) -> bool:
+        reserved = self._reservations.pop(reservation_id, None)
+        if reserved is None:
+            return False
+        for shard, shard_reservation_id in reserved:
+            shard.commit(shard_reservation_id)
+        return True
+
+    def release(self, reservation_id: str) -> bool:
+        reserved = self._reservations.pop(reservation_id, None)
+        if reserved is None:
+            return False
+        for shard, shard_reservation_id in reserved:
+            shard.release(shard_reservation_id)
+        return True
+
+    def get_reserved_items(self, reservation_id: str) -> List[Tuple[str, int]]:
+        return [item for shard, shard_reservation_id in self._reservations.get(reservation_id, [])
+                for item in shard.get_reserved_items(shard_reservation_id)]
+
+    def get_reserved_products(self, reservation_id: str) -> Dict[str, IProduct]:
+        products: Dict[str, IProduct] = {}
+        for shard, shard_reservation_id in self._reservations.get(reservation_id, []):
+            products.update(shard.get_reserved_products(shard_reservation_id))
+        return products
+
+    def get_product_version(self, sku: str) -> Optional[int]:
+        return self.shard_for(sku).get_product_version(sku)
+
+    def compare_and_issue(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        return self.shard_for(sku).compare_and_issue(sku, quantity, expected_version)
+
+    def compare_and_receive(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        return self.shard_for(sku).compare_and_receive(sku, quantity, expected_version)
+
+    def compare_and_set_quantity(self, sku: str, quantity: int, expected_version: Optional[int]) -> CasResult:
+        return self.shard_for(sku).compare_and_set_quantity(sku, quantity, expected_version)
+
+    def issue_with_retry(self, sku: str, quantity: int, attempts: int = 8) -> CasResult:
+        return self.shard_for(sku).issue_with_retry(sku, quantity, attempts)
+
+    def receive_with_retry(self, sku: str, quantity: int, attempts: int = 8) -> CasResult:
+        return self.shard_for(sku).receive_with_retry(sku, quantity, attempts)
+
+    def update_with_retry(self, sku: str, compute: Callable[[int], Optional[int]], attempts: int = 8) -> CasResult:
+        return self.shard_for(sku).update_with_retry(sku, compute, attempts)
+
+    def get_product(self, sku: str) -> Optional[IProduct]:
+        return self.shard_for(sku).get_product(sku)
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        pages = self._fan_out("get_expiring_products", until, since)
+        return list(heapq.merge(*pages, key=lambda product: product.get_expiration_date()))
+
+    def get_products_by_sku_prefix(self, prefix: str, limit: Optional[int] = None) -> List[IProduct]:
+        pages = self._fan_out("get_products_by_sku_prefix", prefix, limit)
+        return list(islice(heapq.merge(*pages, key=lambda product: product.get_sku()), limit))
+
+    def get_all_products(self) -> List[IProduct]:
+        return [product for products in self._fan_out("get_all_products")
+                for product in products]
+
+    def iter_products(self) -> Iterator[IProduct]:
+        return chain.from_iterable(shard.iter_products() for shard in self._shards)
+
+    def page(self, offset: int, limit: int, key: Optional[Callable[[IProduct], Any]] = None,
+             predicate: Optional[Callable[[IProduct], bool]] = None, reverse: bool = False) -> List[IProduct]:
+        if key is None:
+            return super().page(offset, limit, key, predicate, reverse)
+        pages = self._fan_out("page", 0, offset + limit, key, predicate, reverse)
+        return list(islice(heapq.merge(*pages, key=key, reverse=reverse), offset, offset + limit))
+
+    def get_product_count(self) -> int:
+        return sum(self._fan_out("get_product_count"))
+
+    def inventory_check(self) -> dict:
+        result = {
+            "назва_складу": self._name,
+            "локація": self._location,
+            "загальна_кількість_товарів": 0,
+            "загальна_кількість_одиниць": 0,
+            "загальна_вартість": 0.0,
+            "категорії": {}
+        }
+        for inventory in self._fan_out("inventory_check"):
+            result["загальна_кількість_товарів"] += inventory["загальна_кількість_товарів"]
+            result["загальна_кількість_одиниць"] += inventory["загальна_кількість_одиниць"]
+            result["загальна_вартість"] += inventory["загальна_вартість"]
+            for category, data in inventory["категорії"].items():
+                if category not in result["категорії"]:
+                    result["категорії"][category] = {"кількість_товарів": 0, "кількість_одиниць": 0, "вартість": 0.0}
+                merged = result["категорії"][category]
+                merged["кількість_товарів"] += data["кількість_товарів"]
+                merged["кількість_одиниць"] += data["кількість_одиниць"]
+                merged["вартість"] += data["вартість"]
+        return result
+
+    def get_total_value(self) -> float:
+        return sum(self._fan_out("get_total_value"))
+
+    def search_products(self, keyword: str) -> List[IProduct]:
+        return [product for products in self._fan_out("search_products", keyword)
+                for product in products]
+
+    def get_products_by_category(self, category: str) -> List[IProduct]:
+        return [product for products in self._fan_out("get_products_by_category", category)
+                for product in products]
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
+        per_shard = self._fan_out("get_low_stock_products", threshold)
+        return list(heapq.merge(*per_shard, key=lambda product: product.get_quantity()))
+
+    def get_categories(self) -> List[str]:
+        categories = {}
+        for shard_categories in self._fan_out("get_categories"):
+            categories.update(dict.fromkeys(shard_categories))
+        return list(categories)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def _shard_index(self, sku: str) -> int:
+        return zlib.crc32(sku.encode("utf-8")) % len(self._shards)
+
+    def _fan_out(self, method: str, *args: Any) -> list:
+        return list(self._executor.map(methodcaller(method, *args), self._shards))
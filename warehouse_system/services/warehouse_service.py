@@ -1,13 +1,43 @@
-from typing import List, Optional, Dict
+from enum import Enum
+from itertools import count
+from datetime import date
+from typing import List, Optional, Dict, Iterable, Iterator, Tuple
 from interfaces.warehouse_interface import IWarehouse
 from interfaces.product_interface import IProduct
+from services.search_index import SearchIndex
+from services.sku_index import SkuIndex
+from services.quantity_index import QuantityIndex
+from services.inventory_totals import InventoryTotals
+from services.expiration_index import ExpirationIndex
+from services.attribute_index import AttributeIndexes
+from services.product_query import Condition
+from services.change_stream import ChangeStream, ChangeType
+
+
+class CasResult(Enum):
+    OK = "Виконано"
+    CONFLICT = "Конфлікт версій"
+    REJECTED = "Відхилено"
 
 
 class Warehouse(IWarehouse):
-    def __init__(self, name: str, location: str):
+    def __init__(self, name: str, location: str, debug: bool = False):
         self._name = name
         self._location = location
+        self._debug = debug
         self._products: Dict[str, IProduct] = {}
+        self._search_index = SearchIndex()
+        self._sku_index = SkuIndex()
+        self._categories: Dict[str, Dict[str, IProduct]] = {}
+        self._quantity_index = QuantityIndex()
+        self._totals = InventoryTotals()
+        self._expiration_index = ExpirationIndex()
+        self._attribute_indexes = AttributeIndexes(self._products.values)
+        self._reservations: Dict[str, Tuple[List[Tuple[IProduct, int]], List[IProduct],
+                                            Dict[str, List[Tuple[date, int]]]]] = {}
+        self._reservation_ids = count(1)
+        self._changes = ChangeStream()
+        self._versions: Dict[str, int] = {}
 
     def get_name(self) -> str:
         return self._name
@@ -15,18 +45,23 @@ class Warehouse(IWarehouse):
     def get_location(self) -> str:
         return self._location
 
+    def get_change_stream(self) -> ChangeStream:
+        return self._changes
+
     def add_product(self, product: IProduct) -> bool:
         sku = product.get_sku()
         if sku in self._products:
             existing = self._products[sku]
-            existing.set_quantity(existing.get_quantity() + product.get_quantity())
+            old_quantity = existing.get_quantity()
+            self._merge_stock(existing, product)
+            self._quantity_changed(existing, old_quantity)
             return True
-        self._products[sku] = product
+        self._insert_product(product)
         return True
 
     def remove_product(self, sku: str) -> bool:
         if sku in self._products:
-            del self._products[sku]
+            self._delete_product(sku)
             return True
         return False
 
@@ -34,67 +69,323 @@ class Warehouse(IWarehouse):
         if sku not in self._products:
             return False
         product = self._products[sku]
-        if product.get_quantity() < quantity:
+        old_quantity = product.get_quantity()
+        if old_quantity < quantity:
             return False
-        product.set_quantity(product.get_quantity() - quantity)
+        product.set_quantity(old_quantity - quantity)
+        self._quantity_changed(product, old_quantity)
         if product.get_quantity() == 0:
-            del self._products[sku]
+            self._delete_product(sku)
         return True
 
     def receive_product(self, sku: str, quantity: int) -> bool:
         if sku not in self._products:
             return False
         product = self._products[sku]
-        product.set_quantity(product.get_quantity() + quantity)
+        old_quantity = product.get_quantity()
+        product.set_quantity(old_quantity + quantity)
+        self._quantity_changed(product, old_quantity)
+        return True
+
+    def add_many(self, products: Iterable[IProduct]) -> bytearray:
+        results = bytearray()
+        added: Dict[str, IProduct] = {}
+        changes: Dict[str, Tuple[IProduct, int]] = {}
+        for product in products:
+            sku = product.get_sku()
+            if sku in self._products:
+                existing = self._products[sku]
+                if sku not in changes:
+                    changes[sku] = (existing, existing.get_quantity())
+                self._merge_stock(existing, product)
+            elif sku in added:
+                self._merge_stock(added[sku], product)
+            else:
+                added[sku] = product
+            results.append(1)
+        if changes:
+            self._quantities_changed(list(changes.values()))
+        if added:
+            self._insert_products(list(added.values()))
+        return results
+
+    def issue_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        results = bytearray()
+        pending: Dict[str, int] = {}
+        for sku, quantity in items:
+            product = self._products.get(sku)
+            available = pending.get(sku, product.get_quantity()) if product is not None else 0
+            if product is None or quantity <= 0 or available < quantity or \
+                    (sku in pending and available == 0):
+                results.append(0)
+                continue
+            pending[sku] = available - quantity
+            results.append(1)
+        self._apply_quantities(pending)
+        for sku, quantity in pending.items():
+            if quantity == 0:
+                self._delete_product(sku)
+        return results
+
+    def receive_many(self, items: Iterable[Tuple[str, int]]) -> bytearray:
+        results = bytearray()
+        pending: Dict[str, int] = {}
+        for sku, quantity in items:
+            product = self._products.get(sku)
+            if product is None or quantity <= 0:
+                results.append(0)
+                continue
+            pending[sku] = pending.get(sku, product.get_quantity()) + quantity
+            results.append(1)
+        self._apply_quantities(pending)
+        return results
+
+    def reserve_many(self, items: Iterable[Tuple[str, int]]) -> Optional[str]:
+        get_product = self._products.get
+        reserved: List[Tuple[IProduct, int]] = []
+        pending: Dict[str, int] = {}
+        for sku, quantity in items:
+            product = get_product(sku)
+            available = pending.get(sku, product.get_quantity()) if product is not None else 0
+            if product is None or quantity <= 0 or available < quantity:
+                return None
+            pending[sku] = available - quantity
+            reserved.append((product, quantity))
+        changes: List[Tuple[IProduct, int]] = []
+        lots: Dict[str, List[Tuple[date, int]]] = {}
+        for sku, quantity in pending.items():
+            product = self._products[sku]
+            old_quantity = product.get_quantity()
+            changes.append((product, old_quantity))
+            if hasattr(product, 'take_lots'):
+                lots[sku] = product.take_lots(old_quantity - quantity)
+            else:
+                product.set_quantity(quantity)
+        self._quantities_changed(changes)
+        emptied = [self._products[sku] for sku, quantity in pending.items() if quantity == 0]
+        reservation_id = f"RES-{next(self._reservation_ids)}"
+        self._reservations[reservation_id] = (reserved, emptied, lots)
+        return reservation_id
+
+    def commit(self, reservation_id: str) -> bool:
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is None:
+            return False
+        for product in reservation[1]:
+            sku = product.get_sku()
+            if product.get_quantity() == 0 and self._products.get(sku) is product:
+                self._delete_product(sku)
         return True
 
+    def release(self, reservation_id: str) -> bool:
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is None:
+            return False
+        self._restore(reservation[0], reservation[2])
+        return True
+
+    def get_reserved_items(self, reservation_id: str) -> List[Tuple[str, int]]:
+        reserved = self._reservations.get(reservation_id, ([], []))[0]
+        return [(product.get_sku(), quantity) for product, quantity in reserved]
+
+    def get_reserved_products(self, reservation_id: str) -> Dict[str, IProduct]:
+        reserved = self._reservations.get(reservation_id, ([], []))[0]
+        return {product.get_sku(): product for product, _ in reserved}
+
     def get_product(self, sku: str) -> Optional[IProduct]:
         return self._products.get(sku)
 
     def get_all_products(self) -> List[IProduct]:
         return list(self._products.values())
 
+    def iter_products(self) -> Iterator[IProduct]:
+        return iter(self._products.values())
+
     def inventory_check(self) -> dict:
-        result = {
+        return {
             "назва_складу": self._name,
             "локація": self._location,
-            "загальна_кількість_товарів": len(self._products),
-            "загальна_кількість_одиниць": sum(p.get_quantity() for p in self._products.values()),
-            "загальна_вартість": self.get_total_value(),
-            "категорії": {}
+            "загальна_кількість_товарів": self._totals.get_count(),
+            "загальна_кількість_одиниць": self._totals.get_units(),
+            "загальна_вартість": self._totals.get_value(),
+            "категорії": self._totals.get_categories()
         }
-        for product in self._products.values():
-            category = product.get_category()
-            if category not in result["категорії"]:
-                result["категорії"][category] = {"кількість_товарів": 0, "кількість_одиниць": 0, "вартість": 0}
-            result["категорії"][category]["кількість_товарів"] += 1
-            result["категорії"][category]["кількість_одиниць"] += product.get_quantity()
-            result["категорії"][category]["вартість"] += product.get_price() * product.get_quantity()
-        return result
 
     def get_total_value(self) -> float:
-        return sum(p.get_price() * p.get_quantity() for p in self._products.values())
+        return self._totals.get_value()
+
+    def get_total_units(self) -> int:
+        return self._totals.get_units()
+
+    def verify_totals(self) -> bool:
+        return self._totals.matches(self._products.values())
 
     def search_products(self, keyword: str) -> List[IProduct]:
-        keyword_lower = keyword.lower()
-        return [p for p in self._products.values() 
-                if keyword_lower in p.get_name().lower() or 
-                   keyword_lower in p.get_description().lower()]
+        return [self._products[sku] for sku in self._search_index.search(keyword)]
+
+    def fuzzy_search_products(self, query: str, limit: int = 10) -> List[IProduct]:
+        return [self._products[sku] for sku, _ in self._search_index.fuzzy_search(query, limit)]
+
+    def get_products_by_sku_prefix(self, prefix: str, limit: Optional[int] = None) -> List[IProduct]:
+        return [self._products[sku] for sku in self._sku_index.prefix(prefix, limit)]
+
+    def get_expiring_products(self, until: date, since: Optional[date] = None) -> List[IProduct]:
+        return self._expiration_index.range(since, until)
+
+    def find_products(self, condition: Condition) -> List[IProduct]:
+        return list(self._attribute_indexes.select(condition).values())
 
     def get_products_by_category(self, category: str) -> List[IProduct]:
-        return [p for p in self._products.values() if p.get_category() == category]
+        return list(self._categories.get(category, {}).values())
 
     def get_low_stock_products(self, threshold: int = 10) -> List[IProduct]:
-        return [p for p in self._products.values() if p.get_quantity() < threshold]
+        return self._quantity_index.below(threshold)
+
+    def get_products_by_quantity(self, min_quantity: Optional[int] = None,
+                                 max_quantity: Optional[int] = None) -> List[IProduct]:
+        return self._quantity_index.range(min_quantity, None if max_quantity is None else max_quantity + 1)
 
     def get_categories(self) -> List[str]:
-        return list(set(p.get_category() for p in self._products.values()))
+        return list(self._categories)
 
     def get_product_count(self) -> int:
         return len(self._products)
 
     def update_product_quantity(self, sku: str, quantity: int) -> bool:
         if sku in self._products:
-            self._products[sku].set_quantity(quantity)
+            product = self._products[sku]
+            old_quantity = product.get_quantity()
+            product.set_quantity(quantity)
+            self._quantity_changed(product, old_quantity)
             return True
         return False
+
+    def get_product_version(self, sku: str) -> Optional[int]:
+        return self._versions.get(sku)
+
+    def update_product_price(self, sku: str, price: float) -> bool:
+        product = self._products.get(sku)
+        if product is None or price < 0 or not hasattr(product, 'set_price'):
+            return False
+        old_price = product.get_price()
+        product.set_price(price)
+        self._price_changed(product, old_price)
+        return True
+
+    def _restore(self, reserved: List[Tuple[IProduct, int]], lots: Dict[str, List[Tuple[date, int]]]) -> None:
+        changes: Dict[str, Tuple[IProduct, int]] = {}
+        for product, quantity in reserved:
+            sku = product.get_sku()
+            if self._products.get(sku) is product:
+                if sku not in changes:
+                    changes[sku] = (product, product.get_quantity())
+                    for expiration_date, lot_quantity in lots.get(sku, ()):
+                        product.add_lot(lot_quantity, expiration_date)
+                if sku not in lots:
+                    product.set_quantity(product.get_quantity() + quantity)
+        self._quantities_changed(list(changes.values()))
+
+    def _apply_quantities(self, quantities: Dict[str, int]) -> None:
+        changes: List[Tuple[IProduct, int]] = []
+        for sku, quantity in quantities.items():
+            product = self._products[sku]
+            changes.append((product, product.get_quantity()))
+            product.set_quantity(quantity)
+        if changes:
+            self._quantities_changed(changes)
+
+    def _merge_stock(self, existing: IProduct, product: IProduct) -> None:
+        if hasattr(existing, 'add_lot') and hasattr(product, 'get_lots'):
+            for expiration_date, quantity in product.get_lots():
+                existing.add_lot(quantity, expiration_date)
+        else:
+            existing.set_quantity(existing.get_quantity() + product.get_quantity())
+
+    def _insert_products(self, products: List[IProduct]) -> None:
+        for product in products:
+            sku = product.get_sku()
+            self._products[sku] = product
+            self._search_index.add(sku, product.get_name(), product.get_description())
+            self._categories.setdefault(product.get_category(), {})[sku] = product
+            self._expiration_index.add(product)
+        self._sku_index.add_many(product.get_sku() for product in products)
+        self._quantity_index.add_many(products)
+        self._attribute_indexes.add_many(products)
+        self._totals.add_many(products)
+        self._check_totals()
+        self._changes.publish_added(products)
+        self._versions.update(dict.fromkeys((product.get_sku() for product in products), self._changes.get_version()))
+
+    def _insert_product(self, product: IProduct) -> None:
+        self._products[product.get_sku()] = product
+        self._index_product(product)
+
+    def _delete_product(self, sku: str) -> None:
+        self._unindex_product(self._products.pop(sku))
+
+    def _index_product(self, product: IProduct) -> None:
+        self._search_index.add(product.get_sku(), product.get_name(), product.get_description())
+        self._categories.setdefault(product.get_category(), {})[product.get_sku()] = product
+        self._sku_index.add(product.get_sku())
+        self._expiration_index.add(product)
+        self._quantity_index.add(product)
+        self._attribute_indexes.add(product)
+        self._totals.add(product)
+        self._check_totals()
+        self._changes.publish(ChangeType.ADDED, product, None, product.get_quantity())
+        self._versions[product.get_sku()] = self._changes.get_version()
+
+    def _unindex_product(self, product: IProduct) -> None:
+        self._search_index.remove(product.get_sku())
+        self._sku_index.remove(product.get_sku())
+        self._expiration_index.remove(product)
+        category = product.get_category()
+        members = self._categories[category]
+        del members[product.get_sku()]
+        if not members:
+            del self._categories[category]
+        self._quantity_index.remove(product)
+        self._attribute_indexes.remove(product)
+        self._totals.remove(product)
+        self._check_totals()
+        self._changes.publish(ChangeType.REMOVED, product, product.get_quantity(), None)
+        del self._versions[product.get_sku()]
+
+    def _quantity_changed(self, product: IProduct, old_quantity: int) -> None:
+        self._quantity_index.move(product, old_quantity)
+        self._attribute_indexes.move(product, "quantity", old_quantity)
+        self._expiration_changed(product)
+        self._totals.change_quantity(product, old_quantity)
+        self._check_totals()
+        if product.get_quantity() != old_quantity:
+            self._changes.publish(ChangeType.QUANTITY_CHANGED, product, old_quantity, product.get_quantity())
+            self._versions[product.get_sku()] = self._changes.get_version()
+
+    def _quantities_changed(self, changes: List[Tuple[IProduct, int]]) -> None:
+        self._quantity_index.move_many(changes)
+        for product, old_quantity in changes:
+            self._attribute_indexes.move(product, "quantity", old_quantity)
+            self._expiration_changed(product)
+        self._totals.change_many(changes)
+        self._check_totals()
+        self._changes.publish_quantities(changes)
+        version = self._changes.get_version()
+        for product, _ in changes:
+            self._versions[product.get_sku()] = version
+
+    def _price_changed(self, product: IProduct, old_price: float) -> None:
+        self._attribute_indexes.move(product, "price", old_price)
+        self._totals.change_price(product, old_price)
+        self._check_totals()
+        if product.get_price() != old_price:
+            self._changes.publish(ChangeType.PRICE_CHANGED, product, old_price, product.get_price())
+            self._versions[product.get_sku()] = self._changes.get_version()
+
+    def _expiration_changed(self, product: IProduct) -> None:
+        old_date = self._expiration_index.update(product)
+        if old_date is not None:
+            self._attribute_indexes.move(product, "expiration_date", old_date)
+
+    def _check_totals(self) -> None:
+        if self._debug and not self.verify_totals():
+            raise AssertionError(f"Агрегати складу '{self._name}' розійшлися з перерахунком")
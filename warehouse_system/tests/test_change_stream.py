@@ -0,0 +1,23 @@
+from models.base_product import BaseProduct
+from services.change_stream import ChangeStream, ChangeType
+
+
+def test_failing_subscribers_are_counted_and_do_not_stop_delivery():
+    stream = ChangeStream()
+    delivered = []
+
+    def failing(event) -> None:
+        raise ValueError(f"збій {event.get_version()}")
+
+    stream.subscribe(failing)
+    stream.subscribe(delivered.append)
+    queued = stream.subscribe_queued(failing)
+    product = BaseProduct("S1", "лампа", 10.0, 5, "Інше", "-")
+    stream.publish(ChangeType.ADDED, product, None, 5)
+    stream.publish(ChangeType.QUANTITY_CHANGED, product, 5, 3)
+    assert [event.get_version() for event in delivered] == [1, 2]
+    assert stream.get_errors() == 2
+    assert str(stream.get_last_error()) == "збій 2"
+    assert queued.wait_for(2, timeout=2)
+    assert queued.get_errors() == 2
+    stream.unsubscribe_queued(queued)
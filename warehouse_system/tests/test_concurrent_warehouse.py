@@ -0,0 +1,70 @@
+import random
+import sys
+import threading
+from models.base_product import BaseProduct
+from services.concurrent_warehouse import ConcurrentWarehouse
+
+THREADS = 8
+OPERATIONS = 3000
+SKUS = [f"S{i:02d}" for i in range(10)]
+STOCK = 10_000
+
+
+def test_concurrent_issue_and_receive_keep_exact_quantities():
+    warehouse = ConcurrentWarehouse("Склад", "-", stripes=4)
+    for sku in SKUS:
+        warehouse.add_product(BaseProduct(sku, f"товар {sku}", 2.5, STOCK, "Інше", "-"))
+    deltas = [{sku: 0 for sku in SKUS} for _ in range(THREADS)]
+    published = {sku: 0 for sku in SKUS}
+
+    def on_change(event) -> None:
+        published[event.get_sku()] += event.get_after() - event.get_before()
+        warehouse.get_total_value()
+
+    warehouse.get_change_stream().subscribe(on_change)
+
+    def work(index: int) -> None:
+        rng = random.Random(index)
+        for _ in range(OPERATIONS):
+            sku = rng.choice(SKUS)
+            quantity = rng.randrange(1, 8)
+            if rng.random() < 0.5:
+                if warehouse.issue_product(sku, quantity):
+                    deltas[index][sku] -= quantity
+            elif warehouse.receive_product(sku, quantity):
+                deltas[index][sku] += quantity
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    expected = {sku: STOCK + sum(delta[sku] for delta in deltas) for sku in SKUS}
+    assert {sku: warehouse.get_product(sku).get_quantity() for sku in SKUS} == expected
+    assert published == {sku: expected[sku] - STOCK for sku in SKUS}
+    report = warehouse.inventory_check()
+    assert report["загальна_кількість_одиниць"] == sum(expected.values())
+    assert abs(report["загальна_вартість"] - 2.5 * sum(expected.values())) < 1e-6
+    assert warehouse.verify_totals()
+
+
+def test_subscribers_run_after_index_lock_is_released():
+    warehouse = ConcurrentWarehouse("Склад", "-")
+    blocked = []
+
+    def on_change(event) -> None:
+        probe = threading.Thread(target=warehouse.get_low_stock_products)
+        probe.start()
+        probe.join(timeout=2)
+        blocked.append(probe.is_alive())
+
+    warehouse.get_change_stream().subscribe(on_change)
+    warehouse.add_product(BaseProduct("S1", "лампа", 10.0, 5, "Інше", "-"))
+    warehouse.issue_product("S1", 2)
+    assert blocked == [False, False]
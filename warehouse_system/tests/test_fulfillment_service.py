@@ -0,0 +1,90 @@
+import pytest
+from models.base_product import BaseProduct
+from services.fulfillment_service import FulfillmentEngine, FifoPolicy, PriorityPolicy, FillRatePolicy
+from services.order_service import Order, OrderStatus
+from services.warehouse_service import Warehouse
+
+
+class ContestedWarehouse(Warehouse):
+    def __init__(self, conflicts: int):
+        super().__init__("Склад", "-")
+        self.conflicts = conflicts
+        self.attempts = 0
+
+    def reserve_many(self, items):
+        self.attempts += 1
+        if self.attempts <= self.conflicts:
+            super().issue_product("S1", 1)
+            return None
+        return super().reserve_many(items)
+
+
+def stocked(warehouse: Warehouse, quantity: int = 6) -> Warehouse:
+    warehouse.add_product(BaseProduct("S1", "лампа", 10.0, quantity, "Інше", "-"))
+    warehouse.add_product(BaseProduct("S2", "кава", 2.0, 100, "Інше", "-"))
+    return warehouse
+
+
+def order(order_id: str, quantity: int, priority: int = 0) -> Order:
+    result = Order(order_id, priority)
+    result.add_item("S1", quantity)
+    result.add_item("S2", 1)
+    return result
+
+
+def granted(result) -> dict:
+    return {a.get_order().get_order_id(): a.get_allocated().get("S1", 0) for a in result.get_allocations()}
+
+
+@pytest.mark.parametrize("policy, expected", [
+    (FifoPolicy(), {"A": 5, "B": 1, "C": 0}),
+    (PriorityPolicy(), {"A": 0, "B": 2, "C": 4}),
+    (FillRatePolicy(), {"A": 0, "B": 3, "C": 3}),
+])
+def test_policies_decide_who_gets_scarce_stock(policy, expected):
+    warehouse = stocked(Warehouse("Склад", "-"))
+    orders = [order("A", 5), order("B", 3, priority=1), order("C", 4, priority=5)]
+    result = FulfillmentEngine(warehouse, policy).run(orders)
+    assert granted(result) == expected
+    assert warehouse.get_product("S1") is None
+    assert result.get_fill_rate() == pytest.approx((6 + 3) / (12 + 3))
+
+
+def test_partial_allocation_splits_shortfall_into_backorder():
+    warehouse = stocked(Warehouse("Склад", "-"))
+    first, second = order("A", 4), order("B", 5)
+    result = FulfillmentEngine(warehouse).run([first, second])
+    backorder = result.get_allocations()[1].get_backorder()
+    assert result.get_backorders() == [backorder]
+    assert backorder.get_order_id() == "B-B" and dict(backorder.get_items()) == {"S1": 3}
+    assert dict(second.get_items()) == {"S1": 2, "S2": 1}
+    assert second.get_status() == OrderStatus.PROCESSING
+    assert second.get_total_amount() == pytest.approx(2 * 10.0 + 2.0)
+    assert result.get_total_amount() == pytest.approx(4 * 10.0 + 2.0 + 2 * 10.0 + 2.0)
+
+
+def test_all_or_nothing_leaves_short_orders_untouched():
+    warehouse = stocked(Warehouse("Склад", "-"))
+    result = FulfillmentEngine(warehouse, allow_partial=False).run([order("A", 4), order("B", 5)])
+    assert granted(result) == {"A": 4, "B": 0}
+    assert result.get_order_fill_rate() == 0.5
+    assert warehouse.get_product("S1").get_quantity() == 2
+
+
+def test_conflicting_attempts_are_retried_against_fresh_stock():
+    warehouse = stocked(ContestedWarehouse(conflicts=1))
+    result = FulfillmentEngine(warehouse, attempts=3).run([order("A", 6)])
+    assert warehouse.attempts == 2
+    assert granted(result) == {"A": 5}
+    assert dict(result.get_backorders()[0].get_items()) == {"S1": 1}
+
+
+def test_exhausted_attempts_backorder_everything_without_touching_stock():
+    warehouse = stocked(ContestedWarehouse(conflicts=3), quantity=10)
+    pending = order("A", 2)
+    result = FulfillmentEngine(warehouse, attempts=3).run([pending])
+    assert warehouse.attempts == 3
+    assert result.get_backorders() == [pending]
+    assert result.get_fill_rate() == 0.0 and result.get_total_amount() == 0.0
+    assert pending.get_status() == OrderStatus.PENDING
+    assert warehouse.get_product("S1").get_quantity() == 7
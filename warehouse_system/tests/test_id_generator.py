@@ -0,0 +1,49 @@
+import os
+import multiprocessing
+import pytest
+from utils.id_generator import IdGenerator
+
+
+GENERATORS = []
+
+
+def generate(count: int) -> tuple:
+    return (os.getpid(), GENERATORS[0].get_node()), [GENERATORS[0].next_id() for _ in range(count)]
+
+
+def test_generators_on_one_host_claim_distinct_nodes(tmp_path):
+    with IdGenerator(registry=str(tmp_path)) as first, IdGenerator(registry=str(tmp_path)) as second:
+        assert first.get_node() != second.get_node()
+        ids = [first.next_id() for _ in range(5000)] + [second.next_id() for _ in range(5000)]
+    assert len(set(ids)) == len(ids)
+
+
+def test_released_node_is_reused_without_duplicate_ids(tmp_path):
+    with IdGenerator(registry=str(tmp_path)) as first:
+        node = first.get_node()
+        ids = first.next_ids(10000)
+    with IdGenerator(registry=str(tmp_path)) as second:
+        assert second.get_node() == node
+        ids += second.next_ids(10000)
+    assert len(set(ids)) == len(ids)
+    first.release()
+
+
+def test_explicit_node_is_used_and_checked(tmp_path):
+    assert IdGenerator(7, str(tmp_path)).get_node() == 7
+    assert not os.listdir(str(tmp_path))
+    with pytest.raises(ValueError):
+        IdGenerator(IdGenerator.MAX_NODE + 1)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="потрібен fork")
+def test_forked_children_get_their_own_nodes(tmp_path):
+    GENERATORS[:] = [IdGenerator(registry=str(tmp_path))]
+    parent_ids = [GENERATORS[0].next_id() for _ in range(20000)]
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        chunks = pool.map(generate, [20000] * 4)
+    nodes = dict([(os.getpid(), GENERATORS[0].get_node())] + [owner for owner, _ in chunks])
+    ids = parent_ids + [identifier for _, chunk in chunks for identifier in chunk]
+    assert len(set(ids)) == len(ids)
+    assert len(set(nodes.values())) == len(nodes) > 1
+    GENERATORS.pop().release()
@@ -0,0 +1,59 @@
+import asyncio
+from models.base_product import BaseProduct
+from services.columnar_warehouse import ColumnarWarehouse
+from services.history_service import HistoryService
+from services.intake_pipeline import IntakePipeline
+from services.order_repository import OrderRepository
+from services.order_service import Order, OrderStatus
+from services.pricing_service import PricingService
+from services.warehouse_service import Warehouse
+
+
+def submit(warehouse, repository, orders, history=None):
+    history = history or HistoryService()
+    history.clear_history()
+    pipeline = IntakePipeline(warehouse, PricingService(), history, repository)
+
+    async def run():
+        await pipeline.start()
+        tickets = [await pipeline.submit(order) for order in orders]
+        await asyncio.gather(*(ticket.wait() for ticket in tickets))
+        await pipeline.close()
+        return tickets
+
+    return asyncio.run(run()), history
+
+
+def order_of(order_id: str, quantity: int) -> Order:
+    order = Order(order_id)
+    order.add_item("P1", quantity)
+    return order
+
+
+def test_failed_record_keeps_stock_and_leaves_no_trace(monkeypatch):
+    warehouse = Warehouse("Склад", "-")
+    warehouse.add_product(BaseProduct("P1", "Товар", 10.0, 5, "Інше", "-"))
+    repository = OrderRepository()
+    history = HistoryService()
+
+    def fail(*args, **kwargs):
+        raise IOError("диск заповнено")
+
+    monkeypatch.setattr(history, "add_record", fail)
+    order = order_of("A1", 5)
+    (ticket,), history = submit(warehouse, repository, [order], history)
+    assert not ticket.is_accepted() and "диск заповнено" in ticket.get_reason()
+    assert warehouse.get_product("P1").get_quantity() == 5
+    assert repository.get_count() == 0 and history.get_records_count() == 0
+    assert order.get_status() == OrderStatus.PENDING
+
+
+def test_pipeline_works_without_reservation_api():
+    warehouse = ColumnarWarehouse("Склад", "-")
+    warehouse.add_product(BaseProduct("P1", "Товар", 10.0, 5, "Інше", "-"))
+    repository = OrderRepository()
+    tickets, history = submit(warehouse, repository, [order_of("A1", 3), order_of("A2", 3)])
+    assert [ticket.is_accepted() for ticket in tickets] == [True, False]
+    assert warehouse.get_product("P1").get_quantity() == 2
+    assert repository.get_count() == history.get_records_count() == 1
+    assert tickets[0].get_order().get_total_amount() > 0
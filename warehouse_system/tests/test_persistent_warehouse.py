@@ -0,0 +1,80 @@
+import os
+import sys
+import subprocess
+from datetime import date
+from models.food_product import FoodProduct
+from services.persistent_warehouse import PersistentWarehouse
+from services.wal_service import WriteAheadLog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CRASHING_WRITER = """
+import os, sys
+from datetime import date
+from models.food_product import FoodProduct
+from services.persistent_warehouse import PersistentWarehouse
+warehouse = PersistentWarehouse("Склад", "-", sys.argv[1], snapshot_every=5, sync_interval=60)
+for i in range(12):
+    warehouse.add_product(FoodProduct(f"F{i}", "Сир", 10.0, 10, "-", date(2030, 1, 1), 1.0))
+warehouse.issue_product("F11", 4)
+os._exit(0)
+"""
+
+
+def food(sku: str, quantity: int) -> FoodProduct:
+    return FoodProduct(sku, "Сир", 10.0, quantity, "-", date(2030, 1, 1), 1.0)
+
+
+def test_acknowledged_records_survive_process_crash(tmp_path):
+    subprocess.run([sys.executable, "-c", CRASHING_WRITER, str(tmp_path)], cwd=ROOT, check=True)
+    recovered = PersistentWarehouse("Склад", "-", str(tmp_path), snapshot_every=5)
+    stats = recovered.get_recovery_stats()
+    recovered.close()
+    assert recovered.get_product_count() == 12
+    assert recovered.get_product("F11").get_quantity() == 6
+    assert stats["replayed"] > 0
+
+
+def test_quiet_log_is_synced_by_timer(tmp_path):
+    warehouse = PersistentWarehouse("Склад", "-", str(tmp_path), group_size=1000, sync_interval=0.01)
+    warehouse.add_product(food("F1", 5))
+    warehouse._wal._closed.wait(0.2)
+    assert warehouse._wal._pending == 0
+    warehouse.close()
+
+
+def test_torn_tail_is_truncated_before_new_records(tmp_path):
+    warehouse = PersistentWarehouse("Склад", "-", str(tmp_path))
+    warehouse.add_product(food("F1", 5))
+    warehouse.close()
+    _, segment = WriteAheadLog.list_segments(str(tmp_path))[-1]
+    with open(os.path.join(str(tmp_path), segment), "a", encoding="utf-8") as f:
+        f.write('[2,"issue","F1"')
+
+    warehouse = PersistentWarehouse("Склад", "-", str(tmp_path))
+    assert warehouse.get_recovery_stats()["repaired_segments"] == 1
+    warehouse.receive_product("F1", 3)
+    warehouse.close()
+
+    recovered = PersistentWarehouse("Склад", "-", str(tmp_path))
+    recovered.close()
+    assert recovered.get_product("F1").get_quantity() == 8
+    assert recovered.get_recovery_stats()["repaired_segments"] == 0
+
+
+def test_background_snapshots_compact_the_log(tmp_path):
+    warehouse = PersistentWarehouse("Склад", "-", str(tmp_path), snapshot_every=20)
+    for i in range(30):
+        warehouse.add_product(food(f"F{i}", 10))
+    for i in range(30):
+        warehouse.issue_product(f"F{i}", 3)
+        reservation_id = warehouse.reserve_many([(f"F{i}", 2)])
+        (warehouse.commit if i % 2 else warehouse.release)(reservation_id)
+    expected = {p.get_sku(): p.get_quantity() for p in warehouse.get_all_products()}
+    warehouse.close()
+
+    recovered = PersistentWarehouse("Склад", "-", str(tmp_path), snapshot_every=20)
+    recovered.close()
+    stats = recovered.get_recovery_stats()
+    assert stats["snapshot_lsn"] > 0 and stats["replayed"] < 120
+    assert {p.get_sku(): p.get_quantity() for p in recovered.get_all_products()} == expected
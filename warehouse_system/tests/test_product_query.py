@@ -0,0 +1,37 @@
+from datetime import date, timedelta
+import models.food_product
+from models.food_product import FoodProduct
+from models.household_product import HouseholdProduct
+from services.product_query import Eq, Range
+from services.warehouse_service import Warehouse
+
+
+def food(sku: str, expiration_date: date, organic: bool) -> FoodProduct:
+    return FoodProduct(sku, "Сир", 10.0, 5, "-", expiration_date, 1.0, organic)
+
+
+def test_attribute_resolves_get_and_is_getters():
+    warehouse = Warehouse("Склад", "-")
+    warehouse.add_product(food("F1", date(2030, 1, 1), True))
+    warehouse.add_product(food("F2", date(2030, 1, 1), False))
+    assert [p.get_sku() for p in warehouse.find_products(Eq("organic", True))] == ["F1"]
+    assert [p.get_sku() for p in warehouse.find_products(Eq("is_organic", False))] == ["F2"]
+    assert len(warehouse.find_products(Range("weight", 0.5, 2.0))) == 2
+
+
+class Tomorrow(date):
+    @classmethod
+    def today(cls) -> date:
+        return date.today() + timedelta(days=1)
+
+
+def test_time_dependent_and_unhashable_attributes_are_scanned(monkeypatch):
+    warehouse = Warehouse("Склад", "-")
+    product = food("F1", date.today(), False)
+    warehouse.add_product(product)
+    assert warehouse.find_products(Eq("expired", True)) == []
+    monkeypatch.setattr(models.food_product, "date", Tomorrow)
+    assert warehouse.find_products(Eq("expired", True)) == [product]
+    dimensions = {"width": 1, "height": 2, "depth": 3}
+    warehouse.add_product(HouseholdProduct("H1", "Стіл", 5.0, 1, "-", "Кухня", dimensions, 4.0))
+    assert [p.get_sku() for p in warehouse.find_products(Eq("dimensions", dimensions))] == ["H1"]
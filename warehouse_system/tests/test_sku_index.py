@@ -0,0 +1,27 @@
+import random
+from services.sku_index import SkuIndex
+
+
+def test_blocks_match_sorted_set_under_random_updates():
+    rng = random.Random(3)
+    index = SkuIndex()
+    index.BLOCK_SIZE = 4
+    expected = set()
+    for _ in range(5000):
+        sku = f"S{rng.randrange(400):03d}"
+        if rng.random() < 0.6:
+            index.add(sku)
+            expected.add(sku)
+        else:
+            assert index.remove(sku) == (sku in expected)
+            expected.discard(sku)
+        if rng.random() < 0.01:
+            batch = [f"S{rng.randrange(400):03d}" for _ in range(rng.randrange(1, 80))]
+            index.add_many(batch)
+            expected.update(batch)
+    assert len(index) == len(expected)
+    assert index.prefix("") == sorted(expected)
+    for prefix in ("S0", "S12", "S399", "S4", "T"):
+        matches = sorted(sku for sku in expected if sku.startswith(prefix))
+        assert index.prefix(prefix) == matches
+        assert index.prefix(prefix, 3) == matches[:3]
@@ -0,0 +1,67 @@
+from datetime import date
+from models.food_product import FoodProduct
+from models.electronics_product import ElectronicsProduct
+from services.sqlite_warehouse import SqliteWarehouse
+
+
+def food(quantity: int, expiration_date: date) -> FoodProduct:
+    return FoodProduct("F1", "Сир", 10.0, quantity, "-", expiration_date, 1.0)
+
+
+def two_lots() -> FoodProduct:
+    product = food(5, date(2030, 1, 1))
+    product.add_lot(5, date(2030, 2, 1))
+    return product
+
+
+def test_issue_then_get_consumes_earliest_lot():
+    warehouse = SqliteWarehouse("Склад", "-")
+    warehouse.add_product(two_lots())
+    assert warehouse.issue_product("F1", 7)
+    product = warehouse.get_product("F1")
+    assert product.get_quantity() == 3
+    assert product.get_lots() == [(date(2030, 2, 1), 3)]
+    assert product.get_expiration_date() == date(2030, 2, 1)
+    assert warehouse.inventory_check()["загальна_кількість_одиниць"] == 3
+    assert warehouse.get_expiring_products(date(2030, 1, 31)) == []
+
+
+def test_add_then_get_merges_lots():
+    warehouse = SqliteWarehouse("Склад", "-")
+    warehouse.add_product(two_lots())
+    warehouse.add_product(food(10, date(2029, 12, 1)))
+    product = warehouse.get_product("F1")
+    assert product.get_quantity() == 20
+    assert product.get_lots() == [(date(2029, 12, 1), 10), (date(2030, 1, 1), 5), (date(2030, 2, 1), 5)]
+    assert [p.get_sku() for p in warehouse.get_expiring_products(date(2029, 12, 1))] == ["F1"]
+
+
+def test_receive_and_set_keep_lots_in_step_with_quantity():
+    warehouse = SqliteWarehouse("Склад", "-")
+    warehouse.add_many([two_lots(), ElectronicsProduct("E1", "Тел", 100.0, 3, "-", "Acme", 12, 5.0)])
+    assert warehouse.receive_product("F1", 2) and warehouse.receive_product("E1", 2)
+    assert warehouse.get_product("F1").get_lots() == [(date(2030, 1, 1), 7), (date(2030, 2, 1), 5)]
+    assert warehouse.update_product_quantity("F1", 4)
+    assert warehouse.get_product("F1").get_lots() == [(date(2030, 2, 1), 4)]
+    assert not warehouse.issue_product("F1", 5)
+    assert warehouse.issue_product("F1", 4) and warehouse.get_product("F1") is None
+    assert warehouse.get_product("E1").get_quantity() == 5
+
+
+def test_plain_product_merged_into_food_tops_up_earliest_lot():
+    warehouse = SqliteWarehouse("Склад", "-")
+    warehouse.add_product(two_lots())
+    warehouse.add_many([ElectronicsProduct("E1", "Тел", 100.0, 2, "-", "Acme", 12, 5.0),
+                        ElectronicsProduct("F1", "Сир", 10.0, 4, "-", "Acme", 12, 5.0)])
+    product = warehouse.get_product("F1")
+    assert product.get_quantity() == 14
+    assert product.get_lots() == [(date(2030, 1, 1), 9), (date(2030, 2, 1), 5)]
+    assert warehouse.get_product("E1").get_quantity() == 2
+
+
+def test_zero_quantity_changes_succeed_for_existing_products():
+    warehouse = SqliteWarehouse("Склад", "-")
+    warehouse.add_product(two_lots())
+    assert warehouse.issue_product("F1", 0) and warehouse.receive_product("F1", 0)
+    assert not warehouse.issue_product("X", 0) and not warehouse.receive_product("X", 0)
+    assert warehouse.get_product("F1").get_quantity() == 10
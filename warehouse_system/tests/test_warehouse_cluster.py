@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import pytest
+from models.base_product import BaseProduct
+from models.food_product import FoodProduct
+from services.columnar_warehouse import ColumnarWarehouse
+from services.concurrent_warehouse import ConcurrentWarehouse
+from services.mapped_warehouse import MappedWarehouse
+from services.sqlite_warehouse import SqliteWarehouse
+from services.warehouse_cluster import WarehouseCluster
+from services.warehouse_service import Warehouse
+
+
+def catalog() -> list:
+    products = [BaseProduct(f"B{i}", f"товар {i}", 5.0, 10, "Інше", "-") for i in range(8)]
+    products += [FoodProduct(f"F{i}", f"сир {i}", 3.0, 4, "-", date(2030, 1, 1 + i), 1.0) for i in range(8)]
+    return products
+
+
+def make_cluster() -> WarehouseCluster:
+    cluster = WarehouseCluster("Кластер", "-", [Warehouse(f"Склад {i}", "-") for i in range(3)])
+    for product in catalog():
+        cluster.add_product(product)
+    return cluster
+
+
+def test_reservation_spans_shards_and_commits():
+    cluster = make_cluster()
+    items = [("B0", 4), ("B5", 10), ("F3", 1)]
+    assert len({id(cluster.shard_for(sku)) for sku, _ in items}) > 1
+    reservation_id = cluster.reserve_many(items)
+    assert sorted(cluster.get_reserved_items(reservation_id)) == sorted(items)
+    assert sorted(cluster.get_reserved_products(reservation_id)) == ["B0", "B5", "F3"]
+    assert cluster.get_product("B0").get_quantity() == 6
+    assert cluster.commit(reservation_id)
+    assert cluster.get_product("B5") is None
+    assert not cluster.commit(reservation_id)
+    cluster.close()
+
+
+def test_failed_reservation_releases_other_shards():
+    cluster = make_cluster()
+    assert cluster.reserve_many([("B0", 4), ("B1", 4), ("F2", 5)]) is None
+    assert [cluster.get_product(sku).get_quantity() for sku in ("B0", "B1", "F2")] == [10, 10, 4]
+    reservation_id = cluster.reserve_many([("B0", 4), ("F2", 4)])
+    assert cluster.release(reservation_id)
+    assert cluster.get_product("F2").get_quantity() == 4
+    assert cluster.inventory_check()["загальна_кількість_одиниць"] == 8 * 10 + 8 * 4
+    cluster.close()
+
+
+@pytest.mark.parametrize("backend", ["warehouse", "concurrent", "sqlite", "columnar", "mapped", "cluster"])
+def test_expiring_products_window(backend, tmp_path):
+    source = Warehouse("Склад", "-")
+    source.add_many(catalog())
+    if backend == "warehouse":
+        warehouse = source
+    elif backend == "concurrent":
+        warehouse = ConcurrentWarehouse("Склад", "-")
+        warehouse.add_many(catalog())
+    elif backend == "sqlite":
+        warehouse = SqliteWarehouse("Склад", "-")
+        warehouse.add_many(catalog())
+    elif backend == "columnar":
+        warehouse = ColumnarWarehouse("Склад", "-")
+        for product in catalog():
+            warehouse.add_product(product)
+    elif backend == "mapped":
+        warehouse = MappedWarehouse(MappedWarehouse.build(str(tmp_path / "catalog.whm"), source))
+    else:
+        warehouse = make_cluster()
+    window = warehouse.get_expiring_products(date(2030, 1, 5), since=date(2030, 1, 3))
+    assert [p.get_sku() for p in window] == ["F2", "F3", "F4"]
+    assert len(warehouse.get_expiring_products(date(2030, 1, 5))) == 5
+
+
+def test_process_pool_requires_mapped_shards(tmp_path):
+    source = Warehouse("Склад", "-")
+    source.add_many(catalog())
+    path = MappedWarehouse.build(str(tmp_path / "catalog.whm"), source)
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(TypeError):
+            WarehouseCluster("Кластер", "-", [source], executor)
+        cluster = WarehouseCluster("Кластер", "-", [MappedWarehouse(path)], executor)
+        assert cluster.get_total_value() == pytest.approx(source.get_total_value())
+        assert cluster.get_product_count() == 16
+    assert os.path.exists(path)
@@ -0,0 +1,96 @@
+import random
+from datetime import date, timedelta
+import pytest
+from models.base_product import BaseProduct
+from models.food_product import FoodProduct
+from services.concurrent_warehouse import ConcurrentWarehouse
+from services.warehouse_service import Warehouse
+
+WORDS = ["молоко", "сир", "хліб", "ноутбук", "lenovo", "зимовий", "куртка", "лампа", "кава", "чай"]
+CATEGORIES = ["Інше", "Одяг", "Електроніка"]
+KEYWORDS = ["молоко", "сир", "ноутбук lenovo", "зим", "ла", "кава чай", "неіснуючий"]
+
+
+def make_product(rng: random.Random, sku: str):
+    name = " ".join(rng.sample(WORDS, 2))
+    description = " ".join(rng.sample(WORDS, 3))
+    price = round(rng.uniform(1, 500), 2)
+    quantity = rng.randrange(1, 40)
+    if rng.random() < 0.3:
+        return FoodProduct(sku, name, price, quantity, description,
+                           date(2030, 1, 1) + timedelta(days=rng.randrange(60)), 1.0)
+    return BaseProduct(sku, name, price, quantity, rng.choice(CATEGORIES), description)
+
+
+def mutate(warehouse: Warehouse, rng: random.Random, skus: list) -> None:
+    sku = rng.choice(skus)
+    operation = rng.randrange(9)
+    if operation == 0:
+        warehouse.add_product(make_product(rng, sku))
+    elif operation == 1:
+        warehouse.remove_product(sku)
+    elif operation == 2:
+        warehouse.issue_product(sku, rng.randrange(1, 15))
+    elif operation == 3:
+        warehouse.receive_product(sku, rng.randrange(1, 15))
+    elif operation == 4:
+        warehouse.update_product_quantity(sku, rng.randrange(0, 30))
+    elif operation == 5:
+        warehouse.add_many(make_product(rng, rng.choice(skus)) for _ in range(3))
+    elif operation == 6:
+        warehouse.issue_many((rng.choice(skus), rng.randrange(1, 5)) for _ in range(3))
+    elif operation == 7:
+        warehouse.receive_many((rng.choice(skus), rng.randrange(1, 5)) for _ in range(3))
+    else:
+        reservation_id = warehouse.reserve_many([(sku, rng.randrange(1, 5))])
+        if reservation_id is not None:
+            (warehouse.commit if rng.random() < 0.5 else warehouse.release)(reservation_id)
+
+
+def scan_search(products: list, keyword: str) -> list:
+    keyword_lower = keyword.lower()
+    return [p.get_sku() for p in products
+            if keyword_lower in p.get_name().lower() or keyword_lower in p.get_description().lower()]
+
+
+def assert_matches_scan(warehouse: Warehouse) -> None:
+    products = warehouse.get_all_products()
+    for keyword in KEYWORDS:
+        assert [p.get_sku() for p in warehouse.search_products(keyword)] == scan_search(products, keyword)
+    for category in CATEGORIES + ["Продукти харчування"]:
+        assert sorted(p.get_sku() for p in warehouse.get_products_by_category(category)) == \
+               sorted(p.get_sku() for p in products if p.get_category() == category)
+    low_stock = warehouse.get_low_stock_products(10)
+    assert sorted(p.get_sku() for p in low_stock) == sorted(p.get_sku() for p in products if p.get_quantity() < 10)
+    assert [p.get_quantity() for p in low_stock] == sorted(p.get_quantity() for p in low_stock)
+    assert warehouse.get_total_value() == pytest.approx(sum(p.get_price() * p.get_quantity() for p in products))
+    assert warehouse.get_total_units() == sum(p.get_quantity() for p in products)
+    assert [p.get_sku() for p in warehouse.get_products_by_sku_prefix("S01")] == \
+           sorted(p.get_sku() for p in products if p.get_sku().startswith("S01"))
+    assert set(warehouse.get_categories()) == {p.get_category() for p in products}
+    assert warehouse.verify_totals()
+
+
+@pytest.mark.parametrize("warehouse_class", [Warehouse, ConcurrentWarehouse])
+def test_indexes_match_scan_after_mixed_operations(warehouse_class):
+    rng = random.Random(7)
+    skus = [f"S{i:03d}" for i in range(200)]
+    warehouse = warehouse_class("Склад", "-")
+    warehouse.add_many(make_product(rng, sku) for sku in skus[:150])
+    for step in range(3000):
+        mutate(warehouse, rng, skus)
+        if step % 500 == 0:
+            assert_matches_scan(warehouse)
+    assert_matches_scan(warehouse)
+
+
+def test_version_stamps_follow_every_change():
+    warehouse = ConcurrentWarehouse("Склад", "-")
+    warehouse.add_product(BaseProduct("S1", "лампа", 10.0, 5, "Інше", "-"))
+    versions = [warehouse.get_product_version("S1")]
+    for change in (lambda: warehouse.issue_product("S1", 1), lambda: warehouse.receive_product("S1", 2),
+                   lambda: warehouse.update_product_price("S1", 12.0)):
+        change()
+        versions.append(warehouse.get_product_version("S1"))
+    assert versions == sorted(set(versions))
+    assert warehouse.get_total_value() == pytest.approx(12.0 * 6)
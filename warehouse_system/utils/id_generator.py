@@ -0,0 +1,154 @@
+import os
+import tempfile
+import threading
+import time
+import weakref
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class IdGenerator:
+    EPOCH_MS = 1704067200000
+    NODE_BITS = 10
+    SEQUENCE_BITS = 12
+    TIME_SHIFT = NODE_BITS + SEQUENCE_BITS
+    MAX_NODE = (1 << NODE_BITS) - 1
+    MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+    REGISTRY = os.path.join(tempfile.gettempdir(), "warehouse-id-nodes")
+
+    def __init__(self, node: Optional[int] = None, registry: Optional[str] = None):
+        if node is not None and not 0 <= node <= self.MAX_NODE:
+            raise ValueError(f"Вузол генератора має бути в межах 0..{self.MAX_NODE}")
+        self._fixed_node = node
+        self._registry = registry or self.REGISTRY
+        self._lease: Optional[int] = None
+        self._reset()
+        if hasattr(os, 'register_at_fork'):
+            reference = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: reference() is not None and reference()._reset())
+
+    def __enter__(self) -> "IdGenerator":
+        self.get_node()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._lease is None:
+                return
+            while time.time_ns() // 1_000_000 <= self._last:
+                time.sleep(0.001)
+            if fcntl is not None:
+                fcntl.flock(self._lease, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._lease, msvcrt.LK_UNLCK, 1)
+            os.close(self._lease)
+            self._lease = None
+            self._node = None
+            self._node_bits = None
+
+    def get_node(self) -> int:
+        with self._lock:
+            self._claim()
+            return self._node
+
+    def next_int(self) -> int:
+        with self._lock:
+            self._claim()
+            now = time.time_ns() // 1_000_000
+            if now > self._last:
+                self._last = now
+                self._sequence = 0
+            elif self._sequence < self.MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last += 1
+                self._sequence = 0
+            return (self._last - self.EPOCH_MS) << self.TIME_SHIFT | self._node_bits | self._sequence
+
+    def next_id(self) -> str:
+        return f"{self.next_int():016X}"
+
+    def next_ids(self, count: int) -> List[str]:
+        spans: List[Tuple[int, int, int]] = []
+        with self._lock:
+            self._claim()
+            now = time.time_ns() // 1_000_000
+            if now > self._last:
+                self._last = now
+                self._sequence = -1
+            while count > 0:
+                if self._sequence >= self.MAX_SEQUENCE:
+                    self._last += 1
+                    self._sequence = -1
+                take = min(count, self.MAX_SEQUENCE - self._sequence)
+                base = (self._last - self.EPOCH_MS) << self.TIME_SHIFT | self._node_bits
+                spans.append((base, self._sequence + 1, self._sequence + 1 + take))
+                self._sequence += take
+                count -= take
+        return [f"{base | sequence:016X}" for base, start, stop in spans for sequence in range(start, stop)]
+
+    @classmethod
+    def timestamp_of(cls, identifier: str) -> datetime:
+        return datetime.fromtimestamp(((int(identifier, 16) >> cls.TIME_SHIFT) + cls.EPOCH_MS) / 1000)
+
+    @classmethod
+    def lower_bound(cls, moment: datetime) -> str:
+        offset = max(int(moment.timestamp() * 1000) - cls.EPOCH_MS, 0)
+        return f"{offset << cls.TIME_SHIFT:016X}"
+
+    @classmethod
+    def upper_bound(cls, moment: datetime) -> str:
+        offset = max(int(moment.timestamp() * 1000) - cls.EPOCH_MS + 1, 0)
+        return f"{max((offset << cls.TIME_SHIFT) - 1, 0):016X}"
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        if self._lease is not None:
+            os.close(self._lease)
+            self._lease = None
+        self._node = self._fixed_node
+        self._node_bits = self._node << self.SEQUENCE_BITS if self._node is not None else None
+        self._last = 0
+        self._sequence = 0
+
+    def _claim(self) -> None:
+        if self._node_bits is not None:
+            return
+        os.makedirs(self._registry, exist_ok=True)
+        start = os.getpid() & self.MAX_NODE
+        for offset in range(self.MAX_NODE + 1):
+            node = (start + offset) & self.MAX_NODE
+            descriptor = os.open(os.path.join(self._registry, f"node-{node:04d}.lock"), os.O_RDWR | os.O_CREAT)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(descriptor, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                os.close(descriptor)
+                continue
+            self._lease = descriptor
+            self._node = node
+            self._node_bits = node << self.SEQUENCE_BITS
+            return
+        raise RuntimeError(f"Усі {self.MAX_NODE + 1} вузлів генератора ідентифікаторів зайняті")
+
+
+_shared = IdGenerator()
+
+
+def next_id() -> str:
+    return _shared.next_id()
+
+
+def next_ids(count: int) -> List[str]:
+    return _shared.next_ids(count)
@@ -0,0 +1,36 @@
+from bisect import insort
+from datetime import date
+from typing import List, Optional, Tuple
+
+
+def add_lot(lots: List[list], quantity: int, expiration_date: Optional[date] = None) -> None:
+    if quantity <= 0:
+        return
+    if expiration_date is None:
+        lots[0][1] += quantity
+        return
+    if len(lots) == 1 and lots[0][1] == 0:
+        lots[0][0] = expiration_date
+        lots[0][1] = quantity
+        return
+    for lot in lots:
+        if lot[0] == expiration_date:
+            lot[1] += quantity
+            return
+    insort(lots, [expiration_date, quantity])
+
+
+def take_lots(lots: List[list], quantity: int) -> List[Tuple[date, int]]:
+    taken = []
+    while quantity > 0:
+        lot = lots[0]
+        if lot[1] > quantity or len(lots) == 1:
+            part = min(lot[1], quantity)
+            lot[1] -= part
+            if part:
+                taken.append((lot[0], part))
+            break
+        quantity -= lot[1]
+        taken.append((lot[0], lot[1]))
+        lots.pop(0)
+    return taken
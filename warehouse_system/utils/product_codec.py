@@ -0,0 +1,71 @@
+from datetime import date
+from interfaces.product_interface import IProduct
+from models.base_product import BaseProduct
+from models.food_product import FoodProduct
+from models.electronics_product import ElectronicsProduct
+from models.clothing_product import ClothingProduct
+from models.household_product import HouseholdProduct
+
+
+def product_to_dict(product: IProduct) -> dict:
+    product_data = {
+        "sku": product.get_sku(),
+        "name": product.get_name(),
+        "price": product.get_price(),
+        "quantity": product.get_quantity(),
+        "category": product.get_category(),
+        "description": product.get_description()
+    }
+
+    if hasattr(product, 'get_expiration_date'):
+        product_data["expiration_date"] = str(product.get_expiration_date())
+        product_data["weight"] = product.get_weight()
+        product_data["is_organic"] = product.is_organic()
+        product_data["type"] = "food"
+        lots = product.get_lots() if hasattr(product, 'get_lots') else []
+        if len(lots) > 1:
+            product_data["lots"] = [[str(expiration_date), quantity] for expiration_date, quantity in lots]
+
+    elif hasattr(product, 'get_brand'):
+        product_data["brand"] = product.get_brand()
+        product_data["warranty_months"] = product.get_warranty_months()
+        product_data["power_consumption"] = product.get_power_consumption()
+        product_data["type"] = "electronics"
+
+    elif hasattr(product, 'get_size'):
+        product_data["size"] = product.get_size()
+        product_data["color"] = product.get_color()
+        product_data["material"] = product.get_material()
+        product_data["gender"] = product.get_gender()
+        product_data["type"] = "clothing"
+
+    elif hasattr(product, 'get_room_type'):
+        product_data["room_type"] = product.get_room_type()
+        product_data["dimensions"] = product.get_dimensions()
+        product_data["weight"] = product.get_weight()
+        product_data["type"] = "household"
+
+    return product_data
+
+
+def product_from_dict(data: dict) -> IProduct:
+    product_type = data.get("type")
+    common = (data["sku"], data["name"], data["price"], data["quantity"])
+    if product_type == "food":
+        lots = data.get("lots")
+        product = FoodProduct(data["sku"], data["name"], data["price"], 0 if lots else data["quantity"],
+                              data["description"], date.fromisoformat(data["expiration_date"]),
+                              data["weight"], data["is_organic"])
+        for expiration_date, quantity in lots or ():
+            product.add_lot(quantity, date.fromisoformat(expiration_date))
+        return product
+    if product_type == "electronics":
+        return ElectronicsProduct(*common, data["description"], data["brand"], data["warranty_months"],
+                                  data["power_consumption"])
+    if product_type == "clothing":
+        return ClothingProduct(*common, data["description"], data["size"], data["color"], data["material"],
+                               data["gender"])
+    if product_type == "household":
+        return HouseholdProduct(*common, data["description"], data["room_type"], data["dimensions"],
+                                data["weight"])
+    return BaseProduct(*common, data["category"], data["description"])